@@ -0,0 +1,188 @@
+import logging
+from threading import Lock
+from typing import Optional, Sequence
+
+from django.conf import settings
+
+from library.genetics import DNA, InvalidSequenceError, VerdictCache, dna_key
+from library.genetics.engines import (
+    AUTO_ENGINE,
+    AnalysisEngine,
+    calibrate,
+    get_engine,
+)
+from library.genetics.references import ReferenceSet
+from library.genetics.screener import parse_record, validate_sequences
+
+logger = logging.getLogger(__name__)
+
+_verdict_cache = None
+_verdict_cache_lock = Lock()
+
+_engine = None
+_engine_lock = Lock()
+_batch_engine = None
+_batch_engine_lock = Lock()
+
+
+def get_verdict_cache() -> Optional[VerdictCache]:
+    """
+    Returns the verdict cache shared by the threads of the worker, or None
+    when MUTANT_VERDICT_CACHE_SIZE is not set.
+    """
+    global _verdict_cache
+
+    max_entries = getattr(settings, 'MUTANT_VERDICT_CACHE_SIZE', 0)
+    if not max_entries:
+        return None
+
+    with _verdict_cache_lock:
+        if _verdict_cache is None or \
+                _verdict_cache.max_entries != max_entries:
+            _verdict_cache = VerdictCache(max_entries)
+        return _verdict_cache
+
+
+def load_reference_set() -> ReferenceSet:
+    """
+    Compiles every mutant reference stored in the database into a single
+    reference set.
+    :raise InvalidSequenceError: when a stored reference is not a valid DNA
+    """
+    from app.mutant.models import MutantReference
+
+    references = MutantReference.objects.order_by('pk').values_list(
+        'name',
+        'dna_sequence',
+    )
+
+    def read():
+        for name, dna_sequence in references.iterator():
+            try:
+                sequences = parse_record(dna_sequence, 'json')
+                validate_sequences(sequences)
+            except (ValueError, InvalidSequenceError) as e:
+                raise InvalidSequenceError(
+                    f'Reference {name} is not valid: {e}'
+                )
+            yield name, sequences
+
+    return ReferenceSet.from_sequence_lists(read())
+
+
+def _resolve_engine(name: str, batch_size: int) -> AnalysisEngine:
+    """ Builds the engine, picking the fastest one when name is auto """
+    if name == AUTO_ENGINE:
+        result = calibrate(batch_size)
+        logger.info(
+            'Calibrated genetics engine for batches of %s: %s (%s)',
+            result.batch_size,
+            result.engine,
+            ', '.join(
+                f'{engine}={seconds * 1e6:.1f}us'
+                for engine, seconds in result.timings.items()
+            ),
+        )
+        name = result.engine
+
+    return get_engine(name)
+
+
+def _build_engine() -> AnalysisEngine:
+    return _resolve_engine(
+        getattr(settings, 'GENETICS_ENGINE', AUTO_ENGINE),
+        getattr(settings, 'GENETICS_ENGINE_BATCH_SIZE', 1),
+    )
+
+
+def _build_batch_engine() -> AnalysisEngine:
+    return _resolve_engine(
+        getattr(settings, 'GENETICS_BATCH_ENGINE', AUTO_ENGINE),
+        min(getattr(settings, 'MUTANT_BATCH_MAX_SIZE', 1000), 1000),
+    )
+
+
+def configure_engine() -> AnalysisEngine:
+    """
+    Sets up again the engine analysing single DNAs from GENETICS_ENGINE.
+    With auto, the available engines are benchmarked on batches of
+    GENETICS_ENGINE_BATCH_SIZE DNAs and the fastest one is picked.
+    :return: engine analysing single DNAs
+    """
+    global _engine
+
+    with _engine_lock:
+        _engine = _build_engine()
+        return _engine
+
+
+def configure_batch_engine() -> AnalysisEngine:
+    """
+    Sets up again the engine analysing batches of DNAs from
+    GENETICS_BATCH_ENGINE, benchmarked on batches of MUTANT_BATCH_MAX_SIZE
+    DNAs (up to 1000) when it is auto.
+    :return: engine analysing batches of DNAs
+    """
+    global _batch_engine
+
+    with _batch_engine_lock:
+        _batch_engine = _build_batch_engine()
+        return _batch_engine
+
+
+def is_engine_configured() -> bool:
+    """ Whether the engine analysing single DNAs is already set up """
+    return _engine is not None
+
+
+def get_analysis_engine() -> AnalysisEngine:
+    """
+    Returns the engine analysing single DNAs, set up on the first DNA
+    analysed rather than on startup, as it may benchmark every engine.
+    """
+    global _engine
+
+    engine = _engine
+    if engine is None:
+        with _engine_lock:
+            # Threads that waited for the lock use the engine just set up
+            if _engine is None:
+                _engine = _build_engine()
+            engine = _engine
+    return engine
+
+
+def get_batch_engine() -> AnalysisEngine:
+    """
+    Returns the engine analysing batches of DNAs, set up on the first batch
+    so that only workers checking batches pay for it.
+    """
+    global _batch_engine
+
+    engine = _batch_engine
+    if engine is None:
+        with _batch_engine_lock:
+            if _batch_engine is None:
+                _batch_engine = _build_batch_engine()
+            engine = _batch_engine
+    return engine
+
+
+def analyse_sequences(sequences: Sequence[str]) -> bool:
+    """
+    Checks a DNA through the verdict cache and the engine of the worker.
+    :param sequences: validated sequences of the DNA
+    :return: whether DNA is mutant
+    :raise DNASequenceError: when the sequences are not a valid DNA
+    """
+    cache = get_verdict_cache()
+    if cache is not None:
+        is_mutant = cache.get(dna_key(sequences))
+        if is_mutant is not None:
+            return is_mutant
+
+    is_mutant = get_analysis_engine().is_mutant(DNA.from_strings(sequences))
+
+    if cache is not None:
+        cache.set(dna_key(sequences), is_mutant)
+    return is_mutant
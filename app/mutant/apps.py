@@ -9,4 +9,5 @@ class MutantConfig(AppConfig):
 
     # noinspection PyUnresolvedReferences
     def ready(self):
+        import app.mutant.checks
         import app.mutant.signals
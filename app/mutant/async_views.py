@@ -0,0 +1,141 @@
+"""
+Native async views of /mutant/ and /stats/, served under ASGI (see
+project/asgi_urls.py). DNAs are analysed inline on the event loop, as it
+only takes a few microseconds, while the ORM calls, which Django 3.2 only
+runs synchronously, go to a bounded pool of threads, so thousands of
+connections waiting on the database hold at most ASYNC_DB_THREADS database
+connections per worker.
+"""
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import HttpResponseNotAllowed, JsonResponse
+
+from library.genetics import DNASequenceError
+from .analysis import (
+    analyse_sequences,
+    get_analysis_engine,
+    is_engine_configured,
+)
+from .log_buffer import log_dna
+from .serializers import MutantSerializer
+from .statistics import load_statistics
+from .stats_cache import get_stats_cache
+from .views import set_statistics_validators, statistics_not_modified
+
+_executor = None
+_executor_lock = Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """
+    Returns the pool of threads running the database calls of the worker,
+    sized by ASYNC_DB_THREADS.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.ASYNC_DB_THREADS,
+                thread_name_prefix='async-db',
+            )
+        return _executor
+
+
+def _in_db_thread(func: Callable, *args) -> Any:
+    """ Runs a call in a pool thread, dropping its unusable connections """
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+async def run_in_db_thread(func: Callable, *args) -> Any:
+    """
+    Runs a synchronous call, e.g. an ORM query, in the database pool.
+    :param func: function to be called
+    :param args: arguments of the function
+    :return: result of the function
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_db_executor(),
+        partial(_in_db_thread, func, *args),
+    )
+
+
+def _request_data(request) -> Dict[str, Any]:
+    """ Parses JSON bodies, and form bodies like DRF does """
+    if request.content_type == 'application/json':
+        return json.loads(request.body or b'{}')
+    return {'dna': request.POST.getlist('dna')}
+
+
+async def mutant(request):
+    """ Async counterpart of MutantViewset.create """
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+
+    try:
+        data = _request_data(request)
+    except ValueError as e:
+        return JsonResponse(
+            {'detail': f'JSON parse error - {e}'},
+            status=400
+        )
+
+    serializer = MutantSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400)
+
+    # Setting up the engine may benchmark every engine, which would block
+    # the event loop
+    if not is_engine_configured():
+        await sync_to_async(get_analysis_engine, thread_sensitive=False)()
+
+    sequences = serializer.validated_data['dna']
+    try:
+        is_mutant = analyse_sequences(sequences)
+    except DNASequenceError as e:
+        return JsonResponse({'message': str(e)}, status=400)
+
+    await run_in_db_thread(log_dna, sequences, is_mutant)
+
+    if is_mutant is False:
+        return JsonResponse({'message': 'DNA is not mutant.'}, status=403)
+
+    return JsonResponse({
+        'message': 'DNA is mutant',
+        'content': serializer.validated_data
+    })
+
+
+# csrf_exempt would turn the view into a sync one on Django 3.2
+mutant.csrf_exempt = True
+
+
+async def stats(request):
+    """ Async counterpart of StatisticsViewset.list """
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+
+    # Only a cache miss or a revalidation waits for the database
+    cache = get_stats_cache()
+    entry = cache.get()
+    if entry is None or not cache.is_fresh(entry):
+        entry = await run_in_db_thread(load_statistics)
+
+    not_modified = statistics_not_modified(request, entry)
+    if not_modified is not None:
+        return not_modified
+
+    return set_statistics_validators(JsonResponse(entry.data), entry)
@@ -0,0 +1,111 @@
+"""
+Analysis and persistence of many DNAs at once: DNAs are analysed by the
+batch engine and logged with a single bulk insert, incrementing the
+statistics once per batch instead of once per DNA.
+"""
+import json
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.db import transaction
+
+from app.mutant.analysis import get_batch_engine
+from app.mutant.models import LogRequest
+from app.mutant.similarity import index_dnas
+from app.mutant.statistics import increment_statistics
+from library.genetics import DNA, DNASequenceError
+
+
+class BatchItem(NamedTuple):
+    """ Verdict of a DNA of a batch, or the reason it is not valid """
+    index: int
+    mutant: Optional[bool]
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        if self.error is not None:
+            return {'index': self.index, 'error': self.error}
+        return {'index': self.index, 'mutant': self.mutant}
+
+
+def parse_dna(value: Any) -> DNA:
+    """
+    :param value: DNA sent as a list of 6 sequences
+    :return: DNA instance
+    """
+    if not isinstance(value, list) or \
+            not all(isinstance(seq, str) for seq in value):
+        raise DNASequenceError('DNA must be a list of sequences.')
+    return DNA.from_strings(value)
+
+
+def _inserted_pks(logs: Sequence[LogRequest]) -> List[int]:
+    """
+    Primary keys of logs just bulk inserted, in order. Databases that do not
+    return them, like SQLite, hold the write lock until the transaction
+    commits, so the inserted logs are the last ones.
+    """
+    if logs[0].pk is not None:
+        return [log.pk for log in logs]
+
+    pks = LogRequest.objects.order_by('-pk') \
+        .values_list('pk', flat=True)[:len(logs)]
+    return sorted(pks)
+
+
+def log_verdicts(records: Iterable[Tuple[Sequence[str], bool]],
+                 batch_size: int = 1000) -> int:
+    """
+    Logs analysed DNAs with bulk inserts in a single transaction, indexing
+    them and incrementing the statistics once.
+    :param records: sequences of each DNA and whether it is mutant
+    :param batch_size: number of logs inserted per query
+    :return: number of DNAs logged
+    """
+    records = [(list(sequences), mutant) for sequences, mutant in records]
+    if not records:
+        return 0
+
+    logs = [
+        LogRequest(dna_sequence=json.dumps(sequences), mutant=mutant)
+        for sequences, mutant in records
+    ]
+
+    with transaction.atomic():
+        # Bulk inserts do not send post_save, so the logs are indexed here
+        LogRequest.objects.bulk_create(logs, batch_size=batch_size)
+        index_dnas(
+            zip(_inserted_pks(logs), (seqs for seqs, _ in records)),
+            batch_size,
+        )
+        mutants = sum(log.mutant for log in logs)
+        increment_statistics(len(logs) - mutants, mutants)
+
+    return len(logs)
+
+
+def analyse_batch(values: Sequence[Any], log: bool = True) -> List[BatchItem]:
+    """
+    Analyses many DNAs at once, logging the valid ones.
+    :param values: DNAs, each one as a list of 6 sequences
+    :param log: whether the valid DNAs are logged
+    :return: verdict or validation error of each DNA, in order
+    """
+    items: List[Optional[BatchItem]] = [None] * len(values)
+    valid = []
+
+    for index, value in enumerate(values):
+        try:
+            valid.append((index, value, parse_dna(value)))
+        except DNASequenceError as e:
+            items[index] = BatchItem(index, None, str(e))
+
+    verdicts = get_batch_engine().is_mutant_batch([dna for *_, dna in valid])
+    for (index, _, _), mutant in zip(valid, verdicts):
+        items[index] = BatchItem(index, mutant)
+
+    if log:
+        log_verdicts(
+            (value, mutant) for (_, value, _), mutant in zip(valid, verdicts)
+        )
+
+    return items
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+from library.genetics.engines import AUTO_ENGINE, available_engines
+
+
+@register()
+def check_genetics_engines(app_configs, **kwargs):
+    """
+    Engines are only built on the first DNA analysed, so unknown or
+    unavailable engine names are reported by the system checks.
+    """
+    supported = [AUTO_ENGINE, *available_engines()]
+    errors = []
+
+    for setting in ('GENETICS_ENGINE', 'GENETICS_BATCH_ENGINE'):
+        name = getattr(settings, setting, AUTO_ENGINE)
+        if name not in supported:
+            errors.append(Error(
+                f'{setting} is {name!r}, which is not an available engine.',
+                hint=f'Supported values: {", ".join(supported)}.',
+                id='mutant.E001',
+            ))
+
+    return errors
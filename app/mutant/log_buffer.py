@@ -0,0 +1,236 @@
+"""
+Write-behind buffer of the DNA checks. Instead of inserting its log, a
+request enqueues it and returns; a background thread of the worker logs the
+queued DNAs with log_verdicts, one transaction per group, once
+MUTANT_LOG_BUFFER_SIZE of them are queued or the oldest one has waited
+MUTANT_LOG_BUFFER_DELAY seconds.
+
+Logs not written yet are lost if the worker dies. Requests wait for the
+buffer when MUTANT_LOG_BUFFER_MAX_PENDING logs are unwritten, which caps how
+many can be lost, and the buffer is flushed when the worker exits.
+"""
+import atexit
+import json
+import logging
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from app.mutant.batch import log_verdicts
+from app.mutant.models import LogRequest
+
+logger = logging.getLogger(__name__)
+
+Record = Tuple[Sequence[str], bool]
+
+_log_buffer = None
+_log_buffer_settings = None
+_log_buffer_lock = Lock()
+
+
+class LogBuffer:
+    """
+    Thread-safe queue of DNA logs written in groups by a flusher thread,
+    started on the first log so that it runs in the worker process.
+    """
+
+    def __init__(self,
+                 max_size: int,
+                 max_delay: float,
+                 max_pending: Optional[int] = None,
+                 write: Callable[[Iterable[Record]], int] = log_verdicts):
+        """
+        :param max_size: number of queued logs that triggers a write
+        :param max_delay: seconds the oldest queued log waits at most
+        :param max_pending: logs queued or being written at most, at least
+            max_size, before new logs wait
+        :param write: function writing a group of logs
+        """
+        if max_size < 1:
+            raise ValueError('Buffer size must be at least 1.')
+        if max_delay <= 0:
+            raise ValueError('Buffer delay must be positive.')
+
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.max_pending = max(max_pending or max_size, max_size)
+        self.write = write
+
+        self._records: List[Record] = []
+        self._first_at = None
+        self._writing = 0
+        self._closed = False
+        self._condition = Condition()
+        self._thread = None
+
+    def __len__(self):
+        """ Logs queued or being written """
+        with self._condition:
+            return len(self._records) + self._writing
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def enqueue(self, sequences: Sequence[str], mutant: bool) -> None:
+        """
+        Queues the log of a DNA, waiting while the buffer is full. Once the
+        buffer is closed, the log is written right away.
+        :param sequences: sequences of the DNA
+        :param mutant: whether DNA is mutant
+        """
+        with self._condition:
+            while not self._closed and \
+                    len(self._records) + self._writing >= self.max_pending:
+                self._condition.wait()
+
+            if not self._closed:
+                # The flusher waits with no timeout while the buffer is empty
+                notify = not self._records
+                if notify:
+                    self._first_at = monotonic()
+                self._records.append((sequences, mutant))
+                self._start()
+                if notify or len(self._records) >= self.max_size:
+                    self._condition.notify_all()
+                return
+
+        self._write([(sequences, mutant)])
+
+    def flush(self, timeout: Optional[float] = None) -> int:
+        """
+        Writes the queued logs in the calling thread, and waits for the ones
+        being written by the flusher.
+        :param timeout: seconds to wait for the flusher at most
+        :return: number of logs written by this call
+        """
+        with self._condition:
+            records = self._take()
+
+        if records:
+            self._write(records)
+
+        with self._condition:
+            self._condition.wait_for(lambda: not self._writing, timeout)
+
+        return len(records)
+
+    def close(self, timeout: Optional[float] = None) -> int:
+        """
+        Stops the flusher and writes the logs left.
+        :param timeout: seconds to wait for the group being written
+        :return: number of logs written by this call
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        if deadline is not None:
+            timeout = max(deadline - monotonic(), 0)
+        return self.flush(timeout)
+
+    def _start(self) -> None:
+        """ Starts the flusher, again in a forked worker """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = Thread(
+                target=self._run,
+                name='log-buffer',
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _take(self) -> List[Record]:
+        records, self._records = self._records, []
+        self._first_at = None
+        self._writing += len(records)
+        return records
+
+    def _write(self, records: List[Record]) -> None:
+        try:
+            self.write(records)
+        except Exception:
+            logger.exception('Could not write %s DNA logs', len(records))
+        finally:
+            with self._condition:
+                self._writing -= len(records)
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and \
+                        len(self._records) < self.max_size:
+                    timeout = None
+                    if self._records:
+                        timeout = self._first_at + self.max_delay - monotonic()
+                        if timeout <= 0:
+                            break
+                    self._condition.wait(timeout)
+
+                if self._closed:
+                    return
+                records = self._take()
+
+            # The flusher holds its own database connection
+            close_old_connections()
+            self._write(records)
+            close_old_connections()
+
+
+def get_log_buffer() -> Optional[LogBuffer]:
+    """
+    Returns the log buffer of the worker, or None when
+    MUTANT_LOG_BUFFER_SIZE is not set and logs are written by the request.
+    """
+    global _log_buffer, _log_buffer_settings
+
+    config = (
+        getattr(settings, 'MUTANT_LOG_BUFFER_SIZE', 0),
+        getattr(settings, 'MUTANT_LOG_BUFFER_DELAY', 1.0),
+        getattr(settings, 'MUTANT_LOG_BUFFER_MAX_PENDING', 0),
+    )
+
+    with _log_buffer_lock:
+        if config != _log_buffer_settings:
+            if _log_buffer is not None:
+                _log_buffer.close()
+            _log_buffer = LogBuffer(*config) if config[0] else None
+            _log_buffer_settings = config
+        return _log_buffer
+
+
+def log_dna(sequences: Sequence[str], mutant: bool) -> None:
+    """
+    Logs a checked DNA through the buffer, or right away when there is
+    none.
+    :param sequences: sequences of the DNA
+    :param mutant: whether DNA is mutant
+    """
+    buffer = get_log_buffer()
+    if buffer is not None:
+        buffer.enqueue(sequences, mutant)
+    else:
+        with transaction.atomic():
+            LogRequest.objects.create(
+                dna_sequence=json.dumps(list(sequences)),
+                mutant=mutant,
+            )
+
+
+@atexit.register
+def close_log_buffer() -> None:
+    """ Writes the buffered logs when the worker exits """
+    global _log_buffer, _log_buffer_settings
+
+    with _log_buffer_lock:
+        if _log_buffer is not None:
+            _log_buffer.close()
+        _log_buffer = _log_buffer_settings = None
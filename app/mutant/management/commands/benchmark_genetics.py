@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from library.genetics.benchmarks.cli import add_arguments, execute
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks the hot paths of the genetics library.'
+
+    def add_arguments(self, parser):
+        add_arguments(parser)
+
+    def handle(self, *args, **options):
+        if execute(options, write=self.stdout.write):
+            raise CommandError('Benchmark regressions found.')
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from app.mutant.similarity import build_index
+
+
+class Command(BaseCommand):
+    help = 'Indexes the logged DNAs to find similar DNAs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Drops the whole index before building it',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Number of DNAs indexed at once (default 10000)',
+        )
+
+    def handle(self, *args, **options):
+        indexed = build_index(options['batch_size'], options['rebuild'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} DNAs'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.mutant.statistics import reconcile_statistics
+
+
+class Command(BaseCommand):
+    help = 'Recounts the logged human and mutant DNAs into the statistics.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=100000,
+            help='Number of logs counted per query (default 100000)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            stats = reconcile_statistics(options['chunk_size'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Counted {stats.count_human_dna} human and'
+            f' {stats.count_mutant_dna} mutant DNAs'
+        ))
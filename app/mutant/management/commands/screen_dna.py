@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app.mutant.analysis import load_reference_set
+from library.genetics import InvalidSequenceError
+from library.genetics.references import ReferenceSet
+from library.genetics.screener import FORMATS, format_report, screen_file
+
+
+class Command(BaseCommand):
+    help = 'Screens a file of DNAs, one per line, writing verdicts to a file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', help='File of DNAs to screen')
+        parser.add_argument('output', help='File to write verdicts to')
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            default='auto',
+            help='Format of the records: json, text or auto (default)',
+        )
+        references = parser.add_mutually_exclusive_group()
+        references.add_argument(
+            '--references',
+            help='File of reference DNAs to screen against, one per line',
+        )
+        references.add_argument(
+            '--db-references',
+            action='store_true',
+            help='Screens against the mutant references of the database',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            reference_set = self._get_reference_set(options)
+            report = screen_file(
+                options['input'],
+                options['output'],
+                options['format'],
+                references=reference_set,
+            )
+        except (OSError, InvalidSequenceError) as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(format_report(report)))
+
+    @staticmethod
+    def _get_reference_set(options):
+        if options['references']:
+            return ReferenceSet.from_file(options['references'])
+
+        if options['db_references']:
+            reference_set = load_reference_set()
+            if not len(reference_set):
+                raise CommandError('There are no mutant references stored.')
+            return reference_set
+
+        return None
@@ -0,0 +1,45 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.mutant.similarity import MAX_DISTANCE, find_similar
+from library.genetics import InvalidSequenceError
+
+
+class Command(BaseCommand):
+    help = 'Finds the logged DNAs within a distance of a DNA.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'dna',
+            nargs='+',
+            help='Sequences of the DNA, e.g. ATGCGA CAGTGC ...',
+        )
+        parser.add_argument(
+            '--distance',
+            type=int,
+            default=1,
+            help=f'Maximum number of different amino acids, up to'
+                 f' {MAX_DISTANCE} (default 1)',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=100,
+            help='Maximum number of DNAs listed (default 100)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            similar = find_similar(
+                options['dna'], options['distance'], options['limit']
+            )
+        except (ValueError, InvalidSequenceError) as e:
+            raise CommandError(str(e))
+
+        for s in similar:
+            self.stdout.write(json.dumps(s._asdict()))
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Found {len(similar)} similar DNAs')
+        )
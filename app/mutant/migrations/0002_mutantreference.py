@@ -0,0 +1,26 @@
+# Generated by Django 3.2.5 on 2026-10-18 10:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mutant', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MutantReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='name')),
+                ('dna_sequence', models.TextField(help_text='Sequences of the reference DNA as a JSON list', verbose_name='DNA Sequence')),
+            ],
+            options={
+                'verbose_name': 'Mutant Reference',
+                'verbose_name_plural': 'Mutant References',
+                'ordering': ['pk'],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.5 on 2026-10-18 10:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mutant', '0002_mutantreference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DNAFingerprint',
+            fields=[
+                ('log_request', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='fingerprint', serialize=False, to='mutant.logrequest', verbose_name='log request')),
+                ('row_0', models.PositiveSmallIntegerField(db_index=True, editable=False, help_text='Packed codon pair of the row 1', verbose_name='row 1')),
+                ('row_1', models.PositiveSmallIntegerField(db_index=True, editable=False, help_text='Packed codon pair of the row 2', verbose_name='row 2')),
+                ('row_2', models.PositiveSmallIntegerField(db_index=True, editable=False, help_text='Packed codon pair of the row 3', verbose_name='row 3')),
+                ('row_3', models.PositiveSmallIntegerField(db_index=True, editable=False, help_text='Packed codon pair of the row 4', verbose_name='row 4')),
+                ('row_4', models.PositiveSmallIntegerField(db_index=True, editable=False, help_text='Packed codon pair of the row 5', verbose_name='row 5')),
+                ('row_5', models.PositiveSmallIntegerField(db_index=True, editable=False, help_text='Packed codon pair of the row 6', verbose_name='row 6')),
+            ],
+            options={
+                'verbose_name': 'DNA Fingerprint',
+                'verbose_name_plural': 'DNA Fingerprints',
+            },
+        ),
+    ]
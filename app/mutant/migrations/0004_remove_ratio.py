@@ -0,0 +1,32 @@
+# Generated by Django 3.2.5 on 2026-10-18 10:48
+
+from django.db import migrations
+
+
+def create_statistics(apps, schema_editor):
+    """ Statistics are incremented from now on, so they must exist """
+    LogRequest = apps.get_model('mutant', 'LogRequest')
+    LogRequestStatistics = apps.get_model('mutant', 'LogRequestStatistics')
+
+    LogRequestStatistics.objects.update_or_create(
+        pk=1,
+        defaults={
+            'count_human_dna': LogRequest.objects.filter(mutant=False).count(),
+            'count_mutant_dna': LogRequest.objects.filter(mutant=True).count(),
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mutant', '0003_dnafingerprint'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='logrequeststatistics',
+            name='ratio',
+        ),
+        migrations.RunPython(create_statistics, migrations.RunPython.noop),
+    ]
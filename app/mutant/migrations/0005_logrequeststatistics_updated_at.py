@@ -0,0 +1,20 @@
+# Generated by Django 3.2.5 on 2026-10-18 11:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mutant', '0004_remove_ratio'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='logrequeststatistics',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='updated at'),
+            preserve_default=False,
+        ),
+    ]
@@ -54,10 +54,113 @@ class LogRequestStatistics(models.Model):
         editable=False
     )
 
-    ratio = models.DecimalField(
-        verbose_name='Ratio mutant found',
-        decimal_places=1,
-        max_digits=6,
+    updated_at = models.DateTimeField(
+        verbose_name='updated at',
+        blank=False,
+        null=False,
+        auto_now=True,
+        editable=False
+    )
+
+    @property
+    def ratio(self) -> float:
+        """ Mutant DNAs found per human DNA """
+        if self.count_human_dna > 1:
+            return self.count_mutant_dna / self.count_human_dna
+        return 0.0
+
+
+class MutantReference(models.Model):
+    """ Reference DNA of a known mutant family to screen DNAs against """
+
+    class Meta:
+        verbose_name = 'Mutant Reference'
+        verbose_name_plural = 'Mutant References'
+        ordering = ['pk']
+
+    name = models.CharField(
+        verbose_name='name',
+        max_length=100,
+        unique=True,
+        blank=False,
+        null=False
+    )
+
+    dna_sequence = models.TextField(
+        verbose_name='DNA Sequence',
+        help_text='Sequences of the reference DNA as a JSON list',
+        blank=False,
+        null=False
+    )
+
+
+class DNAFingerprint(models.Model):
+    """
+    Packed codon pairs of the rows of a logged DNA, each one indexed, so
+    DNAs similar to another one are found without parsing every log.
+    """
+
+    class Meta:
+        verbose_name = 'DNA Fingerprint'
+        verbose_name_plural = 'DNA Fingerprints'
+
+    log_request = models.OneToOneField(
+        LogRequest,
+        verbose_name='log request',
+        related_name='fingerprint',
+        on_delete=models.CASCADE,
+        primary_key=True
+    )
+
+    row_0 = models.PositiveSmallIntegerField(
+        verbose_name='row 1',
+        help_text='Packed codon pair of the row 1',
+        db_index=True,
+        blank=False,
+        null=False,
+        editable=False
+    )
+
+    row_1 = models.PositiveSmallIntegerField(
+        verbose_name='row 2',
+        help_text='Packed codon pair of the row 2',
+        db_index=True,
+        blank=False,
+        null=False,
+        editable=False
+    )
+
+    row_2 = models.PositiveSmallIntegerField(
+        verbose_name='row 3',
+        help_text='Packed codon pair of the row 3',
+        db_index=True,
+        blank=False,
+        null=False,
+        editable=False
+    )
+
+    row_3 = models.PositiveSmallIntegerField(
+        verbose_name='row 4',
+        help_text='Packed codon pair of the row 4',
+        db_index=True,
+        blank=False,
+        null=False,
+        editable=False
+    )
+
+    row_4 = models.PositiveSmallIntegerField(
+        verbose_name='row 5',
+        help_text='Packed codon pair of the row 5',
+        db_index=True,
+        blank=False,
+        null=False,
+        editable=False
+    )
+
+    row_5 = models.PositiveSmallIntegerField(
+        verbose_name='row 6',
+        help_text='Packed codon pair of the row 6',
+        db_index=True,
         blank=False,
         null=False,
         editable=False
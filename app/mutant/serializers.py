@@ -1,23 +1,16 @@
+from django.conf import settings
 from rest_framework import serializers
 
 from app.mutant.models import LogRequestStatistics, LogRequest
-from library.genetics import AminoAcid
+from app.mutant.similarity import MAX_DISTANCE
+from library.genetics import InvalidSequenceError, validate_amino_acids
 
 
 def amino_acid_validator(value):
-    values = [x.name for x in AminoAcid]
-    data_list = []
-
-    if value:
-        data_list = list(value)
-
-    for v in data_list:
-        if v not in values:
-            raise serializers.ValidationError(
-                f'You must provide correct amino'
-                f' acid values with 6 digits:'
-                f' {", ".join(values)}. Value sent: {value}.'
-            )
+    try:
+        validate_amino_acids(value)
+    except InvalidSequenceError as e:
+        raise serializers.ValidationError(str(e))
 
 
 class MutantSerializer(serializers.Serializer):
@@ -32,6 +25,35 @@ class MutantSerializer(serializers.Serializer):
     )
 
 
+class MutantEditsSerializer(MutantSerializer):
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=1)
+
+
+class SimilarDNASerializer(MutantSerializer):
+    distance = serializers.IntegerField(
+        min_value=0,
+        max_value=MAX_DISTANCE,
+        default=1
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+
+class MutantBatchSerializer(serializers.Serializer):
+    dnas = serializers.ListField(
+        allow_empty=False,
+        allow_null=False,
+    )
+
+    def validate_dnas(self, value):
+        max_size = settings.MUTANT_BATCH_MAX_SIZE
+        if len(value) > max_size:
+            raise serializers.ValidationError(
+                f'A batch supports up to {max_size} DNAs. DNAs sent:'
+                f' {len(value)}.'
+            )
+        return value
+
+
 class LogRequestSerializer(serializers.ModelSerializer):
     class Meta:
         model = LogRequest
@@ -39,6 +61,12 @@ class LogRequestSerializer(serializers.ModelSerializer):
 
 
 class StatisticsSerializer(serializers.ModelSerializer):
+    ratio = serializers.DecimalField(
+        max_digits=None,
+        decimal_places=1,
+        read_only=True
+    )
+
     class Meta:
         model = LogRequestStatistics
         fields = (
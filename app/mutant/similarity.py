@@ -0,0 +1,201 @@
+"""
+Similarity index over the logged DNAs.
+
+Every logged DNA has a fingerprint with the packed codon pair of each row in
+an indexed column. Two DNAs within a distance of k amino acids have at least
+one row within k // 6 of each other, and when k < 6 at least 6 - k equal
+rows, so the database only reads the DNAs sharing rows with the query through
+the row indexes, and the exact distance is checked on those candidates only.
+"""
+import json
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from app.mutant.models import DNAFingerprint, LogRequest
+from library.genetics import DNA, InvalidSequenceError
+from library.genetics.neighbourhood import dna_distance, neighbour_codes
+from library.genetics.packed import DNA_PAIRS, pair_code_to_string
+
+# Largest distance answered through the row indexes: farther queries would
+# read most of the table.
+MAX_DISTANCE = 11
+
+ROW_FIELDS = tuple(f'row_{row}' for row in range(DNA_PAIRS))
+
+
+class SimilarDNA(NamedTuple):
+    """ A logged DNA and its distance to the queried one """
+    log_request_id: int
+    dna: List[str]
+    mutant: bool
+    distance: int
+
+
+def dna_rows(sequences: Sequence[str]) -> Optional[Tuple[int, ...]]:
+    """
+    :param sequences: sequences of a DNA
+    :return: packed codes of its rows, None if it is not a valid DNA
+    """
+    try:
+        return DNA.from_strings(sequences).to_packed().rows
+    except (TypeError, InvalidSequenceError):
+        return None
+
+
+def fingerprint_rows(dna_sequence: str) -> Optional[Tuple[int, ...]]:
+    """
+    :param dna_sequence: sequences of a logged DNA as a JSON list
+    :return: packed codes of its rows, None if it is not a valid DNA
+    """
+    try:
+        sequences = json.loads(dna_sequence)
+    except ValueError:
+        return None
+    return dna_rows(sequences)
+
+
+def _fingerprint(log_request_id: int,
+                 rows: Sequence[int]) -> DNAFingerprint:
+    return DNAFingerprint(
+        log_request_id=log_request_id,
+        **dict(zip(ROW_FIELDS, rows))
+    )
+
+
+def index_log_request(log_request: LogRequest) -> Optional[DNAFingerprint]:
+    """
+    Adds a logged DNA to the index.
+    :param log_request: logged DNA
+    :return: its fingerprint, None if the DNA is not valid
+    """
+    rows = fingerprint_rows(log_request.dna_sequence)
+    if rows is None:
+        return None
+
+    fingerprint = _fingerprint(log_request.pk, rows)
+    fingerprint.save()
+    return fingerprint
+
+
+def index_dnas(dnas: Iterable[Tuple[int, Sequence[str]]],
+               batch_size: int = 1000) -> int:
+    """
+    Adds DNAs just logged to the index, from their sequences rather than
+    from the logs.
+    :param dnas: primary key of each log and the sequences of its DNA
+    :param batch_size: number of fingerprints inserted per query
+    :return: number of DNAs indexed
+    """
+    fingerprints = []
+    for pk, sequences in dnas:
+        rows = dna_rows(sequences)
+        if rows is not None:
+            fingerprints.append(_fingerprint(pk, rows))
+
+    DNAFingerprint.objects.bulk_create(fingerprints, batch_size=batch_size)
+    return len(fingerprints)
+
+
+def build_index(batch_size: int = 10000, rebuild: bool = False) -> int:
+    """
+    Indexes the logged DNAs without a fingerprint, in batches.
+    :param batch_size: number of fingerprints inserted at once
+    :param rebuild: whether every fingerprint is dropped first
+    :return: number of DNAs indexed
+    """
+    if rebuild:
+        DNAFingerprint.objects.all().delete()
+
+    logs = LogRequest.objects.filter(fingerprint__isnull=True) \
+        .order_by('pk').values_list('pk', 'dna_sequence')
+
+    indexed = 0
+    batch = []
+
+    def flush():
+        with transaction.atomic():
+            DNAFingerprint.objects.bulk_create(batch)
+        return len(batch)
+
+    for pk, dna_sequence in logs.iterator(chunk_size=batch_size):
+        rows = fingerprint_rows(dna_sequence)
+        if rows is None:
+            continue
+
+        batch.append(_fingerprint(pk, rows))
+        if len(batch) >= batch_size:
+            indexed += flush()
+            batch = []
+
+    if batch:
+        indexed += flush()
+
+    return indexed
+
+
+def _candidates_filter(rows: Sequence[int], distance: int) -> Q:
+    """ Logs sharing a row with the query within distance // 6 """
+    radius = distance // DNA_PAIRS
+    condition = Q()
+    for field, code in zip(ROW_FIELDS, rows):
+        if radius:
+            condition |= Q(**{f'{field}__in': sorted(
+                neighbour_codes(code, radius)
+            )})
+        else:
+            condition |= Q(**{field: code})
+    return condition
+
+
+def find_similar(sequences: Sequence[str],
+                 distance: int,
+                 limit: Optional[int] = 100) -> List[SimilarDNA]:
+    """
+    Finds the logged DNAs within a distance of a DNA.
+    :param sequences: sequences of the DNA
+    :param distance: maximum number of different amino acids
+    :param limit: maximum number of DNAs returned, the closest first
+    :return: similar DNAs, by distance and then by log order
+    """
+    if not 0 <= distance <= MAX_DISTANCE:
+        raise ValueError(f'Distance must be between 0 and {MAX_DISTANCE}.')
+
+    rows = DNA.from_strings(sequences).to_packed().rows
+    queryset = DNAFingerprint.objects.filter(
+        _candidates_filter(rows, distance)
+    )
+
+    if distance < DNA_PAIRS:
+        equal_rows = sum(
+            (
+                Case(
+                    When(**{field: code}, then=Value(1)),
+                    default=Value(0),
+                    output_field=IntegerField(),
+                )
+                for field, code in zip(ROW_FIELDS, rows)
+            ),
+            Value(0),
+        )
+        queryset = queryset.annotate(equal_rows=equal_rows) \
+            .filter(equal_rows__gte=DNA_PAIRS - distance)
+
+    candidates = queryset.values_list(
+        'log_request_id', 'log_request__mutant', *ROW_FIELDS
+    )
+
+    similar = []
+    for log_request_id, mutant, *candidate_rows in candidates.iterator():
+        candidate_distance = dna_distance(rows, candidate_rows)
+        if candidate_distance <= distance:
+            similar.append(SimilarDNA(
+                log_request_id=log_request_id,
+                dna=[pair_code_to_string(code) for code in candidate_rows],
+                mutant=mutant,
+                distance=candidate_distance,
+            ))
+
+    similar.sort(key=lambda s: (s.distance, s.log_request_id))
+    return similar[:limit] if limit is not None else similar
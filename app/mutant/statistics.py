@@ -0,0 +1,130 @@
+"""
+Counters of the logged human and mutant DNAs. They are incremented in the
+transaction inserting the logs, so a check costs the same whatever the
+number of logs, and recounted from the logs by reconcile_statistics when
+logs are deleted or edited.
+"""
+from typing import Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from app.mutant.models import LogRequest, LogRequestStatistics
+from app.mutant.serializers import StatisticsSerializer
+from app.mutant.stats_cache import CachedStatistics, get_stats_cache
+
+
+def _invalidate_cache() -> None:
+    """
+    Outdates the cached statistics once the transaction is committed, so
+    they are not read again before the change is visible.
+    """
+    transaction.on_commit(lambda: get_stats_cache().invalidate())
+
+
+def increment_statistics(humans: int = 0, mutants: int = 0) -> None:
+    """
+    Adds logged DNAs to the statistics with a single UPDATE, and outdates
+    the cached statistics. It must run in the transaction inserting the logs.
+    :param humans: number of human DNAs logged
+    :param mutants: number of mutant DNAs logged
+    """
+    if not humans and not mutants:
+        return
+
+    updated = LogRequestStatistics.objects.filter(pk=1).update(
+        count_human_dna=F('count_human_dna') + humans,
+        count_mutant_dna=F('count_mutant_dna') + mutants,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        # The logs just inserted are counted too
+        reconcile_statistics()
+        return
+
+    _invalidate_cache()
+
+
+def reconcile_statistics(chunk_size: int = 100000) -> LogRequestStatistics:
+    """
+    Recounts the logged human and mutant DNAs into the statistics, a range
+    of primary keys at a time, and outdates the cached statistics.
+    :param chunk_size: number of primary keys counted per query
+    :return: exact statistics
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be at least 1.')
+
+    with transaction.atomic():
+        last_pk = LogRequest.objects.aggregate(last=Max('pk'))['last'] or 0
+
+        humans = mutants = 0
+        for start in range(0, last_pk, chunk_size):
+            counts = LogRequest.objects.filter(
+                pk__gt=start,
+                pk__lte=start + chunk_size,
+            ).aggregate(
+                humans=Count('pk', filter=Q(mutant=False)),
+                mutants=Count('pk', filter=Q(mutant=True)),
+            )
+            humans += counts['humans']
+            mutants += counts['mutants']
+
+        stats, _ = LogRequestStatistics.objects.update_or_create(
+            pk=1,
+            defaults={
+                'count_human_dna': humans,
+                'count_mutant_dna': mutants,
+            },
+        )
+
+    _invalidate_cache()
+    return stats
+
+
+def _counts() -> Tuple[int, int]:
+    """ Human and mutant DNAs counted in the database """
+    counts = LogRequestStatistics.objects.filter(pk=1) \
+        .values_list('count_human_dna', 'count_mutant_dna').first()
+    return counts or (0, 0)
+
+
+def load_statistics() -> CachedStatistics:
+    """
+    Reads the serialized statistics from the cache, or from the database
+    when the cached ones are outdated. Unchanged statistics are served
+    without any query, unless STATS_CACHE_REVALIDATE is set: then the
+    cached ones due for revalidation are served again when the counters did
+    not change since, including in other processes.
+    """
+    cache = get_stats_cache()
+    entry = cache.get()
+    if entry is not None:
+        if cache.is_fresh(entry):
+            return entry
+        data = entry.data
+        if entry.version == cache.version and _counts() == (
+                data['count_human_dna'], data['count_mutant_dna']):
+            return cache.set(data, entry.version)
+
+    version = cache.version
+    try:
+        instance = LogRequestStatistics.objects.get(pk=1)
+    except LogRequestStatistics.DoesNotExist:
+        instance = LogRequestStatistics(
+            count_human_dna=0,
+            count_mutant_dna=0,
+        )
+
+    data = dict(StatisticsSerializer(instance).data)
+    return cache.set(data, version)
+
+
+def statistics_etag(entry: CachedStatistics) -> str:
+    """
+    :param entry: cached statistics
+    :return: entity tag of the statistics, the same in every worker
+    """
+    data = entry.data
+    return f'"{data["count_human_dna"]}-{data["count_mutant_dna"]}"'
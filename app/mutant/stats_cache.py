@@ -0,0 +1,244 @@
+"""
+Cache of the serialized statistics, kept in the memory of the worker or in
+the uWSGI cache shared by the workers of an instance.
+
+Next to the statistics, the cache keeps a version number, bumped whenever
+the statistics change, and each entry the version it was read at. Outdated
+entries are not deleted, just no longer served, unless they were read less
+than STATS_CACHE_STALENESS milliseconds ago.
+
+The version only reaches the processes sharing the cache: the statistics
+changed by other workers of the local backend, other uWSGI instances or
+reconcile_stats only show in the database, and are missed until the entry
+times out. With STATS_CACHE_REVALIDATE set, entries older than that many
+seconds are revalidated against the counters in the database instead, at
+the cost of a query per worker and revalidation.
+"""
+import json
+from abc import ABC, abstractmethod
+from threading import Lock
+from time import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from django.conf import settings
+
+AUTO_BACKEND = 'auto'
+
+_stats_cache = None
+_stats_cache_settings = None
+_stats_cache_lock = Lock()
+
+
+class CachedStatistics(NamedTuple):
+    """
+    Attributes:
+        version     Version the statistics were read at.
+        cached_at   When they were read, in seconds since the epoch.
+        data        Serialized statistics.
+    """
+    version: int
+    cached_at: float
+    data: Dict[str, Any]
+
+
+class StatsCache(ABC):
+    """
+    Versioned cache of a single entry. Subclasses store the version and the
+    entry.
+    """
+    name = ''
+
+    def __init__(self,
+                 key: str,
+                 staleness: float = 0.0,
+                 timeout: float = 60 * 60,
+                 revalidate: Optional[float] = None,
+                 clock: Callable[[], float] = time):
+        """
+        :param key: key of the entry
+        :param staleness: seconds an outdated entry is still served
+        :param timeout: seconds an entry is served at most
+        :param revalidate: seconds an entry is served before checking it
+            against the database, never when None
+        :param clock: function returning the current time in seconds
+        """
+        self.key = key
+        self.staleness = staleness
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self.clock = clock
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """ Current version of the statistics """
+
+    @abstractmethod
+    def invalidate(self) -> int:
+        """
+        Outdates the cached entry.
+        :return: new version
+        """
+
+    def get(self) -> Optional[CachedStatistics]:
+        """
+        :return: cached entry, None when there is none or it is outdated
+        """
+        entry = self._get_entry()
+        if entry is None:
+            return None
+
+        age = self.clock() - entry.cached_at
+        if age > self.timeout:
+            return None
+        if entry.version != self.version and age >= self.staleness:
+            return None
+        return entry
+
+    def is_fresh(self, entry: CachedStatistics) -> bool:
+        """
+        :param entry: cached entry
+        :return: whether it was read or revalidated less than revalidate
+            seconds ago, so it is served without checking the database
+        """
+        if self.revalidate is None:
+            return True
+        return self.clock() - entry.cached_at < self.revalidate
+
+    def set(self, data: Dict[str, Any], version: int) -> CachedStatistics:
+        """
+        Caches the statistics. The version must be read before them, so
+        that changes made meanwhile outdate the entry.
+        :param data: serialized statistics
+        :param version: version read before the statistics
+        :return: cached entry
+        """
+        entry = CachedStatistics(version, self.clock(), data)
+        self._set_entry(entry)
+        return entry
+
+    @abstractmethod
+    def _get_entry(self) -> Optional[CachedStatistics]:
+        """ Stored entry, None when there is none """
+
+    @abstractmethod
+    def _set_entry(self, entry: CachedStatistics) -> None:
+        """ Stores the entry """
+
+
+class LocalStatsCache(StatsCache):
+    """
+    Cache in the memory of the worker. Other workers do not outdate it, so
+    their changes are only seen on revalidation.
+    """
+    name = 'local'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._version = 0
+        self._entry = None
+        self._lock = Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def _get_entry(self) -> Optional[CachedStatistics]:
+        return self._entry
+
+    def _set_entry(self, entry: CachedStatistics) -> None:
+        self._entry = entry
+
+
+class UwsgiStatsCache(StatsCache):
+    """ Cache in the uWSGI cache, shared by the workers of the instance """
+    name = 'uwsgi'
+
+    def __init__(self, *args, uwsgi=None, **kwargs):
+        """
+        :param uwsgi: uWSGI API, the uwsgi module by default
+        """
+        super().__init__(*args, **kwargs)
+        if uwsgi is None:
+            import uwsgi
+        self._uwsgi = uwsgi
+        self._version_key = f'{self.key}:version'
+
+    @property
+    def version(self) -> int:
+        value = self._uwsgi.cache_get(self._version_key)
+        return int(value) if value else 0
+
+    def invalidate(self) -> int:
+        self._uwsgi.lock()
+        try:
+            version = self.version + 1
+            self._uwsgi.cache_update(self._version_key, str(version).encode())
+        finally:
+            self._uwsgi.unlock()
+        return version
+
+    def _get_entry(self) -> Optional[CachedStatistics]:
+        value = self._uwsgi.cache_get(self.key)
+        if not value:
+            return None
+        return CachedStatistics(*json.loads(value))
+
+    def _set_entry(self, entry: CachedStatistics) -> None:
+        self._uwsgi.cache_update(self.key, json.dumps(entry).encode())
+
+
+STATS_CACHES = {
+    cls.name: cls for cls in (LocalStatsCache, UwsgiStatsCache)
+}
+
+
+def _resolve_backend(name: str) -> str:
+    if name != AUTO_BACKEND:
+        return name
+
+    try:
+        import uwsgi  # noqa: F401
+    except ImportError:
+        return LocalStatsCache.name
+    return UwsgiStatsCache.name
+
+
+def get_stats_cache() -> StatsCache:
+    """
+    Returns the statistics cache of the worker. STATS_CACHE_BACKEND picks
+    where it is kept: local, uwsgi, or auto for the uWSGI cache when running
+    under uWSGI.
+    """
+    global _stats_cache, _stats_cache_settings
+
+    config = (
+        getattr(settings, 'STATS_CACHE_BACKEND', AUTO_BACKEND),
+        getattr(settings, 'STATS_CACHE_KEY', 'mutant_stats'),
+        getattr(settings, 'STATS_CACHE_STALENESS', 0),
+        getattr(settings, 'STATS_CACHE_TIMEOUT', 60 * 60),
+        getattr(settings, 'STATS_CACHE_REVALIDATE', 0),
+    )
+
+    with _stats_cache_lock:
+        if config != _stats_cache_settings:
+            backend, key, staleness, timeout, revalidate = config
+            cls = STATS_CACHES.get(_resolve_backend(backend))
+            if cls is None:
+                raise ValueError(
+                    f'Unknown stats cache backend {backend!r}. Supported'
+                    f' values: {", ".join([AUTO_BACKEND, *STATS_CACHES])}.'
+                )
+            _stats_cache = cls(
+                key,
+                staleness=staleness / 1000,
+                timeout=timeout,
+                revalidate=revalidate or None,
+            )
+            _stats_cache_settings = config
+        return _stats_cache
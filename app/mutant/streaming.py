@@ -0,0 +1,142 @@
+"""
+Screening of newline-delimited JSON bodies of any size. The body is read
+one record at a time and verdicts are produced in bounded batches, so the
+memory of a worker does not depend on the size of the upload.
+"""
+import json
+from typing import IO, Callable, Iterator, List, Optional, Tuple
+
+from app.mutant.analysis import get_batch_engine
+from app.mutant.batch import log_verdicts
+from library.genetics import DNA, InvalidSequenceError
+from library.genetics.screener import ScreenResult, parse_record
+
+
+class ChunkedReader:
+    """
+    File-like reader over a function returning the chunks of a body, e.g.
+    uwsgi.chunked_read, which returns an empty chunk at the end.
+    """
+
+    def __init__(self, read_chunk: Callable[[], bytes]):
+        self._read_chunk = read_chunk
+        self._buffer = b''
+        self._finished = False
+
+    def readline(self, limit: int = -1) -> bytes:
+        while not self._finished and b'\n' not in self._buffer and \
+                (limit < 0 or len(self._buffer) < limit):
+            chunk = self._read_chunk()
+            if not chunk:
+                self._finished = True
+            self._buffer += chunk
+
+        end = self._buffer.find(b'\n') + 1 or len(self._buffer)
+        if 0 <= limit < end:
+            end = limit
+
+        line, self._buffer = self._buffer[:end], self._buffer[end:]
+        return line
+
+
+def request_body(request) -> IO[bytes]:
+    """
+    Returns a stream of the request body to be read incrementally.
+
+    Django only reads up to CONTENT_LENGTH, which chunked uploads do not
+    have. Those are read through uwsgi.chunked_read under uWSGI, or straight
+    from wsgi.input for servers that remove the chunked encoding.
+    """
+    meta = request.META
+    chunked = meta.get('HTTP_TRANSFER_ENCODING', '').lower() == 'chunked'
+
+    if meta.get('CONTENT_LENGTH') or not chunked:
+        return request
+
+    try:
+        import uwsgi
+    except ImportError:
+        return meta['wsgi.input']
+    return ChunkedReader(uwsgi.chunked_read)
+
+
+def iter_records(stream: IO[bytes],
+                 max_line_length: int
+                 ) -> Iterator[Tuple[int, Optional[bytes]]]:
+    """
+    Reads the lines of a stream one at a time. Lines longer than the limit
+    are skipped and yielded as None, so they are reported as invalid
+    without being held in memory.
+    :param stream: body stream
+    :param max_line_length: maximum size of a record in bytes
+    :return: line number and record
+    """
+    number = 0
+    while True:
+        line = stream.readline(max_line_length + 1)
+        if not line:
+            return
+
+        number += 1
+        if len(line) > max_line_length and not line.endswith(b'\n'):
+            # Discards the rest of the record
+            while line and not line.endswith(b'\n'):
+                line = stream.readline(max_line_length + 1)
+            yield number, None
+            continue
+
+        yield number, line.rstrip(b'\r\n')
+
+
+def _analyse(batch: List[Tuple[int, List[str], DNA]]) -> List[ScreenResult]:
+    """ Analyses and logs a batch of valid records """
+    verdicts = get_batch_engine().is_mutant_batch([dna for *_, dna in batch])
+    log_verdicts(
+        (sequences, mutant)
+        for (_, sequences, _), mutant in zip(batch, verdicts)
+    )
+    return [
+        ScreenResult(number, mutant)
+        for (number, _, _), mutant in zip(batch, verdicts)
+    ]
+
+
+def screen_stream(stream: IO[bytes],
+                  batch_size: int,
+                  max_line_length: int) -> Iterator[bytes]:
+    """
+    Screens the records of a stream in batches, logging the valid ones.
+    :param stream: newline-delimited JSON body, one DNA per line
+    :param batch_size: number of records analysed and logged at once
+    :param max_line_length: maximum size of a record in bytes
+    :return: newline-delimited JSON results, in the order of the records
+    """
+    pending: List[ScreenResult] = []
+    batch: List[Tuple[int, List[str], DNA]] = []
+
+    def flush() -> Iterator[bytes]:
+        results = pending + _analyse(batch) if batch else list(pending)
+        results.sort(key=lambda result: result.line)
+        pending.clear()
+        batch.clear()
+        for result in results:
+            yield json.dumps(result.to_dict()).encode() + b'\n'
+
+    for number, record in iter_records(stream, max_line_length):
+        if record is None:
+            pending.append(ScreenResult(
+                number, None,
+                f'Record is longer than {max_line_length} bytes.'
+            ))
+        elif record.strip():
+            try:
+                sequences = parse_record(record.decode('utf-8'), 'json')
+                dna = DNA.from_strings(sequences)
+                batch.append((number, sequences, dna))
+            except (ValueError, InvalidSequenceError) as e:
+                pending.append(ScreenResult(number, None, str(e)))
+
+        if len(batch) + len(pending) >= batch_size:
+            yield from flush()
+
+    yield from flush()
@@ -0,0 +1,5 @@
+"""
+DNAs shared by the tests of the mutant app.
+"""
+MUTANT_DNA = ["ATGCGA", "CAGTGC", "TTATGT", "AGAAGG", "CCCCTA", "TCACTG"]
+HUMAN_DNA = ["TTATTT", "CAGTGC", "TTATTT", "TTATTT", "GCGTCA", "TTATTT"]
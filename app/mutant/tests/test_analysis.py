@@ -0,0 +1,53 @@
+from threading import Barrier, Thread
+from time import sleep
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from app.mutant import analysis
+from library.genetics.engines import get_engine
+
+
+class EngineSetupTests(SimpleTestCase):
+    def setUp(self):
+        self._engines = analysis._engine, analysis._batch_engine
+        analysis._engine = analysis._batch_engine = None
+
+    def tearDown(self):
+        analysis._engine, analysis._batch_engine = self._engines
+
+    def _set_up_concurrently(self, getter, builder):
+        built = []
+
+        def build():
+            sleep(0.05)
+            built.append(get_engine('packed'))
+            return built[-1]
+
+        barrier = Barrier(4)
+        engines = []
+
+        def run():
+            barrier.wait()
+            engines.append(getter())
+
+        with mock.patch.object(analysis, builder, build):
+            threads = [Thread(target=run) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(len(built), 1)
+        self.assertEqual(engines, built * 4)
+
+    def test_engine_is_set_up_once(self):
+        self._set_up_concurrently(
+            analysis.get_analysis_engine, '_build_engine'
+        )
+        self.assertTrue(analysis.is_engine_configured())
+
+    def test_batch_engine_is_set_up_once(self):
+        self._set_up_concurrently(
+            analysis.get_batch_engine, '_build_batch_engine'
+        )
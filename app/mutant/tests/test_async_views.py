@@ -0,0 +1,158 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from threading import current_thread
+from unittest import mock
+from urllib.parse import urlencode
+
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+
+from app.mutant import analysis, async_views
+from app.mutant.models import LogRequest
+from app.mutant.tests.fixtures import HUMAN_DNA, MUTANT_DNA
+from library.genetics.engines import get_engine
+
+
+@override_settings(ROOT_URLCONF='project.asgi_urls')
+class AsyncViewsTests(TransactionTestCase):
+    """
+    Database calls run in pool threads with their own connections, so the
+    tests are not wrapped in a transaction. The in-memory test database
+    fails concurrent writes instead of waiting, so they run in one thread.
+    """
+
+    def setUp(self):
+        self._executor = async_views._executor
+        async_views._executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self):
+        async_views._executor.shutdown()
+        async_views._executor = self._executor
+
+    def _post(self, dna, **kwargs):
+        return self.async_client.post(
+            reverse('async-mutant'),
+            data=json.dumps({'dna': dna}),
+            content_type='application/json',
+            **kwargs
+        )
+
+    async def test_mutant(self):
+        response = await self._post(MUTANT_DNA)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'message': 'DNA is mutant',
+            'content': {'dna': MUTANT_DNA},
+        })
+
+    async def test_engine_is_set_up_off_the_event_loop(self):
+        threads = []
+
+        def build():
+            threads.append(current_thread())
+            return get_engine('packed')
+
+        engine, analysis._engine = analysis._engine, None
+        try:
+            with mock.patch.object(analysis, '_build_engine', build):
+                response = await self._post(MUTANT_DNA)
+        finally:
+            analysis._engine = engine
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], current_thread())
+
+    async def test_human(self):
+        response = await self._post(HUMAN_DNA)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json(), {'message': 'DNA is not mutant.'})
+
+    async def test_form_body(self):
+        response = await self.async_client.post(
+            reverse('async-mutant'),
+            data=urlencode({'dna': MUTANT_DNA}, doseq=True),
+            content_type='application/x-www-form-urlencoded',
+        )
+        self.assertEqual(response.status_code, 200)
+
+    async def test_invalid_dna(self):
+        response = await self._post(MUTANT_DNA[:5])
+        self.assertContains(response, 'DNA is not valid', status_code=400)
+
+        response = await self._post(['CABTGC'] + MUTANT_DNA[1:])
+        self.assertContains(response, 'dna', status_code=400)
+
+        response = await self.async_client.post(
+            reverse('async-mutant'),
+            data='{"dna": [',
+            content_type='application/json',
+        )
+        self.assertContains(response, 'JSON parse error', status_code=400)
+
+    async def test_method_not_allowed(self):
+        response = await self.async_client.get(reverse('async-mutant'))
+        self.assertEqual(response.status_code, 405)
+
+        response = await self.async_client.post(reverse('async-stats'))
+        self.assertEqual(response.status_code, 405)
+
+    async def test_concurrent_requests_are_logged(self):
+        responses = await asyncio.gather(*(
+            self._post(MUTANT_DNA if index % 2 else HUMAN_DNA)
+            for index in range(20)
+        ))
+        self.assertEqual(
+            sorted(response.status_code for response in responses),
+            [200] * 10 + [403] * 10,
+        )
+
+        counts = await async_views.run_in_db_thread(
+            lambda: (
+                LogRequest.objects.filter(mutant=True).count(),
+                LogRequest.objects.filter(mutant=False).count(),
+            )
+        )
+        self.assertEqual(counts, (10, 10))
+
+        response = await self.async_client.get(reverse('async-stats'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'count_human_dna': 10,
+            'count_mutant_dna': 10,
+            'ratio': '1.0',
+        })
+
+        response = await self.async_client.get(
+            reverse('async-stats'),
+            **{'If-None-Match': response['ETag']}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], '"10-10"')
+
+    async def test_other_urls_are_served(self):
+        response = await self.async_client.post(
+            '/mutant/batch/',
+            data=json.dumps({'dnas': [MUTANT_DNA, HUMAN_DNA]}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        content = response.json()
+        self.assertEqual(content['count_mutant_dna'], 1)
+        self.assertEqual(content['count_human_dna'], 1)
+        self.assertEqual(
+            await async_views.run_in_db_thread(LogRequest.objects.count), 2
+        )
+
+    @override_settings(ASYNC_DB_THREADS=3)
+    def test_db_pool_is_bounded(self):
+        async_views._executor.shutdown()
+        async_views._executor = None
+        executor = async_views.get_db_executor()
+
+        self.assertIs(async_views.get_db_executor(), executor)
+        self.assertEqual(executor._max_workers, 3)
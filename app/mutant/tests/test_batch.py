@@ -0,0 +1,129 @@
+import json
+
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+
+from app.mutant.analysis import configure_batch_engine
+from app.mutant.batch import log_verdicts
+from app.mutant.models import DNAFingerprint, LogRequest, LogRequestStatistics
+from app.mutant.tests.fixtures import HUMAN_DNA, MUTANT_DNA
+from library.genetics import DNA
+from library.genetics.engines import available_engines
+
+
+class MutantBatchEndpointTests(TestCase):
+    def _get_url(self):
+        return reverse('mutant:mutant-batch')
+
+    def _post(self, data):
+        return self.client.post(
+            self._get_url(), data=data, content_type='application/json'
+        )
+
+    def test_batch_verdicts_and_errors(self):
+        data = {'dnas': [
+            MUTANT_DNA,
+            HUMAN_DNA,
+            ["ATGCGA", "CAGTGC"],
+            ["ATGCGA", "CAGTGC", "TTAXGT", "AGAAGG", "CCCCTA", "TCACTG"],
+            "ATGCGA",
+            MUTANT_DNA,
+        ]}
+        response = self._post(data)
+        self.assertEqual(response.status_code, 200)
+
+        content = response.json()
+        self.assertEqual(content['count_mutant_dna'], 2)
+        self.assertEqual(content['count_human_dna'], 1)
+        self.assertEqual(content['count_invalid_dna'], 3)
+
+        results = content['results']
+        self.assertEqual(results[0], {'index': 0, 'mutant': True})
+        self.assertEqual(results[1], {'index': 1, 'mutant': False})
+        self.assertIn('DNA is not valid', results[2]['error'])
+        self.assertIn('row 2, column 3', results[3]['error'])
+        self.assertIn('list of sequences', results[4]['error'])
+        self.assertEqual(results[5], {'index': 5, 'mutant': True})
+
+        # Only valid DNAs are logged, indexed and counted
+        self.assertEqual(LogRequest.objects.count(), 3)
+        self.assertEqual(
+            json.loads(LogRequest.objects.order_by('pk')[1].dna_sequence),
+            HUMAN_DNA,
+        )
+        self.assertEqual(DNAFingerprint.objects.count(), 3)
+
+        stats = LogRequestStatistics.objects.get(pk=1)
+        self.assertEqual(stats.count_mutant_dna, 2)
+        self.assertEqual(stats.count_human_dna, 1)
+
+    def test_queries_do_not_grow_with_batch(self):
+        """ Tests logs are inserted and counted once per batch """
+        LogRequestStatistics.objects.get_or_create(
+            pk=1,
+            defaults={'count_human_dna': 0, 'count_mutant_dna': 0},
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self._post({'dnas': [MUTANT_DNA, HUMAN_DNA] * 200})
+
+        # Inserts are only split by the limit of query parameters
+        self.assertLess(len(queries), 20)
+        counts = [q for q in queries if 'COUNT(' in q['sql']]
+        self.assertEqual(counts, [])
+        updates = [
+            q for q in queries
+            if q['sql'].startswith('UPDATE "mutant_logrequeststatistics"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(LogRequest.objects.count(), 400)
+        self.assertEqual(DNAFingerprint.objects.count(), 400)
+
+    def test_only_logged_dnas_are_indexed(self):
+        """ Tests the fingerprints come from the records, not the table """
+        LogRequest.objects.bulk_create([LogRequest(
+            dna_sequence=json.dumps(HUMAN_DNA), mutant=False,
+        )])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(
+                log_verdicts([(MUTANT_DNA, True), (HUMAN_DNA, False)]), 2
+            )
+
+        self.assertEqual(
+            [q for q in queries if 'MAX(' in q['sql']], []
+        )
+        logs = LogRequest.objects.order_by('pk')[1:]
+        fingerprints = DNAFingerprint.objects.order_by('pk')
+        self.assertEqual(
+            [f.log_request_id for f in fingerprints],
+            [log.pk for log in logs],
+        )
+        for fingerprint, dna in zip(fingerprints, [MUTANT_DNA, HUMAN_DNA]):
+            self.assertEqual(
+                fingerprint.row_0, DNA.from_strings(dna).to_packed().rows[0]
+            )
+
+    @override_settings(MUTANT_BATCH_MAX_SIZE=2)
+    def test_batch_size_limit(self):
+        response = self._post({'dnas': [MUTANT_DNA] * 3})
+        self.assertContains(response, 'up to 2 DNAs', status_code=400)
+
+        response = self._post({'dnas': []})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(LogRequest.objects.exists())
+
+    def test_every_batch_engine_gives_the_same_response(self):
+        try:
+            for name in available_engines():
+                with self.subTest(engine=name), \
+                        override_settings(GENETICS_BATCH_ENGINE=name):
+                    self.assertEqual(configure_batch_engine().name, name)
+
+                    response = self._post({'dnas': [MUTANT_DNA, HUMAN_DNA]})
+                    content = response.json()
+                    self.assertEqual(content['count_mutant_dna'], 1)
+                    self.assertEqual(content['count_human_dna'], 1)
+        finally:
+            configure_batch_engine()
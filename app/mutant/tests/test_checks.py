@@ -0,0 +1,27 @@
+from django.test import SimpleTestCase, override_settings
+
+from app.mutant.checks import check_genetics_engines
+from library.genetics.engines import available_engines
+
+
+class EngineCheckTests(SimpleTestCase):
+
+    def test_available_engines(self):
+        for name in ['auto', *available_engines()]:
+            with self.subTest(engine=name), override_settings(
+                    GENETICS_ENGINE=name, GENETICS_BATCH_ENGINE=name):
+                self.assertEqual(check_genetics_engines(None), [])
+
+    @override_settings(GENETICS_ENGINE='quantum', GENETICS_BATCH_ENGINE='auto')
+    def test_unknown_engine(self):
+        errors = check_genetics_engines(None)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].id, 'mutant.E001')
+        self.assertIn('GENETICS_ENGINE', errors[0].msg)
+        self.assertIn("'quantum'", errors[0].msg)
+
+    @override_settings(GENETICS_ENGINE='auto', GENETICS_BATCH_ENGINE='quantum')
+    def test_unknown_batch_engine(self):
+        errors = check_genetics_engines(None)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('GENETICS_BATCH_ENGINE', errors[0].msg)
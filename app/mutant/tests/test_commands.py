@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from app.mutant.models import MutantReference
+
+
+class ScreenDNACommandTests(TestCase):
+    def _temp_path(self) -> str:
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_screen_dna(self):
+        """ Tests screening a file of DNAs through the command """
+        input_path = self._temp_path()
+        output_path = self._temp_path()
+
+        with open(input_path, 'w') as f:
+            f.write(json.dumps({'dna': [
+                "ATGCGA", "CAGTGC", "TTATGT", "AGAAGG", "CCCCTA", "TCACTG"
+            ]}))
+            f.write('\n')
+
+        out = StringIO()
+        call_command('screen_dna', input_path, output_path, stdout=out)
+
+        self.assertIn('Screened 1 records (1 mutant', out.getvalue())
+        self.assertIn('records/sec', out.getvalue())
+
+        with open(output_path) as f:
+            self.assertEqual(json.loads(f.read()), {'line': 1, 'mutant': True})
+
+
+class BenchmarkGeneticsCommandTests(TestCase):
+    def test_benchmark_against_baseline(self):
+        """ Tests results saved and compared to a baseline """
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        out = StringIO()
+        call_command(
+            'benchmark_genetics',
+            '--sizes', '1,10',
+            '--cases', 'codon_pair_sequence',
+            '--output', path,
+            stdout=out,
+        )
+        self.assertIn('codon_pair_sequence', out.getvalue())
+
+        with open(path) as f:
+            self.assertEqual(len(json.load(f)['results']), 2)
+
+
+class ScreenDNAReferencesCommandTests(TestCase):
+    def test_screen_dna_against_db_references(self):
+        """ Tests screening against every mutant reference of the database """
+        MutantReference.objects.create(
+            name='magneto',
+            dna_sequence=json.dumps(
+                ["ATGCGA", "CAGTGC", "TTATGT", "AGAAGG", "CCCCTA", "TCACTG"]
+            ),
+        )
+        MutantReference.objects.create(
+            name='mystique',
+            dna_sequence=json.dumps(
+                ["AAAAAA", "CCCCCC", "GGGGGG", "TTTTTT", "ACACAC", "GTGTGT"]
+            ),
+        )
+
+        fd, input_path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('ATGCGA CAGTGC GGGGGG TTTTTT AAAAAA AAAAAA\n')
+        self.addCleanup(os.remove, input_path)
+
+        fd, output_path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, output_path)
+
+        call_command(
+            'screen_dna',
+            input_path,
+            output_path,
+            '--db-references',
+            stdout=StringIO(),
+        )
+
+        with open(output_path) as f:
+            self.assertEqual(
+                json.loads(f.read()),
+                {'line': 1, 'references': ['magneto', 'mystique']}
+            )
+
+    def test_error_without_db_references(self):
+        with self.assertRaises(CommandError):
+            call_command('screen_dna', 'in', 'out', '--db-references')
+
+    def test_error_with_invalid_db_references(self):
+        MutantReference.objects.create(
+            name='magneto',
+            dna_sequence=json.dumps(
+                ["ATGCGA", "CAGTGC", "TTAXGT", "AGAAGG", "CCCCTA", "TCACTG"]
+            ),
+        )
+
+        with self.assertRaisesRegex(CommandError, 'Reference magneto'):
+            call_command('screen_dna', 'in', 'out', '--db-references')
+
+    def test_error_with_malformed_reference_file(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('magneto ATGCGA CAGTGC TTATGT AGAAGG CCCCTA TCACTG\n')
+            f.write('{"name": "mystique", "dna": [\n')
+        self.addCleanup(os.remove, path)
+
+        with self.assertRaisesRegex(CommandError, 'line 2'):
+            call_command('screen_dna', 'in', 'out', '--references', path)
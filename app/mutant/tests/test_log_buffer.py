@@ -0,0 +1,168 @@
+from threading import Event, Thread
+from time import monotonic
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from app.mutant import log_buffer
+from app.mutant.log_buffer import LogBuffer, get_log_buffer
+from app.mutant.models import DNAFingerprint, LogRequest, LogRequestStatistics
+from app.mutant.tests.fixtures import HUMAN_DNA, MUTANT_DNA
+
+
+class LogBufferTests(SimpleTestCase):
+    def setUp(self):
+        self.groups = []
+        self.written = Event()
+
+    def _write(self, records):
+        self.groups.append(list(records))
+        self.written.set()
+        return len(self.groups[-1])
+
+    def test_writes_when_size_is_reached(self):
+        buffer = LogBuffer(3, 60, write=self._write)
+        buffer.enqueue(MUTANT_DNA, True)
+        buffer.enqueue(HUMAN_DNA, False)
+        self.assertEqual(self.groups, [])
+
+        buffer.enqueue(MUTANT_DNA, True)
+        self.assertTrue(self.written.wait(5))
+        self.assertEqual(self.groups, [
+            [(MUTANT_DNA, True), (HUMAN_DNA, False), (MUTANT_DNA, True)],
+        ])
+        buffer.close()
+
+    def test_writes_when_delay_is_reached(self):
+        buffer = LogBuffer(100, 0.01, write=self._write)
+        buffer.enqueue(HUMAN_DNA, False)
+
+        self.assertTrue(self.written.wait(5))
+        self.assertEqual(self.groups, [[(HUMAN_DNA, False)]])
+        buffer.close()
+
+    def test_delay_is_reached_after_a_flush(self):
+        buffer = LogBuffer(100, 0.2, write=self._write)
+        buffer.enqueue(HUMAN_DNA, False)
+        self.assertTrue(self.written.wait(5))
+
+        self.written.clear()
+        start = monotonic()
+        buffer.enqueue(MUTANT_DNA, True)
+        self.assertTrue(self.written.wait(5))
+        self.assertLess(monotonic() - start, 1)
+        self.assertEqual(self.groups[-1], [(MUTANT_DNA, True)])
+        buffer.close()
+
+    def test_close_waits_at_most_the_timeout(self):
+        writing, release = Event(), Event()
+
+        def write(records):
+            writing.set()
+            release.wait(5)
+            self._write(records)
+
+        buffer = LogBuffer(1, 60, write=write)
+        buffer.enqueue(MUTANT_DNA, True)
+        self.assertTrue(writing.wait(5))
+
+        start = monotonic()
+        buffer.close(timeout=0.1)
+        self.assertLess(monotonic() - start, 1)
+        self.assertEqual(len(buffer), 1)
+
+        release.set()
+        self.assertTrue(self.written.wait(5))
+
+    def test_close_writes_what_is_left(self):
+        buffer = LogBuffer(100, 60, write=self._write)
+        buffer.enqueue(MUTANT_DNA, True)
+        buffer.enqueue(HUMAN_DNA, False)
+
+        self.assertEqual(buffer.close(), 2)
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(self.groups, [
+            [(MUTANT_DNA, True), (HUMAN_DNA, False)],
+        ])
+
+        # Once closed, logs are written right away
+        buffer.enqueue(MUTANT_DNA, True)
+        self.assertEqual(self.groups[-1], [(MUTANT_DNA, True)])
+
+    def test_enqueue_waits_when_buffer_is_full(self):
+        release = Event()
+
+        def write(records):
+            release.wait(5)
+            self._write(records)
+
+        buffer = LogBuffer(1, 60, max_pending=2, write=write)
+        buffer.enqueue(MUTANT_DNA, True)
+        buffer.enqueue(HUMAN_DNA, False)
+
+        third = Thread(target=buffer.enqueue, args=(MUTANT_DNA, False))
+        third.start()
+        third.join(0.1)
+        self.assertTrue(third.is_alive())
+        self.assertEqual(len(buffer), 2)
+
+        release.set()
+        third.join(5)
+        self.assertFalse(third.is_alive())
+        buffer.close()
+        self.assertEqual(
+            [record for group in self.groups for record in group],
+            [(MUTANT_DNA, True), (HUMAN_DNA, False), (MUTANT_DNA, False)],
+        )
+
+    def test_failed_write_is_dropped(self):
+        def write(records):
+            raise RuntimeError('database is locked')
+
+        buffer = LogBuffer(100, 60, write=write)
+        buffer.enqueue(MUTANT_DNA, True)
+
+        with self.assertLogs('app.mutant.log_buffer', 'ERROR'):
+            buffer.close()
+        self.assertEqual(len(buffer), 0)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            LogBuffer(0, 1)
+        with self.assertRaises(ValueError):
+            LogBuffer(1, 0)
+        self.assertEqual(LogBuffer(10, 1, max_pending=5).max_pending, 10)
+
+
+class BufferedMutantEndpointTests(TestCase):
+    """
+    The delay is long enough for the flusher not to write: logs are written
+    by flush, in the connection of the test.
+    """
+
+    def tearDown(self):
+        log_buffer.close_log_buffer()
+
+    def test_buffer_is_disabled_by_default(self):
+        self.assertIsNone(get_log_buffer())
+
+    @override_settings(
+        MUTANT_LOG_BUFFER_SIZE=100,
+        MUTANT_LOG_BUFFER_DELAY=3600,
+    )
+    def test_logs_are_written_on_flush(self):
+        url = reverse('mutant:mutant-list')
+        self.client.post(url, data={'dna': MUTANT_DNA})
+        self.client.post(url, data={'dna': HUMAN_DNA})
+        response = self.client.post(url, data={'dna': MUTANT_DNA})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(LogRequest.objects.count(), 0)
+
+        self.assertEqual(get_log_buffer().flush(), 3)
+        self.assertEqual(LogRequest.objects.count(), 3)
+        self.assertEqual(DNAFingerprint.objects.count(), 3)
+
+        stats = LogRequestStatistics.objects.get(pk=1)
+        self.assertEqual(stats.count_mutant_dna, 2)
+        self.assertEqual(stats.count_human_dna, 1)
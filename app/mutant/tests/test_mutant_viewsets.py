@@ -1,6 +1,9 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from app.mutant.analysis import configure_engine, get_verdict_cache
+from library.genetics.engines import available_engines
+
 
 class MutantEndpointTests(TestCase):
     def _get_url(self):
@@ -65,3 +68,143 @@ class MutantEndpointTests(TestCase):
         }
         response = self.client.post(self._get_url(), data=data)
         self.assertContains(response, 'DNA is mutant', status_code=200)
+
+    @override_settings(MUTANT_VERDICT_CACHE_SIZE=10)
+    def test_repeated_dna_uses_verdict_cache(self):
+        """ Tests resubmitted DNA is answered from the verdict cache """
+        cache = get_verdict_cache()
+        cache.clear()
+
+        data = {
+            'dna': [
+                "ATGCGA",
+                "CAGTGC",
+                "TTATGT",
+                "AGAAGG",
+                "CCCCTA",
+                "TCACTG"
+            ]
+        }
+        response = self.client.post(self._get_url(), data=data)
+        self.assertContains(response, 'DNA is mutant', status_code=200)
+
+        response = self.client.post(self._get_url(), data=data)
+        self.assertContains(response, 'DNA is mutant', status_code=200)
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.misses, 1)
+        self.assertEqual(statistics.hits, 1)
+
+    def test_every_engine_gives_the_same_response(self):
+        """ Tests the endpoint with each engine set in GENETICS_ENGINE """
+        mutant = {
+            'dna': [
+                "ATGCGA",
+                "CAGTGC",
+                "TTATGT",
+                "AGAAGG",
+                "CCCCTA",
+                "TCACTG"
+            ]
+        }
+        human = {
+            'dna': [
+                "TTATTT",
+                "CAGTGC",
+                "TTATTT",
+                "TTATTT",
+                "GCGTCA",
+                "TTATTT",
+            ]
+        }
+
+        try:
+            for name in available_engines() + ['auto']:
+                with self.subTest(engine=name), \
+                        override_settings(GENETICS_ENGINE=name):
+                    engine = configure_engine()
+                    if name != 'auto':
+                        self.assertEqual(engine.name, name)
+
+                    response = self.client.post(self._get_url(), data=mutant)
+                    self.assertContains(
+                        response, 'DNA is mutant', status_code=200
+                    )
+
+                    response = self.client.post(self._get_url(), data=human)
+                    self.assertContains(
+                        response, 'DNA is not mutant', status_code=403
+                    )
+        finally:
+            configure_engine()
+
+
+class MutantEditsEndpointTests(TestCase):
+    def _get_url(self):
+        return reverse('mutant:mutant-edits')
+
+    def test_edits_to_flip_human_dna(self):
+        """ Tests one substitution turning a human DNA into mutant """
+        data = {
+            'dna': [
+                "ATGCGA",
+                "CAGTGC",
+                "TTATGT",
+                "AGAAGG",
+                "CCCCTA",
+                "TCACTG"
+            ]
+        }
+        data['dna'][1] = 'CAGTGA'
+        data['dna'][2:] = ['AAAAAA'] * 4
+
+        response = self.client.post(
+            self._get_url(), data=data, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            'mutant': False,
+            'distance': 1,
+            'edits': [[{'row': 1, 'column': 5, 'base': 'C'}]],
+        })
+
+        # Nothing is logged as a checked DNA
+        response = self.client.get(reverse('mutant:stats-list'))
+        self.assertEqual(response.json()['count_human_dna'], 0)
+
+    def test_edits_to_flip_mutant_dna(self):
+        data = {
+            'dna': [
+                "ATGCGA",
+                "CAGTGC",
+                "TTATGT",
+                "AGAAGG",
+                "CCCCTA",
+                "TCACTG"
+            ],
+            'limit': 3,
+        }
+        response = self.client.post(
+            self._get_url(), data=data, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        content = response.json()
+        self.assertTrue(content['mutant'])
+        self.assertEqual(content['distance'], 5)
+        self.assertEqual(len(content['edits']), 3)
+        for edit_set in content['edits']:
+            self.assertEqual(len(edit_set), 5)
+
+    def test_invalid_dna(self):
+        data = {'dna': ["ATGCGA", "CAGTGC"]}
+        response = self.client.post(
+            self._get_url(), data=data, content_type='application/json'
+        )
+        self.assertContains(response, 'DNA is not valid', status_code=400)
+
+        data = {'dna': ["ATGCGA"] * 6, 'limit': 1000}
+        response = self.client.post(
+            self._get_url(), data=data, content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,153 @@
+import json
+from io import StringIO
+from random import Random
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+
+from app.mutant.models import DNAFingerprint, LogRequest
+from app.mutant.similarity import build_index, find_similar
+from library.genetics import PackedDNA
+from library.genetics.neighbourhood import dna_distance
+
+DNA_SEQUENCES = [
+    "ATGCGA",
+    "CAGTGC",
+    "TTATGT",
+    "AGAAGG",
+    "CCCCTA",
+    "TCACTG"
+]
+
+
+class SimilarityIndexTests(TestCase):
+    def _mutate(self, sequences, cells):
+        rows = [list(seq) for seq in sequences]
+        for row, column in cells:
+            rows[row][column] = 'A' if rows[row][column] != 'A' else 'C'
+        return [''.join(row) for row in rows]
+
+    def _log(self, sequences, mutant=False) -> LogRequest:
+        return LogRequest.objects.create(
+            dna_sequence=json.dumps(sequences),
+            mutant=mutant,
+        )
+
+    def test_index_updated_on_insert(self):
+        log = self._log(DNA_SEQUENCES, mutant=True)
+
+        fingerprint = DNAFingerprint.objects.get(log_request=log)
+        self.assertEqual(
+            [getattr(fingerprint, f'row_{i}') for i in range(6)],
+            list(PackedDNA.from_sequence_list(DNA_SEQUENCES).rows),
+        )
+
+        # Invalid DNAs are not indexed
+        log = LogRequest.objects.create(dna_sequence='["ATG"]', mutant=False)
+        self.assertFalse(DNAFingerprint.objects.filter(log_request=log))
+
+    def test_find_similar(self):
+        exact = self._log(DNA_SEQUENCES, mutant=True)
+        one = self._log(self._mutate(DNA_SEQUENCES, [(0, 0)]))
+        three = self._log(self._mutate(DNA_SEQUENCES, [(1, 1), (1, 2), (4, 5)]))
+        seven = self._log(self._mutate(
+            DNA_SEQUENCES, [(r, r) for r in range(6)] + [(0, 5)]
+        ))
+
+        self.assertEqual(find_similar(DNA_SEQUENCES, 0), [
+            (exact.pk, DNA_SEQUENCES, True, 0),
+        ])
+        self.assertEqual(
+            [s.log_request_id for s in find_similar(DNA_SEQUENCES, 3)],
+            [exact.pk, one.pk, three.pk],
+        )
+        self.assertEqual(
+            [s.distance for s in find_similar(DNA_SEQUENCES, 7)],
+            [0, 1, 3, 7],
+        )
+        self.assertEqual(len(find_similar(DNA_SEQUENCES, 7, limit=2)), 2)
+        self.assertEqual(find_similar(DNA_SEQUENCES, 7)[3].log_request_id,
+                         seven.pk)
+
+        with self.assertRaises(ValueError):
+            find_similar(DNA_SEQUENCES, 12)
+
+    def test_find_similar_matches_full_scan(self):
+        """ Tests the index against the distance to every logged DNA """
+        random = Random(18)
+        base = PackedDNA.from_sequence_list(DNA_SEQUENCES)
+
+        logs = []
+        for index in range(200):
+            cells = random.sample(
+                [(r, c) for r in range(6) for c in range(6)], index % 10
+            )
+            logs.append(self._log(self._mutate(DNA_SEQUENCES, cells)))
+
+        for distance in (0, 2, 5, 6, 9):
+            expected = sorted(
+                log.pk for log in logs
+                if dna_distance(
+                    base.rows,
+                    PackedDNA.from_sequence_list(
+                        json.loads(log.dna_sequence)
+                    ).rows,
+                ) <= distance
+            )
+            found = find_similar(DNA_SEQUENCES, distance, limit=None)
+            self.assertEqual(
+                sorted(s.log_request_id for s in found), expected
+            )
+
+    def test_build_index(self):
+        self._log(DNA_SEQUENCES)
+        self._log(self._mutate(DNA_SEQUENCES, [(0, 0)]))
+        DNAFingerprint.objects.all().delete()
+
+        self.assertEqual(build_index(batch_size=1), 2)
+        self.assertEqual(build_index(), 0)
+        self.assertEqual(build_index(rebuild=True), 2)
+
+    def test_commands(self):
+        self._log(DNA_SEQUENCES)
+        DNAFingerprint.objects.all().delete()
+
+        out = StringIO()
+        call_command('index_dna', stdout=out)
+        self.assertIn('Indexed 1 DNAs', out.getvalue())
+
+        out = StringIO()
+        call_command('similar_dna', *DNA_SEQUENCES, '--distance', '2',
+                     stdout=out)
+        self.assertIn('Found 1 similar DNAs', out.getvalue())
+        self.assertEqual(
+            json.loads(out.getvalue().splitlines()[0])['dna'], DNA_SEQUENCES
+        )
+
+        with self.assertRaises(CommandError):
+            call_command('similar_dna', 'ATGCGA', stdout=StringIO())
+
+    def test_endpoint(self):
+        log = self._log(DNA_SEQUENCES, mutant=True)
+
+        response = self.client.post(
+            reverse('mutant:mutant-similar'),
+            data={'dna': DNA_SEQUENCES, 'distance': 0},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'results': [{
+            'log_request_id': log.pk,
+            'dna': DNA_SEQUENCES,
+            'mutant': True,
+            'distance': 0,
+        }]})
+
+        response = self.client.post(
+            reverse('mutant:mutant-similar'),
+            data={'dna': DNA_SEQUENCES, 'distance': 20},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
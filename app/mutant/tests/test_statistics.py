@@ -0,0 +1,162 @@
+import json
+from io import StringIO
+from time import time
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from app.mutant.models import LogRequest, LogRequestStatistics
+from app.mutant.statistics import reconcile_statistics
+from app.mutant.stats_cache import get_stats_cache
+from app.mutant.tests.fixtures import HUMAN_DNA, MUTANT_DNA
+
+
+class StatisticsTests(TestCase):
+    def _log(self, mutant: bool) -> LogRequest:
+        return LogRequest.objects.create(
+            dna_sequence=json.dumps(MUTANT_DNA if mutant else HUMAN_DNA),
+            mutant=mutant,
+        )
+
+    def _stats(self) -> LogRequestStatistics:
+        return LogRequestStatistics.objects.get(pk=1)
+
+    def test_logs_increment_the_statistics(self):
+        reconcile_statistics()
+        for mutant in (True, False, True, False, False):
+            self._log(mutant)
+
+        stats = self._stats()
+        self.assertEqual(stats.count_mutant_dna, 2)
+        self.assertEqual(stats.count_human_dna, 3)
+
+    def test_no_count_when_logging(self):
+        reconcile_statistics()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(
+                reverse('mutant:mutant-list'), data={'dna': MUTANT_DNA}
+            )
+
+        self.assertFalse(any('COUNT(' in q['sql'] for q in queries))
+        self.assertEqual(self._stats().count_mutant_dna, 1)
+
+    def test_missing_statistics_are_counted(self):
+        self._log(True)
+        LogRequestStatistics.objects.all().delete()
+
+        self._log(False)
+        stats = self._stats()
+        self.assertEqual(stats.count_mutant_dna, 1)
+        self.assertEqual(stats.count_human_dna, 1)
+
+    def test_reconcile_in_chunks(self):
+        for mutant in (True, False, True, True, False):
+            self._log(mutant)
+        LogRequest.objects.filter(mutant=True).first().delete()
+        LogRequestStatistics.objects.filter(pk=1).update(
+            count_human_dna=100,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            stats = reconcile_statistics(chunk_size=2)
+        counts = [q for q in queries if 'COUNT(' in q['sql']]
+        self.assertEqual(len(counts), 3)
+
+        self.assertEqual(stats.count_mutant_dna, 2)
+        self.assertEqual(stats.count_human_dna, 2)
+        self.assertEqual(self._stats().count_human_dna, 2)
+
+        with self.assertRaises(ValueError):
+            reconcile_statistics(chunk_size=0)
+
+    def test_ratio_is_derived(self):
+        stats = LogRequestStatistics(count_human_dna=4, count_mutant_dna=2)
+        self.assertEqual(stats.ratio, 0.5)
+
+        stats = LogRequestStatistics(count_human_dna=0, count_mutant_dna=2)
+        self.assertEqual(stats.ratio, 0.0)
+
+    def test_stats_endpoint(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            reconcile_statistics()
+        response = self.client.get(reverse('mutant:stats-list'))
+        self.assertEqual(response.json()['count_human_dna'], 0)
+
+        for mutant in (True, False, False):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._log(mutant)
+
+        response = self.client.get(reverse('mutant:stats-list'))
+        self.assertEqual(response.json(), {
+            'count_human_dna': 2,
+            'count_mutant_dna': 1,
+            'ratio': '0.5',
+        })
+
+    def _change_out_of_process(self):
+        """ Changes the statistics without outdating the cache """
+        LogRequestStatistics.objects.filter(pk=1).update(count_human_dna=7)
+
+    def _poll(self, after: float = 0) -> dict:
+        """ Gets the statistics, after seconds on the clock of the cache """
+        self.now += after
+        return self.client.get(reverse('mutant:stats-list')).json()
+
+    def _poll_unchanged(self):
+        self.now = time()
+        clock = mock.patch.object(get_stats_cache(), 'clock', lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            reconcile_statistics()
+        self._poll()
+
+    def test_unchanged_statistics_never_query(self):
+        self._poll_unchanged()
+
+        for _ in range(3):
+            with self.assertNumQueries(0):
+                self.assertEqual(self._poll(after=10)['count_human_dna'], 0)
+
+        # Out of process changes are missed until the entry times out
+        self._change_out_of_process()
+        self.assertEqual(self._poll(after=10)['count_human_dna'], 0)
+
+    @override_settings(STATS_CACHE_REVALIDATE=5)
+    def test_revalidation_sees_out_of_process_changes(self):
+        self._poll_unchanged()
+        self._change_out_of_process()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._poll(after=4)['count_human_dna'], 0)
+
+        self.assertEqual(self._poll(after=2)['count_human_dna'], 7)
+
+        # Unchanged statistics are served again after a single query
+        with self.assertNumQueries(1):
+            self.assertEqual(self._poll(after=6)['count_human_dna'], 7)
+
+
+class ReconcileStatsCommandTests(TestCase):
+    def test_reconcile_stats(self):
+        LogRequest.objects.create(
+            dna_sequence=json.dumps(HUMAN_DNA), mutant=False
+        )
+        LogRequestStatistics.objects.filter(pk=1).update(count_human_dna=7)
+
+        out = StringIO()
+        call_command('reconcile_stats', '--chunk-size', '10', stdout=out)
+
+        self.assertIn('Counted 1 human and 0 mutant DNAs', out.getvalue())
+        self.assertEqual(
+            LogRequestStatistics.objects.get(pk=1).count_human_dna, 1
+        )
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_stats', '--chunk-size', '0')
@@ -0,0 +1,149 @@
+from django.test import SimpleTestCase, override_settings
+
+from app.mutant.stats_cache import (
+    LocalStatsCache,
+    UwsgiStatsCache,
+    get_stats_cache,
+)
+
+STATS = {'count_human_dna': 2, 'count_mutant_dna': 1, 'ratio': '0.5'}
+
+
+class FakeUwsgi:
+    """ Cache functions of the uWSGI API """
+
+    def __init__(self):
+        self.items = {}
+        self.locked = False
+
+    def cache_get(self, key):
+        return self.items.get(key)
+
+    def cache_update(self, key, value):
+        assert isinstance(value, bytes)
+        self.items[key] = value
+
+    def lock(self):
+        assert not self.locked
+        self.locked = True
+
+    def unlock(self):
+        self.locked = False
+
+
+class StatsCacheTests:
+    """ Cases every backend must pass. Subclasses build the cache. """
+
+    def setUp(self):
+        self.now = 1000.0
+
+    def _cache(self, **kwargs):
+        raise NotImplementedError
+
+    def _clock(self):
+        return self.now
+
+    def test_hit_until_invalidated(self):
+        cache = self._cache()
+        self.assertIsNone(cache.get())
+
+        cache.set(STATS, cache.version)
+        self.now += 10
+        self.assertEqual(cache.get().data, STATS)
+
+        cache.invalidate()
+        self.assertIsNone(cache.get())
+
+        cache.set({**STATS, 'count_human_dna': 3}, cache.version)
+        self.assertEqual(cache.get().data['count_human_dna'], 3)
+
+    def test_changes_while_reading_outdate_the_entry(self):
+        cache = self._cache()
+        version = cache.version
+        cache.invalidate()
+
+        cache.set(STATS, version)
+        self.assertIsNone(cache.get())
+
+    def test_outdated_entry_is_served_while_fresh_enough(self):
+        cache = self._cache(staleness=0.5)
+        cache.set(STATS, cache.version)
+        cache.invalidate()
+
+        self.now += 0.4
+        self.assertEqual(cache.get().data, STATS)
+        self.now += 0.1
+        self.assertIsNone(cache.get())
+
+    def test_timeout(self):
+        cache = self._cache(timeout=60)
+        entry = cache.set(STATS, cache.version)
+        self.assertEqual(entry.cached_at, 1000.0)
+
+        self.now += 60
+        self.assertEqual(cache.get(), entry)
+        self.now += 1
+        self.assertIsNone(cache.get())
+
+    def test_revalidation_is_due_after_revalidate(self):
+        cache = self._cache(revalidate=2)
+        entry = cache.set(STATS, cache.version)
+
+        self.now += 1.9
+        self.assertTrue(cache.is_fresh(entry))
+        self.now += 0.1
+        self.assertFalse(cache.is_fresh(entry))
+        self.assertEqual(cache.get(), entry)
+
+    def test_no_revalidation_by_default(self):
+        cache = self._cache()
+        entry = cache.set(STATS, cache.version)
+
+        self.now += 60 * 60
+        self.assertTrue(cache.is_fresh(entry))
+
+    def test_invalidate_bumps_version(self):
+        cache = self._cache()
+        version = cache.version
+
+        self.assertEqual(cache.invalidate(), version + 1)
+        self.assertEqual(cache.version, version + 1)
+
+
+class LocalStatsCacheTests(StatsCacheTests, SimpleTestCase):
+    def _cache(self, **kwargs):
+        return LocalStatsCache('stats', clock=self._clock, **kwargs)
+
+
+class UwsgiStatsCacheTests(StatsCacheTests, SimpleTestCase):
+    def _cache(self, **kwargs):
+        self.uwsgi = FakeUwsgi()
+        return UwsgiStatsCache(
+            'stats', clock=self._clock, uwsgi=self.uwsgi, **kwargs
+        )
+
+    def test_entry_is_shared_by_workers(self):
+        cache = self._cache()
+        other = UwsgiStatsCache('stats', clock=self._clock, uwsgi=self.uwsgi)
+
+        cache.set(STATS, cache.version)
+        self.assertEqual(other.get().data, STATS)
+
+        other.invalidate()
+        self.assertIsNone(cache.get())
+        self.assertFalse(self.uwsgi.locked)
+
+
+class GetStatsCacheTests(SimpleTestCase):
+    @override_settings(STATS_CACHE_BACKEND='auto', STATS_CACHE_STALENESS=250)
+    def test_local_outside_uwsgi(self):
+        cache = get_stats_cache()
+
+        self.assertIsInstance(cache, LocalStatsCache)
+        self.assertEqual(cache.staleness, 0.25)
+        self.assertIs(get_stats_cache(), cache)
+
+    @override_settings(STATS_CACHE_BACKEND='redis')
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_stats_cache()
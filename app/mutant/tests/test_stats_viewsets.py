@@ -1,5 +1,14 @@
+import json
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.http import http_date
+
+from app.mutant.models import LogRequest
+from app.mutant.statistics import reconcile_statistics
+from app.mutant.tests.fixtures import MUTANT_DNA
 
 
 class MutantEndpointTests(TestCase):
@@ -14,3 +23,62 @@ class MutantEndpointTests(TestCase):
         self.assertContains(response, 'count_mutant_dna', status_code=200)
         self.assertContains(response, 'ratio', status_code=200)
 
+
+class ConditionalStatsTests(TestCase):
+    def _get_url(self):
+        return reverse('mutant:stats-list')
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            reconcile_statistics()
+
+    def _log(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            LogRequest.objects.create(
+                dna_sequence=json.dumps(MUTANT_DNA), mutant=True
+            )
+
+    def test_validators(self):
+        response = self.client.get(self._get_url())
+
+        self.assertEqual(response['ETag'], '"0-0"')
+        self.assertNotIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+    def test_not_modified_without_database(self):
+        etag = self.client.get(self._get_url())['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                self._get_url(), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(len(queries), 0)
+
+    def test_if_modified_since_is_ignored(self):
+        """ Tests changes within the same second are still sent """
+        self.client.get(self._get_url())
+        self._log()
+
+        response = self.client.get(
+            self._get_url(), HTTP_IF_MODIFIED_SINCE=http_date()
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['count_mutant_dna'], 1)
+
+    def test_changed_statistics_are_sent(self):
+        etag = self.client.get(self._get_url())['ETag']
+        self._log()
+
+        response = self.client.get(self._get_url(), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['ETag'], '"0-1"')
+        self.assertEqual(response.json()['count_mutant_dna'], 1)
+
+        response = self.client.get(
+            self._get_url(), HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, 304)
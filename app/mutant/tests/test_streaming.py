@@ -0,0 +1,143 @@
+import io
+import json
+
+from django.core.handlers.wsgi import WSGIRequest
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from app.mutant.models import LogRequest, LogRequestStatistics
+from app.mutant.streaming import (
+    ChunkedReader,
+    iter_records,
+    request_body,
+    screen_stream,
+)
+from app.mutant.tests.fixtures import HUMAN_DNA, MUTANT_DNA
+
+
+def ndjson(*records) -> bytes:
+    return b''.join(
+        (r if isinstance(r, bytes) else json.dumps(r).encode()) + b'\n'
+        for r in records
+    )
+
+
+class CountingStream(io.BytesIO):
+    """ Body stream counting how many lines were read """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lines_read = 0
+
+    def readline(self, *args):
+        line = super().readline(*args)
+        if line:
+            self.lines_read += 1
+        return line
+
+
+class MutantStreamEndpointTests(TestCase):
+    def _get_url(self):
+        return reverse('mutant:mutant-stream')
+
+    def _post(self, body: bytes):
+        response = self.client.post(
+            self._get_url(),
+            data=body,
+            content_type='application/x-ndjson',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    @override_settings(MUTANT_STREAM_BATCH_SIZE=2)
+    def test_stream_verdicts(self):
+        results = self._post(ndjson(
+            {'dna': MUTANT_DNA},
+            HUMAN_DNA,
+            b'',
+            b'{"dna": ["ATGCGA"]}',
+            b'not json',
+            MUTANT_DNA,
+        ))
+
+        self.assertEqual(results[0], {'line': 1, 'mutant': True})
+        self.assertEqual(results[1], {'line': 2, 'mutant': False})
+        self.assertEqual(results[2]['line'], 4)
+        self.assertIn('DNA is not valid', results[2]['error'])
+        self.assertEqual(results[3]['line'], 5)
+        self.assertIn('error', results[3])
+        self.assertEqual(results[4], {'line': 6, 'mutant': True})
+
+        # Valid records are logged and counted, batch by batch
+        self.assertEqual(LogRequest.objects.count(), 3)
+        stats = LogRequestStatistics.objects.get(pk=1)
+        self.assertEqual(stats.count_mutant_dna, 2)
+        self.assertEqual(stats.count_human_dna, 1)
+
+    @override_settings(MUTANT_STREAM_MAX_LINE_LENGTH=100)
+    def test_long_records(self):
+        results = self._post(ndjson(
+            {'dna': MUTANT_DNA, 'padding': 'A' * 500},
+            MUTANT_DNA,
+        ))
+        self.assertEqual(results, [
+            {'line': 1, 'error': 'Record is longer than 100 bytes.'},
+            {'line': 2, 'mutant': True},
+        ])
+
+    def test_only_get_is_not_allowed(self):
+        response = self.client.get(self._get_url())
+        self.assertEqual(response.status_code, 405)
+
+
+class StreamingTests(TestCase):
+    def test_records_are_read_as_results_are_streamed(self):
+        stream = CountingStream(ndjson(*[MUTANT_DNA] * 10))
+        results = screen_stream(stream, batch_size=2, max_line_length=1000)
+
+        first = json.loads(next(results))
+        self.assertEqual(first, {'line': 1, 'mutant': True})
+        self.assertEqual(stream.lines_read, 2)
+
+        self.assertEqual(len(list(results)), 9)
+        self.assertEqual(LogRequest.objects.count(), 10)
+
+    def test_iter_records(self):
+        stream = io.BytesIO(b'short\n' + b'x' * 25 + b'\nlast')
+        self.assertEqual(list(iter_records(stream, 10)), [
+            (1, b'short'),
+            (2, None),
+            (3, b'last'),
+        ])
+
+    def test_chunked_reader(self):
+        chunks = iter([b'ab', b'c\nde', b'f\n\ng', b'h', b''])
+        reader = ChunkedReader(lambda: next(chunks))
+
+        self.assertEqual(reader.readline(), b'abc\n')
+        self.assertEqual(reader.readline(2), b'de')
+        self.assertEqual(reader.readline(), b'f\n')
+        self.assertEqual(reader.readline(), b'\n')
+        self.assertEqual(reader.readline(), b'gh')
+        self.assertEqual(reader.readline(), b'')
+
+    def test_request_body_of_chunked_upload(self):
+        """ Tests chunked uploads, without length, read from wsgi.input """
+        body = ndjson(MUTANT_DNA)
+        request = RequestFactory().post(
+            '/mutant/stream/', data=body,
+            content_type='application/x-ndjson',
+        )
+        self.assertEqual(request_body(request).readline(), body)
+
+        environ = dict(request.environ)
+        del environ['CONTENT_LENGTH']
+        environ['HTTP_TRANSFER_ENCODING'] = 'chunked'
+        environ['wsgi.input'] = io.BytesIO(body)
+        request = WSGIRequest(environ)
+
+        # Django reads nothing without a length
+        self.assertEqual(request.readline(), b'')
+        self.assertEqual(request_body(request).readline(), body)
@@ -1,6 +1,7 @@
+from django.urls import path
 from rest_framework import routers
 
-from app.mutant import viewsets
+from app.mutant import views, viewsets
 
 app_name = 'mutant'
 
@@ -8,4 +9,10 @@ router = routers.SimpleRouter()
 router.register(r'stats', viewsets.StatisticsViewset, basename='stats')
 router.register(r'mutant', viewsets.MutantViewset, basename='mutant')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path(
+        'mutant/stream/',
+        views.MutantStreamView.as_view(),
+        name='mutant-stream'
+    ),
+] + router.urls
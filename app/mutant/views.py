@@ -0,0 +1,62 @@
+from typing import Optional
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from .stats_cache import CachedStatistics
+from .statistics import statistics_etag
+from .streaming import request_body, screen_stream
+
+
+def statistics_not_modified(request,
+                            entry: CachedStatistics
+                            ) -> Optional[HttpResponse]:
+    """
+    Answers conditional requests of statistics the client already has. There
+    is no Last-Modified, as its whole seconds would hide the changes made in
+    the same second: the ETag alone tells the statistics apart.
+    :param request: GET request, maybe with If-None-Match
+    :param entry: current statistics
+    :return: 304 response, None when the statistics must be sent
+    """
+    response = get_conditional_response(
+        request,
+        etag=statistics_etag(entry),
+    )
+    return response and set_statistics_validators(response, entry)
+
+
+def set_statistics_validators(response: HttpResponse,
+                              entry: CachedStatistics) -> HttpResponse:
+    """
+    Sets the ETag of the statistics, and makes clients revalidate them
+    before using a copy.
+    """
+    response['ETag'] = statistics_etag(entry)
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class MutantStreamView(View):
+    """
+    Screens a newline-delimited JSON body of DNAs, one per line, streaming
+    one verdict per line back as the records are read. It does not go
+    through DRF, which parses the whole body at once.
+    """
+    http_method_names = ['post']
+
+    def post(self, request, *args, **kwargs):
+        results = screen_stream(
+            request_body(request),
+            settings.MUTANT_STREAM_BATCH_SIZE,
+            settings.MUTANT_STREAM_MAX_LINE_LENGTH,
+        )
+        return StreamingHttpResponse(
+            results,
+            content_type='application/x-ndjson'
+        )
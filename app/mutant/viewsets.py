@@ -1,16 +1,23 @@
-import json
-
 from django.forms.models import model_to_dict
-from django.conf import settings
-from cacheops import file_cache, CacheMiss
 from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from library.genetics import Analyser, DNA, CodonPair, AminoAcid
+from library.genetics import DNA, DNASequenceError
+from library.genetics.neighbourhood import minimal_edits
+from .analysis import analyse_sequences, get_analysis_engine
+from .batch import analyse_batch
+from .log_buffer import log_dna
+from .similarity import find_similar
+from .statistics import load_statistics
+from .views import set_statistics_validators, statistics_not_modified
 from .serializers import (
     StatisticsSerializer,
     LogRequestSerializer,
     MutantSerializer,
+    MutantEditsSerializer,
+    MutantBatchSerializer,
+    SimilarDNASerializer,
 )
 
 
@@ -22,29 +29,16 @@ class MutantViewset(mixins.CreateModelMixin, viewsets.GenericViewSet):
         mutant_serializer = MutantSerializer(data=request.data)
         mutant_serializer.is_valid(raise_exception=True)
 
-        dna = DNA()
-
-        for seq in mutant_serializer.validated_data['dna']:
-            dna.append(CodonPair(
-                (AminoAcid[seq[0]], AminoAcid[seq[1]], AminoAcid[seq[2]]),
-                (AminoAcid[seq[3]], AminoAcid[seq[4]], AminoAcid[seq[5]]),
-            ))
-
-        if dna.is_valid() is False:
+        sequences = mutant_serializer.validated_data['dna']
+        try:
+            is_mutant = analyse_sequences(sequences)
+        except DNASequenceError as e:
             return Response(
-                {'message': 'DNA is not valid.'},
+                {'message': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        analyser = Analyser()
-        is_mutant = analyser.is_mutant(dna)
-
-        log = LogRequestSerializer(data={
-            'mutant': is_mutant,
-            'dna_sequence': json.dumps(mutant_serializer.validated_data['dna'])
-        })
-        log.is_valid(raise_exception=True)
-        self.perform_create(log)
+        log_dna(sequences, is_mutant)
 
         if is_mutant is False:
             return Response(
@@ -61,44 +55,104 @@ class MutantViewset(mixins.CreateModelMixin, viewsets.GenericViewSet):
             headers=self.get_success_headers(mutant_serializer.validated_data)
         )
 
+    @action(detail=False, methods=['post'],
+            serializer_class=MutantBatchSerializer)
+    def batch(self, request, *args, **kwargs):
+        """
+        Checks many DNAs at once, logging them with a single insert and
+        updating the statistics once.
+        """
+        serializer = MutantBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-class StatisticsViewset(mixins.ListModelMixin, viewsets.GenericViewSet):
-    serializer_class = StatisticsSerializer
-    queryset = StatisticsSerializer.Meta.model.objects.get_queryset()
-    http_method_names = ['get']
+        items = analyse_batch(serializer.validated_data['dnas'])
+        mutants = sum(item.mutant is True for item in items)
+        humans = sum(item.mutant is False for item in items)
 
-    def get_object(self):
-        queryset = self.get_queryset()
-        model_class = StatisticsSerializer.Meta.model
+        return Response(
+            {
+                'count_mutant_dna': mutants,
+                'count_human_dna': humans,
+                'count_invalid_dna': len(items) - mutants - humans,
+                'results': [item.to_dict() for item in items],
+            },
+            status=status.HTTP_200_OK
+        )
 
-        instance = None
+    @action(detail=False, methods=['post'],
+            serializer_class=MutantEditsSerializer)
+    def edits(self, request, *args, **kwargs):
+        """
+        Finds the fewest amino acid substitutions that flip the verdict of
+        the DNA, with up to limit of the minimal edit sets.
+        """
+        serializer = MutantEditsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
         try:
-            data = file_cache.get(settings.STATS_CACHE_KEY)
-            instance = model_class(**data)
-        except CacheMiss:
-            pass
-
-        if instance is None:
-            try:
-                instance = queryset.get(pk=1)
-            except model_class.DoesNotExist:
-                instance = model_class(
-                    count_human_dna=0,
-                    count_mutant_dna=0,
-                    ratio=0.0,
-                )
-
-            data = {
-                'count_human_dna': instance.count_human_dna,
-                'count_mutant_dna': instance.count_mutant_dna,
-                'ratio': instance.ratio
-            }
-            file_cache.set(settings.STATS_CACHE_KEY, data, timeout=60 * 60)
-
-        return instance
+            dna = DNA.from_strings(serializer.validated_data['dna'])
+        except DNASequenceError as e:
+            return Response(
+                {'message': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = minimal_edits(
+            dna,
+            get_analysis_engine().reference,
+            limit=serializer.validated_data['limit'],
+        )
+
+        return Response(
+            {
+                'mutant': result.is_mutant,
+                'distance': result.distance,
+                'edits': [
+                    [substitution._asdict() for substitution in edit_set]
+                    for edit_set in result.edit_sets
+                ],
+            },
+            status=status.HTTP_200_OK
+        )
+
+    @action(detail=False, methods=['post'],
+            serializer_class=SimilarDNASerializer)
+    def similar(self, request, *args, **kwargs):
+        """
+        Finds the logged DNAs within a distance of amino acids of the DNA.
+        """
+        serializer = SimilarDNASerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            similar = find_similar(
+                serializer.validated_data['dna'],
+                serializer.validated_data['distance'],
+                serializer.validated_data['limit'],
+            )
+        except DNASequenceError as e:
+            return Response(
+                {'message': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(
+            {'results': [s._asdict() for s in similar]},
+            status=status.HTTP_200_OK
+        )
+
+
+class StatisticsViewset(mixins.ListModelMixin, viewsets.GenericViewSet):
+    serializer_class = StatisticsSerializer
+    queryset = StatisticsSerializer.Meta.model.objects.get_queryset()
+    http_method_names = ['get']
 
     def list(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        # A cached copy of the statistics answers conditional requests
+        # without the database
+        entry = load_statistics()
+        not_modified = statistics_not_modified(request, entry)
+        if not_modified is not None:
+            return not_modified
+
+        return set_statistics_validators(Response(entry.data), entry)
@@ -9,5 +9,16 @@ echo " > Iniciando SERVER"
 echo ;
 echo "########################################################################"
 echo ;
-source /app_conf/env/docker/uwsgi-env.sh
-uwsgi --enable-threads --cache 5000 --thunder-lock --show-config --static-map /static/=/code/static/ --static-map /media/=/code/media/
+if [ "$SERVER_INTERFACE" = "asgi" ]; then
+    source /app_conf/env/docker/uvicorn-env.sh
+    ulimit -n "$UVICORN_NOFILE"
+    uvicorn "$UVICORN_APP" --host "$UVICORN_HOST" --port "$UVICORN_PORT" \
+        --workers "$UVICORN_WORKERS" --loop "$UVICORN_LOOP" \
+        --http "$UVICORN_HTTP" --backlog "$UVICORN_BACKLOG" \
+        --limit-concurrency "$UVICORN_LIMIT_CONCURRENCY" \
+        --timeout-keep-alive "$UVICORN_TIMEOUT_KEEP_ALIVE" \
+        --no-access-log
+else
+    source /app_conf/env/docker/uwsgi-env.sh
+    uwsgi --enable-threads --cache 5000 --thunder-lock --show-config --static-map /static/=/code/static/ --static-map /media/=/code/media/
+fi
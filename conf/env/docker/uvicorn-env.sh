@@ -0,0 +1,30 @@
+#!/usr/bin/env bash
+
+# ASGI server (SERVER_INTERFACE=asgi): Uvicorn running project/asgi.py, where
+# /mutant/ and /stats/ are native async views (see app/mutant/async_views.py)
+export UVICORN_APP=project.asgi:application
+export UVICORN_HOST=0.0.0.0
+export UVICORN_PORT=8000
+
+# One event loop per worker; idle keep-alive connections only cost a few KB,
+# so each worker holds thousands of them
+export UVICORN_WORKERS=2
+export UVICORN_LOOP=uvloop
+export UVICORN_HTTP=httptools
+
+# Connections served at once per worker before answering 503, pending
+# connections queued by the kernel, and seconds an idle keep-alive
+# connection is kept open
+export UVICORN_LIMIT_CONCURRENCY=10000
+export UVICORN_BACKLOG=4096
+export UVICORN_TIMEOUT_KEEP_ALIVE=75
+
+# Every connection is a file descriptor
+export UVICORN_NOFILE=65535
+
+# Threads per worker running the database calls of the async views
+export ASYNC_DB_THREADS=8
+
+# Statistics are cached in the memory of each worker, which does not see the
+# logs of the other workers until the cached statistics are revalidated
+export STATS_CACHE_REVALIDATE=1
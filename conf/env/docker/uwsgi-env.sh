@@ -12,6 +12,9 @@ export UWSGI_SOCKET=127.0.0.1:49152
 
 export UWSGI_HTTP=:8000
 export UWSGI_HTTP_AUTO_CHUNKED=1
+# Chunked uploads reach the app in raw mode and are read incrementally with
+# uwsgi.chunked_read (see app/mutant/streaming.py)
+export UWSGI_HTTP_CHUNKED_INPUT=1
 export UWSGI_HTTP_KEEPALIVE=1
 
 export UWSGI_MASTER=1
@@ -1,3 +1,6 @@
+from .packed import *
+from .cache import *
 from .codon_pair import *
 from .dna import *
 from .analyser import *
+from .mutable import *
@@ -1,5 +1,14 @@
+from types import MappingProxyType
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
+
 from . import DNA
+from .automaton import SequenceMatcher
 from .codon_pair import CodonPair, AminoAcid
+from .grid import Direction
+from .packed import PackedDNA
+
+# Number of matching sequences needed to flag a DNA as mutant
+MUTANT_THRESHOLD = 2
 
 
 class InsufficientCodonPairsError(Exception):
@@ -9,15 +18,117 @@ class InsufficientCodonPairsError(Exception):
     pass
 
 
+class RowMatch(NamedTuple):
+    """ A row of the analysed DNA found in the reference """
+    row: int
+    sequence: str
+    directions: Tuple[Direction, ...]
+
+
+class AnalysisReport(NamedTuple):
+    """
+    Attributes:
+        is_mutant   Whether the DNA is mutant or not.
+        matches     Rows of the DNA found in the reference and the
+                    directions they were found in.
+        threshold   Number of matches needed to flag the DNA as mutant.
+        complete    Whether every row was scanned. When details are not
+                    requested, scanning stops once the threshold is reached.
+    """
+    is_mutant: bool
+    matches: Tuple[RowMatch, ...]
+    threshold: int
+    complete: bool
+
+
+class CompiledReference:
+    """
+    Immutable index of every line (rows, columns and obliques) of a reference
+    DNA, as a set of packed codon pair codes. Checking whether a codon pair
+    has its sequence in the reference is then a single set lookup.
+
+    Attributes:
+        packed      Packed reference DNA.
+        lines       Packed codes of the reference lines.
+        directions  Directions each packed code is found in the reference.
+    """
+    __slots__ = ('packed', 'lines', 'directions')
+
+    def __init__(self, packed: PackedDNA):
+        """
+        :param packed: packed reference DNA
+        """
+        directions = {}
+        lines = [(code, Direction.HORIZONTAL) for code in packed.rows]
+        lines += [(code, Direction.VERTICAL) for code in packed.columns]
+        lines.append((packed.top_left_oblique, Direction.TOP_LEFT_OBLIQUE))
+        lines.append(
+            (packed.bottom_left_oblique, Direction.BOTTOM_LEFT_OBLIQUE)
+        )
+
+        for code, direction in lines:
+            code_directions = directions.setdefault(code, ())
+            if direction not in code_directions:
+                directions[code] = code_directions + (direction,)
+
+        object.__setattr__(self, 'packed', packed)
+        object.__setattr__(self, 'lines', frozenset(directions))
+        object.__setattr__(self, 'directions', MappingProxyType(directions))
+
+    def __setattr__(self, key, value):
+        raise AttributeError('CompiledReference is immutable')
+
+    @classmethod
+    def from_dna(cls, dna: DNA) -> 'CompiledReference':
+        return cls(dna.to_packed())
+
+    def has_code(self, code: int) -> bool:
+        """
+        Checks whether a packed codon pair is one of the reference lines.
+        :param code: packed codon pair
+        :return: whether the sequence exists in the reference
+        """
+        return code in self.lines
+
+
 class Analyser:
     """
     Responsible to execute DNA analysis to find out whether an DNA is
     mutant or not.
     """
 
-    def __init__(self):
-        # Creating reference DNA for analysis
-        self.mutant_dna = self._create_mutant_dna()
+    def __init__(self,
+                 reference: Optional[CompiledReference] = None,
+                 matcher: Optional[SequenceMatcher] = None):
+        """
+        :param reference: compiled reference DNA. The mutant reference,
+            compiled once per process, is used if none is provided.
+        :param matcher: automaton of the reference lines. When provided, the
+            DNA is scanned by it in a single pass instead of looking up each
+            codon pair in the reference.
+        """
+        self.reference = reference or MUTANT_REFERENCE
+        self.matcher = matcher
+        self._mutant_dna = None
+
+    @classmethod
+    def with_automaton(cls,
+                       reference: Optional[CompiledReference] = None
+                       ) -> 'Analyser':
+        """
+        Builds an analyser using an Aho-Corasick automaton as engine.
+        :param reference: compiled reference DNA, the mutant one by default
+        :return: analyser instance
+        """
+        reference = reference or MUTANT_REFERENCE
+        return cls(reference, SequenceMatcher.from_reference(reference))
+
+    @property
+    def mutant_dna(self) -> DNA:
+        """ Reference DNA as codon pairs, only built when requested """
+        if self._mutant_dna is None:
+            self._mutant_dna = DNA.from_packed(self.reference.packed)
+        return self._mutant_dna
 
     def is_mutant(self, dna: DNA) -> bool:
         """
@@ -26,15 +137,108 @@ class Analyser:
         :param dna: DNA provided
         :return: whether DNA is mutant or not
         """
+        return self.analyse(dna).is_mutant
+
+    def analyse(self,
+                dna: DNA,
+                threshold: int = MUTANT_THRESHOLD,
+                details: bool = False) -> AnalysisReport:
+        """
+        Finds the rows of the DNA that exist in the reference. Unless details
+        are requested, scanning stops as soon as the threshold is reached.
+        :param dna: DNA provided
+        :param threshold: number of matching rows to flag DNA as mutant
+        :param details: whether every row must be scanned
+        :return: report of the analysis
+        """
         self._check_dna(dna)
 
-        has_sequences = [
-            pair for pair in dna
-            if self.mutant_dna.has_sequence(pair)
-        ]
+        directions = self.reference.directions
+        matches = []
+        complete = True
 
-        # If more than 1 existent sequence, dna provided is mutant
-        return len(has_sequences) > 1
+        for index, pair in self._find_rows(dna):
+            pair_directions = directions.get(pair.code, ())
+            matches.append(RowMatch(index, pair.sequence, pair_directions))
+
+            if not details and len(matches) >= threshold:
+                complete = index == len(dna) - 1
+                break
+
+        return AnalysisReport(
+            is_mutant=len(matches) >= threshold,
+            matches=tuple(matches),
+            threshold=threshold,
+            complete=complete,
+        )
+
+    def _find_rows(self, dna: DNA):
+        """ Yields index and codon pair of the rows found in the reference """
+        if self.matcher is None:
+            lines = self.reference.lines
+            for index, pair in enumerate(dna):
+                if pair.code in lines:
+                    yield index, pair
+            return
+
+        # A single pass over the whole DNA: only hits of a full row count
+        sequence = ''.join(pair.sequence for pair in dna)
+        length = len(sequence) // len(dna)
+        for hit in self.matcher.scan(sequence):
+            if hit.offset % length == 0 and len(hit.pattern) == length:
+                index = hit.offset // length
+                yield index, dna[index]
+
+    def is_mutant_packed(self, packed: PackedDNA) -> bool:
+        """
+        Checks whether a packed DNA is mutant, without building codon pairs.
+        :param packed: packed DNA provided
+        :return: whether DNA is mutant or not
+        """
+        lines = self.reference.lines
+        matches = 0
+        for code in packed.rows:
+            if code in lines:
+                matches += 1
+                if matches >= MUTANT_THRESHOLD:
+                    return True
+        return False
+
+    def is_mutant_batch(self, batch):
+        """
+        Checks many DNAs at once with vectorized NumPy operations.
+        :param batch: (N, 6, 6) array of amino acid codes (A=0, C=1, G=2,
+            T=3) or (N, 6) array of packed codon pair codes
+        :return: BatchResult with verdicts and number of matching rows per DNA
+        """
+        from .vectorized import analyse_batch
+        return analyse_batch(batch, self.reference.lines, MUTANT_THRESHOLD)
+
+    def is_mutant_bitsliced(self,
+                            dnas: Iterable[Union[DNA, PackedDNA]],
+                            block_size: Optional[int] = None) -> List[bool]:
+        """
+        Checks many DNAs at once with bit-sliced operations in pure Python,
+        for batches where NumPy is not available.
+        :param dnas: DNAs or packed DNAs provided
+        :param block_size: number of DNAs evaluated together
+        :return: whether each DNA is mutant or not, in order
+        """
+        from .bitsliced import BLOCK_SIZE, analyse_packed
+
+        def packed():
+            for dna in dnas:
+                if isinstance(dna, DNA):
+                    self._check_dna(dna)
+                    dna = dna.to_packed()
+                yield dna
+
+        return analyse_packed(
+            packed(),
+            self.reference.lines,
+            MUTANT_THRESHOLD,
+            block_size or BLOCK_SIZE,
+        )
 
     @staticmethod
     def _create_mutant_dna() -> DNA:
@@ -84,3 +288,8 @@ class Analyser:
             raise InsufficientCodonPairsError(
                 f'DNA is not valid. It has {len(dna)} codon pairs only.'
             )
+
+
+# Reference of mutant DNA compiled once per process and shared by every
+# Analyser instance. It is immutable, so it is safe to share among threads.
+MUTANT_REFERENCE = CompiledReference.from_dna(Analyser._create_mutant_dna())
@@ -0,0 +1,121 @@
+from collections import deque
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+from .codon_pair import InvalidSequenceError
+from .packed import BASES, BASE_CODES, pair_code_to_string
+
+_ALPHABET = len(BASES)
+
+
+class SequenceHit(NamedTuple):
+    """ A pattern found in a sequence, starting at offset """
+    offset: int
+    pattern: str
+
+
+class SequenceMatcher:
+    """
+    Aho-Corasick automaton built once from a set of reference patterns of
+    any length. Scanning a sequence is a single linear pass, whatever the
+    number of patterns, reporting every occurrence of every pattern.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        :param patterns: reference sequences of amino acid letters
+        """
+        self.patterns = tuple(dict.fromkeys(patterns))
+        if not self.patterns:
+            raise InvalidSequenceError('At least one pattern is required.')
+
+        self._transitions, self._outputs = self._build(self.patterns)
+
+    @classmethod
+    def from_reference(cls, reference) -> 'SequenceMatcher':
+        """
+        :param reference: CompiledReference whose lines become patterns
+        :return: matcher of the reference lines
+        """
+        return cls(sorted(pair_code_to_string(c) for c in reference.lines))
+
+    @property
+    def states(self) -> int:
+        return len(self._outputs)
+
+    @staticmethod
+    def _build(patterns: Tuple[str, ...]):
+        # Trie of the patterns, -1 for missing transitions
+        transitions = [-1] * _ALPHABET
+        outputs: List[Tuple[int, ...]] = [()]
+
+        for index, pattern in enumerate(patterns):
+            if not pattern:
+                raise InvalidSequenceError('Patterns cannot be empty.')
+
+            state = 0
+            for position, letter in enumerate(pattern):
+                code = BASE_CODES.get(letter)
+                if code is None:
+                    raise InvalidSequenceError(
+                        f'Invalid amino acid {letter!r} at position'
+                        f' {position} of pattern {pattern}.'
+                    )
+                slot = state * _ALPHABET + code
+                if transitions[slot] == -1:
+                    transitions[slot] = len(outputs)
+                    transitions.extend([-1] * _ALPHABET)
+                    outputs.append(())
+                state = transitions[slot]
+            outputs[state] += (index,)
+
+        # Breadth-first pass turning the trie into a complete automaton:
+        # missing transitions follow the failure links.
+        failures = [0] * len(outputs)
+        queue = deque()
+
+        for code in range(_ALPHABET):
+            child = transitions[code]
+            if child == -1:
+                transitions[code] = 0
+            else:
+                queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            failure = failures[state]
+            outputs[state] += outputs[failure]
+
+            for code in range(_ALPHABET):
+                slot = state * _ALPHABET + code
+                child = transitions[slot]
+                fallback = transitions[failure * _ALPHABET + code]
+                if child == -1:
+                    transitions[slot] = fallback
+                else:
+                    failures[child] = fallback
+                    queue.append(child)
+
+        return transitions, outputs
+
+    def scan(self, sequence: str) -> Iterator[SequenceHit]:
+        """
+        Lazily finds every pattern occurrence, ordered by where they end.
+        :param sequence: amino acid letters
+        :return: hits with the offset each pattern starts at
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        patterns = self.patterns
+        state = 0
+
+        for position, letter in enumerate(sequence):
+            code = BASE_CODES.get(letter)
+            if code is None:
+                raise InvalidSequenceError(
+                    f'Invalid amino acid {letter!r} at position {position}.'
+                )
+
+            state = transitions[state * _ALPHABET + code]
+            for index in outputs[state]:
+                pattern = patterns[index]
+                yield SequenceHit(position - len(pattern) + 1, pattern)
@@ -0,0 +1,9 @@
+"""
+Benchmarks of the hot paths of the genetics library.
+
+Usage:
+    python -m library.genetics.benchmarks --sizes 1,100,10000 \
+        --output results.json --baseline baseline.json --threshold 0.1
+"""
+from .cases import *
+from .runner import *
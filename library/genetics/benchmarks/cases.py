@@ -0,0 +1,91 @@
+from random import Random
+from typing import Any, Callable, List, NamedTuple
+
+from ..analyser import Analyser
+from ..codon_pair import AminoAcid, CodonPair
+from ..dna import DNA
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    A hot path to be measured.
+
+    Attributes:
+        name        Identifier of the case in the results.
+        prepare     Builds the inputs of a batch: (batch size, random) -> list
+        run         Operation executed once per input.
+    """
+    name: str
+    prepare: Callable[[int, Random], List[Any]]
+    run: Callable[[Any], Any]
+
+
+def _random_codons(random: Random):
+    amino_acids = list(AminoAcid)
+    return (
+        tuple(random.choice(amino_acids) for _ in range(3)),
+        tuple(random.choice(amino_acids) for _ in range(3)),
+    )
+
+
+def _random_pairs(size: int, random: Random) -> List[CodonPair]:
+    return [CodonPair(*_random_codons(random)) for _ in range(size)]
+
+
+def _random_dna_pairs(size: int, random: Random) -> List[List[CodonPair]]:
+    return [_random_pairs(6, random) for _ in range(size)]
+
+
+def _build_dna(pairs: List[CodonPair]) -> DNA:
+    dna = DNA()
+    for pair in pairs:
+        dna.append(pair)
+    return dna
+
+
+def _random_dnas(size: int, random: Random) -> List[DNA]:
+    return [_build_dna(pairs) for pairs in _random_dna_pairs(size, random)]
+
+
+_analyser = Analyser()
+
+
+CASES = (
+    BenchmarkCase(
+        name='codon_pair_construction',
+        prepare=lambda size, random: [
+            _random_codons(random) for _ in range(size)
+        ],
+        run=lambda codons: CodonPair(*codons),
+    ),
+    BenchmarkCase(
+        name='codon_pair_sequence',
+        prepare=_random_pairs,
+        run=lambda pair: pair.sequence,
+    ),
+    BenchmarkCase(
+        # Appends 6 pairs, including the column and oblique build
+        name='dna_append',
+        prepare=_random_dna_pairs,
+        run=_build_dna,
+    ),
+    BenchmarkCase(
+        # Parses and validates the raw sequences of a request
+        name='dna_from_strings',
+        prepare=lambda size, random: [
+            [pair.sequence for pair in pairs]
+            for pairs in _random_dna_pairs(size, random)
+        ],
+        run=DNA.from_strings,
+    ),
+    BenchmarkCase(
+        name='dna_has_sequence',
+        prepare=_random_pairs,
+        run=_analyser.mutant_dna.has_sequence,
+    ),
+    BenchmarkCase(
+        name='analyser_is_mutant',
+        prepare=_random_dnas,
+        run=_analyser.is_mutant,
+    ),
+)
@@ -0,0 +1,80 @@
+import argparse
+from typing import List, Optional
+
+from .cases import CASES
+from .runner import (
+    DEFAULT_BATCH_SIZES,
+    compare,
+    format_regressions,
+    format_results,
+    load,
+    run_benchmarks,
+    save,
+)
+
+
+def parse_sizes(value: str) -> List[int]:
+    try:
+        sizes = [int(float(size)) for size in value.split(',') if size]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Invalid batch sizes: {value}')
+
+    if not sizes or min(sizes) < 1:
+        raise argparse.ArgumentTypeError('Batch sizes must be at least 1.')
+    return sizes
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--sizes',
+        type=parse_sizes,
+        default=list(DEFAULT_BATCH_SIZES),
+        help='Comma separated batch sizes, e.g. 1,1e3,1e6',
+    )
+    parser.add_argument(
+        '--cases',
+        nargs='+',
+        choices=[case.name for case in CASES],
+        help='Cases to run, all of them by default',
+    )
+    parser.add_argument('--output', help='File to save results as JSON')
+    parser.add_argument('--baseline', help='JSON results to compare with')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.1,
+        help='Accepted slowdown against the baseline (default: 0.1)',
+    )
+
+
+def execute(options: dict, write=print) -> int:
+    """
+    Runs the benchmarks and compares them to the baseline, if any.
+    :return: 1 if regressions were found, 0 otherwise
+    """
+    results = run_benchmarks(options['sizes'], options.get('cases'))
+    write(format_results(results))
+
+    if options.get('output'):
+        save(results, options['output'])
+
+    if options.get('baseline'):
+        regressions = compare(
+            load(options['baseline']),
+            results,
+            options['threshold'],
+        )
+        if regressions:
+            write(format_regressions(regressions))
+            return 1
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m library.genetics.benchmarks',
+        description='Benchmarks the hot paths of the genetics library.',
+    )
+    add_arguments(parser)
+    return execute(vars(parser.parse_args(argv)))
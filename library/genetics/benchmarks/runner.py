@@ -0,0 +1,168 @@
+import json
+import platform
+import time
+import tracemalloc
+from random import Random
+from typing import Iterable, List, NamedTuple, Optional, Sequence
+
+from .cases import CASES, BenchmarkCase
+
+DEFAULT_BATCH_SIZES = (1, 100, 10000)
+
+
+class BenchmarkResult(NamedTuple):
+    """ Measurements of a case for a batch size """
+    case: str
+    batch_size: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_memory_kb: float
+
+
+class Regression(NamedTuple):
+    """ A case slower than its baseline beyond the threshold """
+    case: str
+    batch_size: int
+    baseline_ops_per_sec: float
+    ops_per_sec: float
+
+    @property
+    def slowdown(self) -> float:
+        return 1 - self.ops_per_sec / self.baseline_ops_per_sec
+
+
+def _percentile(sorted_values: Sequence[int], percentile: float) -> float:
+    index = round(percentile * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def measure(case: BenchmarkCase, batch_size: int,
+            seed: int = 0) -> BenchmarkResult:
+    """
+    Times every operation of a batch, then runs the batch again tracing
+    memory allocations to find the peak of holding its outputs.
+    :param case: case to be measured
+    :param batch_size: number of operations
+    :param seed: seed of the random inputs
+    :return: measurements
+    """
+    inputs = case.prepare(batch_size, Random(seed))
+    run = case.run
+    clock = time.perf_counter_ns
+    latencies = [0] * batch_size
+
+    started = clock()
+    for index, value in enumerate(inputs):
+        op_started = clock()
+        run(value)
+        latencies[index] = clock() - op_started
+    elapsed = clock() - started
+
+    # Outputs are kept, so the peak includes holding the whole batch
+    tracemalloc.start()
+    try:
+        outputs = [run(value) for value in inputs]
+        _, peak = tracemalloc.get_traced_memory()
+        del outputs
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return BenchmarkResult(
+        case=case.name,
+        batch_size=batch_size,
+        ops_per_sec=batch_size / (elapsed / 1e9) if elapsed else 0.0,
+        p50_us=_percentile(latencies, 0.50) / 1000,
+        p99_us=_percentile(latencies, 0.99) / 1000,
+        peak_memory_kb=peak / 1024,
+    )
+
+
+def run_benchmarks(batch_sizes: Iterable[int] = DEFAULT_BATCH_SIZES,
+                   cases: Optional[Iterable[str]] = None,
+                   seed: int = 0) -> List[BenchmarkResult]:
+    """
+    :param batch_sizes: batch sizes to measure every case with
+    :param cases: names of the cases to run, all of them by default
+    :param seed: seed of the random inputs
+    :return: measurements of every case and batch size
+    """
+    selected = [c for c in CASES if cases is None or c.name in cases]
+    return [
+        measure(case, batch_size, seed)
+        for case in selected
+        for batch_size in batch_sizes
+    ]
+
+
+def to_json(results: Iterable[BenchmarkResult]) -> dict:
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': [result._asdict() for result in results],
+    }
+
+
+def save(results: Iterable[BenchmarkResult], path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(to_json(results), f, indent=2)
+
+
+def load(path: str) -> List[BenchmarkResult]:
+    with open(path) as f:
+        data = json.load(f)
+    return [BenchmarkResult(**result) for result in data['results']]
+
+
+def compare(baseline: Iterable[BenchmarkResult],
+            results: Iterable[BenchmarkResult],
+            threshold: float = 0.1) -> List[Regression]:
+    """
+    Finds the cases whose throughput dropped more than the threshold when
+    compared to the baseline. Cases missing in the baseline are ignored.
+    :param baseline: stored measurements
+    :param results: current measurements
+    :param threshold: accepted slowdown, e.g. 0.1 for 10%
+    :return: regressions found
+    """
+    stored = {(r.case, r.batch_size): r for r in baseline}
+    regressions = []
+
+    for result in results:
+        reference = stored.get((result.case, result.batch_size))
+        if reference is None or not reference.ops_per_sec:
+            continue
+
+        regression = Regression(
+            case=result.case,
+            batch_size=result.batch_size,
+            baseline_ops_per_sec=reference.ops_per_sec,
+            ops_per_sec=result.ops_per_sec,
+        )
+        if regression.slowdown > threshold:
+            regressions.append(regression)
+
+    return regressions
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    lines = [
+        f'{"case":<26}{"batch":>9}{"ops/sec":>14}'
+        f'{"p50 us":>10}{"p99 us":>10}{"peak KB":>12}'
+    ]
+    for r in results:
+        lines.append(
+            f'{r.case:<26}{r.batch_size:>9}{r.ops_per_sec:>14.0f}'
+            f'{r.p50_us:>10.2f}{r.p99_us:>10.2f}{r.peak_memory_kb:>12.1f}'
+        )
+    return '\n'.join(lines)
+
+
+def format_regressions(regressions: Iterable[Regression]) -> str:
+    return '\n'.join(
+        f'REGRESSION {r.case} (batch {r.batch_size}):'
+        f' {r.ops_per_sec:.0f} ops/sec, {r.slowdown:.0%} slower than'
+        f' baseline ({r.baseline_ops_per_sec:.0f} ops/sec)'
+        for r in regressions
+    )
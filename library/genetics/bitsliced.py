@@ -0,0 +1,146 @@
+"""
+Bit-sliced DNA analysis in pure Python, for batches of many DNAs at once
+where NumPy is not available.
+
+A block of N packed DNAs is transposed into 72 bit-planes: plane k is an
+N-bit integer whose bit i is bit k of the i-th DNA. Comparing a row of every
+DNA of the block to a reference line is then 12 bitwise operations over
+those planes, whatever the size of the block, and Python big integers let a
+block be as wide as wanted instead of one 64-bit machine word.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple, Union
+
+from .packed import DNA_BITS, DNA_BYTES, DNA_PAIRS, PAIR_BITS, PackedDNA
+
+# Number of DNAs evaluated together by default
+BLOCK_SIZE = 4096
+
+
+def transpose(values: Sequence[int]) -> Tuple[int, ...]:
+    """
+    Transposes packed DNAs into bit-planes.
+    :param values: packed DNA values
+    :return: 72 planes, most significant bit first. Bit i of a plane is the
+        bit of the i-th DNA.
+    """
+    # Rows of a matrix of bits, one DNA per row and the last DNA first:
+    # slicing every 72nd character reads a column, i.e. a plane, in a single
+    # C-level step. The whole block is formatted as one big integer.
+    size = len(values)
+    if not size:
+        return (0,) * DNA_BITS
+
+    block = b''.join([value.to_bytes(DNA_BYTES, 'big')
+                      for value in reversed(values)])
+    bits = format(int.from_bytes(block, 'big'), f'0{size * DNA_BITS}b')
+    return tuple(int(bits[k::DNA_BITS], 2) for k in range(DNA_BITS))
+
+
+def _row_matches(planes: Sequence[int], row: int, lines: Iterable[int],
+                 ones: int) -> int:
+    """
+    Finds which DNAs have a row equal to any of the lines.
+    :param planes: bit-planes of the block
+    :param row: row to compare, top-down
+    :param lines: packed codon pair codes
+    :param ones: mask with a bit set for every DNA of the block
+    :return: mask of the DNAs whose row is one of the lines
+    """
+    first = row * PAIR_BITS
+    row_planes = planes[first:first + PAIR_BITS]
+    inverted = [plane ^ ones for plane in row_planes]
+
+    # Masks of the DNAs matching a prefix of the line, shared among lines
+    # with a common prefix.
+    prefixes: Dict[Tuple[int, int], int] = {}
+    matches = 0
+
+    for line in sorted(lines):
+        mask = ones
+        for bit in range(PAIR_BITS):
+            prefix = (bit, line >> (PAIR_BITS - 1 - bit))
+            cached = prefixes.get(prefix)
+            if cached is None:
+                if prefix[1] & 1:
+                    cached = mask & row_planes[bit]
+                else:
+                    cached = mask & inverted[bit]
+                prefixes[prefix] = cached
+            mask = cached
+            if not mask:
+                break
+        matches |= mask
+
+    return matches
+
+
+def analyse_block(values: Sequence[int], lines: FrozenSet[int],
+                  threshold: int) -> int:
+    """
+    Evaluates a block of packed DNAs at once.
+    :param values: packed DNA values
+    :param lines: packed reference lines
+    :param threshold: number of matching rows to flag a DNA as mutant
+    :return: verdict mask, bit i set if the i-th DNA is mutant
+    """
+    if threshold < 1:
+        raise ValueError('Threshold must be at least 1.')
+
+    if not values:
+        return 0
+
+    planes = transpose(values)
+    ones = (1 << len(values)) - 1
+
+    # levels[k] has the bits of DNAs with more than k matching rows
+    levels = [0] * threshold
+    for row in range(DNA_PAIRS):
+        matches = _row_matches(planes, row, lines, ones)
+        if not matches:
+            continue
+        for k in range(threshold - 1, 0, -1):
+            levels[k] |= levels[k - 1] & matches
+        levels[0] |= matches
+
+    return levels[-1]
+
+
+def verdicts_from_mask(mask: int, size: int) -> List[bool]:
+    """
+    :param mask: verdict mask of a block
+    :param size: number of DNAs of the block
+    :return: verdict of each DNA, in order
+    """
+    return [bit == '1' for bit in format(mask, f'0{size}b')[::-1]]
+
+
+def analyse_packed(dnas: Iterable[Union[PackedDNA, int]],
+                   lines: FrozenSet[int],
+                   threshold: int,
+                   block_size: int = BLOCK_SIZE) -> List[bool]:
+    """
+    Evaluates packed DNAs block by block.
+    :param dnas: packed DNAs or their values
+    :param lines: packed reference lines
+    :param threshold: number of matching rows to flag a DNA as mutant
+    :param block_size: number of DNAs evaluated together
+    :return: verdict of each DNA, in order
+    """
+    if block_size < 1:
+        raise ValueError('Block size must be at least 1.')
+
+    verdicts: List[bool] = []
+    block: List[int] = []
+
+    for dna in dnas:
+        block.append(dna.value if isinstance(dna, PackedDNA) else dna)
+        if len(block) == block_size:
+            mask = analyse_block(block, lines, threshold)
+            verdicts += verdicts_from_mask(mask, len(block))
+            block = []
+
+    if block:
+        mask = analyse_block(block, lines, threshold)
+        verdicts += verdicts_from_mask(mask, len(block))
+
+    return verdicts
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Hashable, NamedTuple, Optional, Sequence, Tuple
+
+
+class CacheStatistics(NamedTuple):
+    """ Counters of a verdict cache """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+def dna_key(sequences: Sequence[str]) -> Tuple[str, ...]:
+    """
+    Canonical cache key of a DNA from its sequences, so a verdict can be found
+    without building the DNA.
+    :param sequences: sequences of the DNA, top-down
+    :return: cache key
+    """
+    return tuple(sequences)
+
+
+class VerdictCache:
+    """
+    Bounded cache of DNA verdicts with least recently used eviction. It is
+    thread safe, so it can be shared by the threads of a worker.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        :param max_entries: number of verdicts kept before evicting the least
+            recently used ones
+        """
+        if max_entries < 1:
+            raise ValueError('Cache must support at least 1 entry.')
+
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bool]:
+        """
+        :param key: DNA key
+        :return: cached verdict or None if not cached
+        """
+        with self._lock:
+            try:
+                verdict = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return verdict
+
+    def set(self, key: Hashable, verdict: bool) -> None:
+        """
+        :param key: DNA key
+        :param verdict: whether DNA is mutant or not
+        """
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_analyse(self, key: Hashable,
+                       analyse: Callable[[], bool]) -> bool:
+        """
+        Returns the cached verdict, analysing and caching it on a miss.
+        :param key: DNA key
+        :param analyse: callable returning the verdict of the DNA
+        :return: whether DNA is mutant or not
+        """
+        verdict = self.get(key)
+        if verdict is None:
+            verdict = analyse()
+            self.set(key, verdict)
+        return verdict
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
@@ -1,6 +1,16 @@
 from enum import Enum
 from typing import Sequence, Tuple
 
+from .packed import (
+    BASE_BITS,
+    BASE_MASK,
+    BASE_CODES,
+    PAIR_BITS,
+    PAIR_VALUES,
+    PackedSequenceError,
+    pair_code_from_string,
+)
+
 
 class AminoAcid(Enum):
     """
@@ -14,28 +24,123 @@ class AminoAcid(Enum):
     T = 'Thymine'
 
 
+CODON_LENGTH = 3
+
+# Amino acids indexed by their 2-bit packed code
+_AMINO_ACIDS = tuple(AminoAcid)
+_AMINO_ACID_NAMES = frozenset(x.name for x in AminoAcid)
+
+
+class InvalidSequenceError(Exception):
+    """
+    Raises exception when a sequence has letters that are not amino acids.
+    """
+    pass
+
+
+def validate_amino_acids(value: str) -> None:
+    """
+    Checks whether every letter of the value is a supported amino acid.
+    :param value: sequence of amino acid letters
+    """
+    if not _AMINO_ACID_NAMES.issuperset(value or ''):
+        raise InvalidSequenceError(
+            f'You must provide correct amino'
+            f' acid values with 6 digits:'
+            f' {", ".join(x.name for x in AminoAcid)}. Value sent: {value}.'
+        )
+
+
 class CodonPair:
     """
     Codons are made up of any triplet combination of the four nitrogenous
     bases adenine (A), guanine (G), cytosine (C), or uracil (U)
+
+    There are only 4^6 = 4096 distinct codon pairs, so every one of them is
+    created once and shared: building a codon pair returns the canonical
+    instance of its sequence. Instances are immutable and equality is an
+    identity check.
     """
+    __slots__ = ('codon1', 'codon2', 'code', 'sequence')
 
-    def __init__(self,
-                 codon1: Tuple[AminoAcid, AminoAcid, AminoAcid],
-                 codon2: Tuple[AminoAcid, AminoAcid, AminoAcid]):
+    def __new__(cls,
+                codon1: Tuple[AminoAcid, AminoAcid, AminoAcid],
+                codon2: Tuple[AminoAcid, AminoAcid, AminoAcid]):
         """
         :param codon1: First codon triplet
         :param codon2: Second codon triplet
         """
-        self.codon1 = codon1
-        self.codon2 = codon2
+        if len(codon1) != CODON_LENGTH or len(codon2) != CODON_LENGTH:
+            raise InvalidSequenceError(
+                f'Codons must have {CODON_LENGTH} amino acids. Codons sent:'
+                f' {len(codon1)} and {len(codon2)} amino acids.'
+            )
+
+        code = 0
+        for codon in (codon1, codon2):
+            for amino_acid in codon:
+                code = (code << BASE_BITS) | BASE_CODES[amino_acid.name]
+        return _INTERNED[code]
 
-    @property
-    def sequence(self) -> str:
-        """ Returns sequence altogether """
-        s1 = f'{self.codon1[0].name}{self.codon1[1].name}{self.codon1[2].name}'
-        s2 = f'{self.codon2[0].name}{self.codon2[1].name}{self.codon2[2].name}'
-        return f'{s1}{s2}'
+    @classmethod
+    def _create(cls, code: int) -> 'CodonPair':
+        amino_acids = tuple(
+            _AMINO_ACIDS[(code >> shift) & BASE_MASK]
+            for shift in range(PAIR_BITS - BASE_BITS, -1, -BASE_BITS)
+        )
+        instance = object.__new__(cls)
+        object.__setattr__(instance, 'codon1', amino_acids[:CODON_LENGTH])
+        object.__setattr__(instance, 'codon2', amino_acids[CODON_LENGTH:])
+        object.__setattr__(instance, 'code', code)
+        object.__setattr__(
+            instance,
+            'sequence',
+            ''.join(amino_acid.name for amino_acid in amino_acids)
+        )
+        return instance
+
+    @classmethod
+    def from_code(cls, code: int) -> 'CodonPair':
+        """
+        Returns the codon pair of a 12-bit packed sequence.
+        :param code: packed codon pair
+        :return: codon pair instance
+        """
+        if not 0 <= code < PAIR_VALUES:
+            raise PackedSequenceError(
+                f'Codon pair code must be lower than {PAIR_VALUES}: {code}.'
+            )
+        return _INTERNED[code]
+
+    @classmethod
+    def from_string(cls, sequence: str) -> 'CodonPair':
+        """
+        Returns the codon pair of a sequence, e.g. 'ATGCGA'.
+        :param sequence: amino acid letters
+        :return: codon pair instance
+        """
+        try:
+            return _INTERNED[pair_code_from_string(sequence)]
+        except PackedSequenceError:
+            validate_amino_acids(sequence)
+            raise
+
+    def __setattr__(self, key, value):
+        raise AttributeError('CodonPair is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, CodonPair):
+            return NotImplemented
+        return self is other
+
+    def __hash__(self):
+        return self.code
+
+    def __repr__(self):
+        return f'CodonPair({self.sequence!r})'
+
+    def __reduce__(self):
+        return CodonPair.from_code, (self.code,)
 
     def is_equal(self, codon_pair: 'CodonPair') -> bool:
         """
@@ -44,4 +149,8 @@ class CodonPair:
         :param codon_pair: Provided codon pair instance
         :return: whether sequence is equals to the codon pair provided
         """
-        return self.sequence == codon_pair.sequence
+        return self is codon_pair
+
+
+# Every codon pair indexed by its 12-bit packed sequence
+_INTERNED = tuple(CodonPair._create(code) for code in range(PAIR_VALUES))
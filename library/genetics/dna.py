@@ -1,7 +1,16 @@
 from collections import UserList
-from typing import Tuple, List
+from typing import Optional, Sequence, Tuple, List
 
-from .codon_pair import CodonPair
+from .codon_pair import CodonPair, InvalidSequenceError
+from .packed import BASES, DNA_PAIRS, PAIR_LENGTH, PAIR_VALUES, PackedDNA
+
+# Every codon pair indexed by its sequence as ASCII bytes
+_PAIRS_BY_SEQUENCE = {
+    pair.sequence.encode('ascii'): pair
+    for pair in map(CodonPair.from_code, range(PAIR_VALUES))
+}
+
+_VALID_LETTERS = BASES.encode('ascii')
 
 
 class DNACodonPairLimitError(Exception):
@@ -18,6 +27,20 @@ class DNACodonPairRemovalError(Exception):
     pass
 
 
+class DNASequenceError(InvalidSequenceError):
+    """
+    Raises exception when raw sequences cannot be parsed into a DNA. Row and
+    column point to the invalid amino acid, when there is one.
+    """
+
+    def __init__(self, message: str,
+                 row: Optional[int] = None,
+                 column: Optional[int] = None):
+        super().__init__(message)
+        self.row = row
+        self.column = column
+
+
 class DNA(UserList):
     """
     A collection of Codon Pairs that represent an emulation of human DNA.
@@ -66,6 +89,104 @@ class DNA(UserList):
             self._build_oblique_pairs()
             self._build_column_pairs()
 
+    @classmethod
+    def from_strings(cls, rows: Sequence[str]) -> 'DNA':
+        """
+        Parses 6 sequences of 6 letters into a valid DNA, validating and
+        encoding every amino acid in a single pass.
+        :param rows: sequences, e.g. ["ATGCGA", "CAGTGC", ...]
+        :return: DNA instance
+        """
+        if len(rows) != DNA_PAIRS:
+            raise DNASequenceError(
+                f'DNA is not valid. It must have {DNA_PAIRS} sequences, it'
+                f' has {len(rows)}.'
+            )
+
+        for index, row in enumerate(rows):
+            if len(row) != PAIR_LENGTH:
+                raise DNASequenceError(
+                    f'Sequence must have {PAIR_LENGTH} amino acids: {row}.',
+                    row=index,
+                )
+
+        try:
+            buffer = ''.join(rows).encode('ascii')
+        except UnicodeEncodeError as e:
+            raise cls._invalid_letter(''.join(rows), e.start)
+
+        return cls.from_bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> 'DNA':
+        """
+        Parses 36 ASCII amino acid letters, row by row, into a valid DNA.
+        :param buffer: e.g. b'ATGCGACAGTGC...'
+        :return: DNA instance
+        """
+        size = DNA_PAIRS * PAIR_LENGTH
+        if len(buffer) != size:
+            raise DNASequenceError(
+                f'DNA is not valid. It must have {size} amino acids, it'
+                f' has {len(buffer)}.'
+            )
+
+        buffer = bytes(buffer)
+
+        # Deleting the valid letters leaves only the invalid ones
+        if buffer.translate(None, _VALID_LETTERS):
+            position = next(
+                i for i, letter in enumerate(buffer)
+                if letter not in _VALID_LETTERS
+            )
+            raise cls._invalid_letter(buffer.decode('latin-1'), position)
+
+        # Every line is a slice of the buffer, so each pair is a lookup
+        pairs = _PAIRS_BY_SEQUENCE
+        dna = cls()
+        dna.data = [
+            pairs[buffer[i:i + PAIR_LENGTH]]
+            for i in range(0, size, PAIR_LENGTH)
+        ]
+        dna.vertical_pair_columns = tuple(
+            pairs[buffer[column::PAIR_LENGTH]]
+            for column in range(PAIR_LENGTH)
+        )
+        dna.top_left_oblique_pair = pairs[buffer[::PAIR_LENGTH + 1]]
+        dna.bottom_left_oblique_pair = pairs[
+            buffer[size - PAIR_LENGTH:0:1 - PAIR_LENGTH]
+        ]
+        return dna
+
+    @staticmethod
+    def _invalid_letter(letters: str, position: int) -> DNASequenceError:
+        row, column = divmod(position, PAIR_LENGTH)
+        return DNASequenceError(
+            f'Invalid amino acid {letters[position]!r} at row {row},'
+            f' column {column}. Supported values: {", ".join(BASES)}.',
+            row=row,
+            column=column,
+        )
+
+    @classmethod
+    def from_packed(cls, packed: PackedDNA) -> 'DNA':
+        """
+        Builds a DNA from its packed representation.
+        :param packed: packed DNA
+        :return: DNA instance
+        """
+        dna = cls()
+        for code in packed.rows:
+            dna.append(CodonPair.from_code(code))
+        return dna
+
+    def to_packed(self) -> PackedDNA:
+        """
+        Packs the codon pairs of the DNA into a single 72-bit value.
+        :return: packed DNA
+        """
+        return PackedDNA.from_pair_codes(pair.code for pair in self)
+
     def to_sequence_list(self) -> List[str]:
         sequences = []
         for code_pair in self:
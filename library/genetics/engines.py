@@ -0,0 +1,252 @@
+"""
+Registry of the engines able to tell whether DNAs are mutant. Every engine
+gives the same verdicts, they differ on how fast they are for a given host
+and batch size, so the fastest one can be picked by calibration.
+
+    object      Analyser.is_mutant over codon pair objects
+    packed      Analyser.is_mutant_packed over packed integers
+    numpy       Vectorized lookups, only available with NumPy
+    bitsliced   Bit-sliced blocks of big integers
+"""
+import time
+from abc import ABC, abstractmethod
+from random import Random
+from typing import (
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from .analyser import Analyser, CompiledReference, MUTANT_THRESHOLD
+from .dna import DNA
+from .packed import DNA_PAIRS, PAIR_VALUES, PackedDNA
+
+AUTO_ENGINE = 'auto'
+
+ENGINES: Dict[str, Type['AnalysisEngine']] = {}
+
+
+class EngineError(Exception):
+    """
+    Raises exception when an engine is not registered or not available.
+    """
+    pass
+
+
+class CalibrationResult(NamedTuple):
+    """
+    Attributes:
+        engine      Name of the fastest engine.
+        batch_size  Number of DNAs per batch it was calibrated with.
+        timings     Seconds per DNA of every available engine.
+    """
+    engine: str
+    batch_size: int
+    timings: Dict[str, float]
+
+
+def register_engine(cls: Type['AnalysisEngine']) -> Type['AnalysisEngine']:
+    """
+    Class decorator adding an engine to the registry under its name.
+    :param cls: engine class
+    :return: the same class
+    """
+    if not cls.name or cls.name == AUTO_ENGINE:
+        raise EngineError(f'Engine name is not valid: {cls.name!r}.')
+    ENGINES[cls.name] = cls
+    return cls
+
+
+class AnalysisEngine(ABC):
+    """
+    Checks batches of DNAs against a reference. Subclasses implement
+    is_mutant_batch and are registered with register_engine.
+    """
+    name = ''
+
+    def __init__(self, reference: Optional[CompiledReference] = None):
+        """
+        :param reference: compiled reference DNA, the mutant one by default
+        """
+        self.analyser = Analyser(reference)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.name}>'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """ Whether the engine can run on this host """
+        return True
+
+    @property
+    def reference(self) -> CompiledReference:
+        return self.analyser.reference
+
+    def is_mutant(self, dna: Union[DNA, PackedDNA]) -> bool:
+        """
+        :param dna: DNA or packed DNA provided
+        :return: whether DNA is mutant or not
+        """
+        return self.is_mutant_batch([dna])[0]
+
+    @abstractmethod
+    def is_mutant_batch(self,
+                        dnas: Sequence[Union[DNA, PackedDNA]]) -> List[bool]:
+        """
+        :param dnas: DNAs or packed DNAs provided
+        :return: whether each DNA is mutant or not, in order
+        """
+
+    def _packed(self, dna: Union[DNA, PackedDNA]) -> PackedDNA:
+        if isinstance(dna, DNA):
+            self.analyser._check_dna(dna)
+            return dna.to_packed()
+        return dna
+
+
+@register_engine
+class ObjectEngine(AnalysisEngine):
+    name = 'object'
+
+    def is_mutant_batch(self, dnas):
+        is_mutant = self.analyser.is_mutant
+        return [
+            is_mutant(
+                DNA.from_packed(dna) if isinstance(dna, PackedDNA) else dna
+            )
+            for dna in dnas
+        ]
+
+
+@register_engine
+class PackedEngine(AnalysisEngine):
+    name = 'packed'
+
+    def is_mutant(self, dna):
+        return self.analyser.is_mutant_packed(self._packed(dna))
+
+    def is_mutant_batch(self, dnas):
+        is_mutant = self.analyser.is_mutant_packed
+        return [is_mutant(self._packed(dna)) for dna in dnas]
+
+
+@register_engine
+class NumpyEngine(AnalysisEngine):
+    name = 'numpy'
+
+    @classmethod
+    def is_available(cls):
+        from .vectorized import np
+        return np is not None
+
+    def is_mutant_batch(self, dnas):
+        from .vectorized import analyse_batch, np
+
+        codes = np.array(
+            [self._row_codes(dna) for dna in dnas], dtype=np.uint16
+        ).reshape(-1, DNA_PAIRS)
+        result = analyse_batch(codes, self.reference.lines, MUTANT_THRESHOLD)
+        return result.verdicts.tolist()
+
+    def _row_codes(self, dna):
+        if isinstance(dna, DNA):
+            self.analyser._check_dna(dna)
+            return [pair.code for pair in dna]
+        return dna.rows
+
+
+@register_engine
+class BitSlicedEngine(AnalysisEngine):
+    name = 'bitsliced'
+
+    def is_mutant_batch(self, dnas):
+        return self.analyser.is_mutant_bitsliced(dnas)
+
+
+def available_engines() -> List[str]:
+    """ Names of the registered engines able to run on this host """
+    return [name for name, cls in ENGINES.items() if cls.is_available()]
+
+
+def get_engine(name: str,
+               reference: Optional[CompiledReference] = None
+               ) -> AnalysisEngine:
+    """
+    :param name: name of a registered engine
+    :param reference: compiled reference DNA, the mutant one by default
+    :return: engine instance
+    """
+    try:
+        cls = ENGINES[name]
+    except KeyError:
+        raise EngineError(
+            f'Engine {name!r} is not registered. Engines:'
+            f' {", ".join(ENGINES)}.'
+        )
+
+    if not cls.is_available():
+        raise EngineError(f'Engine {name!r} is not available on this host.')
+    return cls(reference)
+
+
+def _random_batch(batch_size: int, lines: Sequence[int],
+                  random: Random) -> List[DNA]:
+    """ Random DNAs, some of them with rows of the reference """
+    dnas = []
+    for index in range(batch_size):
+        codes = [random.randrange(PAIR_VALUES) for _ in range(DNA_PAIRS)]
+        for row in random.sample(range(DNA_PAIRS), index % 3):
+            codes[row] = random.choice(lines)
+        dnas.append(DNA.from_packed(PackedDNA.from_pair_codes(codes)))
+    return dnas
+
+
+def calibrate(batch_size: int = 1,
+              reference: Optional[CompiledReference] = None,
+              samples: int = 200,
+              engines: Optional[Sequence[str]] = None,
+              clock: Callable[[], float] = time.perf_counter
+              ) -> CalibrationResult:
+    """
+    Micro-benchmarks the available engines on random batches and picks the
+    fastest one for this host and batch size.
+    :param batch_size: number of DNAs analysed at once
+    :param reference: compiled reference DNA, the mutant one by default
+    :param samples: minimum number of DNAs analysed by each engine
+    :param engines: names of the engines to compare, the available ones by
+        default
+    :param clock: clock returning seconds
+    :return: fastest engine and the timings of all of them
+    """
+    if batch_size < 1:
+        raise ValueError('Batch size must be at least 1.')
+
+    names = list(engines) if engines is not None else available_engines()
+    if not names:
+        raise EngineError('No engine is available to calibrate.')
+
+    instances = [get_engine(name, reference) for name in names]
+    lines = sorted(instances[0].reference.lines)
+    batch = _random_batch(batch_size, lines, Random(batch_size))
+    rounds = max(1, -(-samples // batch_size))
+
+    timings = {}
+    for engine in instances:
+        # Warm up, e.g. lookup tables built on first use
+        engine.is_mutant_batch(batch)
+
+        started = clock()
+        for _ in range(rounds):
+            engine.is_mutant_batch(batch)
+        timings[engine.name] = (clock() - started) / (rounds * batch_size)
+
+    return CalibrationResult(
+        engine=min(timings, key=timings.get),
+        batch_size=batch_size,
+        timings=timings,
+    )
@@ -0,0 +1,255 @@
+from enum import Enum
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from .packed import BASE_BITS, BASES, BASE_CODES
+
+
+class GridError(Exception):
+    """
+    Raises exception when a grid or its patterns are not well formed.
+    """
+    pass
+
+
+class Direction(Enum):
+    """ Directions a line can be read inside a grid of amino acids """
+    HORIZONTAL = 'horizontal'
+    VERTICAL = 'vertical'
+    TOP_LEFT_OBLIQUE = 'top-left oblique'
+    BOTTOM_LEFT_OBLIQUE = 'bottom-left oblique'
+
+
+class Grid:
+    """
+    A square grid of N×N amino acids, the generic form of a DNA. The amino
+    acids are kept as 2-bit codes, one byte each, row by row.
+    """
+    __slots__ = ('size', 'bases')
+
+    def __init__(self, bases: bytes, size: int):
+        """
+        :param bases: N×N amino acid codes (A=0, C=1, G=2, T=3), row by row
+        :param size: number of rows and columns
+        """
+        if size < 1 or len(bases) != size * size:
+            raise GridError(
+                f'Grid of size {size} must have {size * size} amino acids.'
+                f' It has {len(bases)}.'
+            )
+        self.size = size
+        self.bases = bytes(bases)
+
+    @classmethod
+    def from_strings(cls, rows: Sequence[str]) -> 'Grid':
+        """
+        :param rows: N strings of N amino acid letters each
+        :return: grid instance
+        """
+        size = len(rows)
+        bases = bytearray()
+        for index, row in enumerate(rows):
+            if len(row) != size:
+                raise GridError(
+                    f'Row {index} must have {size} amino acids: {row}.'
+                )
+            try:
+                bases.extend(BASE_CODES[letter] for letter in row)
+            except KeyError:
+                raise GridError(
+                    f'You must provide correct amino acid values:'
+                    f' {", ".join(BASES)}. Row {index} sent: {row}.'
+                )
+        return cls(bytes(bases), size)
+
+    def to_strings(self) -> List[str]:
+        size = self.size
+        return [
+            ''.join(BASES[code] for code in self.bases[i:i + size])
+            for i in range(0, size * size, size)
+        ]
+
+
+class GridLine(NamedTuple):
+    """
+    A line of a grid: where it starts, the direction it is read and its amino
+    acid codes.
+    """
+    direction: Direction
+    row: int
+    column: int
+    bases: bytes
+
+
+class GridMatch(NamedTuple):
+    """ A pattern found in a grid, starting at row and column """
+    direction: Direction
+    row: int
+    column: int
+    pattern: str
+
+
+# Row and column steps of each direction
+_STEPS = {
+    Direction.HORIZONTAL: (0, 1),
+    Direction.VERTICAL: (1, 0),
+    Direction.TOP_LEFT_OBLIQUE: (1, 1),
+    Direction.BOTTOM_LEFT_OBLIQUE: (-1, 1),
+}
+
+
+class LineExtractor:
+    """
+    Lazily enumerates every line of a grid: rows, columns and the diagonals
+    of both obliques. Lines shorter than the minimum length are skipped.
+    """
+
+    def __init__(self, grid: Grid, min_length: int = 1):
+        """
+        :param grid: grid of amino acids
+        :param min_length: lines shorter than it are not enumerated
+        """
+        self.grid = grid
+        self.min_length = min_length
+
+    def __iter__(self) -> Iterator[GridLine]:
+        yield from self.rows()
+        yield from self.columns()
+        yield from self.top_left_obliques()
+        yield from self.bottom_left_obliques()
+
+    def rows(self) -> Iterator[GridLine]:
+        size = self.grid.size
+        if size < self.min_length:
+            return
+        for row in range(size):
+            yield self._line(Direction.HORIZONTAL, row, 0, size)
+
+    def columns(self) -> Iterator[GridLine]:
+        size = self.grid.size
+        if size < self.min_length:
+            return
+        for column in range(size):
+            yield self._line(Direction.VERTICAL, 0, column, size)
+
+    def top_left_obliques(self) -> Iterator[GridLine]:
+        """ Diagonals read from top-left to bottom-right """
+        size = self.grid.size
+        starts = [(row, 0) for row in range(size - 1, -1, -1)]
+        starts += [(0, column) for column in range(1, size)]
+
+        for row, column in starts:
+            length = size - max(row, column)
+            if length >= self.min_length:
+                yield self._line(
+                    Direction.TOP_LEFT_OBLIQUE, row, column, length
+                )
+
+    def bottom_left_obliques(self) -> Iterator[GridLine]:
+        """ Diagonals read from bottom-left to top-right """
+        size = self.grid.size
+        starts = [(row, 0) for row in range(size)]
+        starts += [(size - 1, column) for column in range(1, size)]
+
+        for row, column in starts:
+            length = min(row + 1, size - column)
+            if length >= self.min_length:
+                yield self._line(
+                    Direction.BOTTOM_LEFT_OBLIQUE, row, column, length
+                )
+
+    def _line(self, direction: Direction, row: int, column: int,
+              length: int) -> GridLine:
+        size = self.grid.size
+        row_step, column_step = _STEPS[direction]
+        step = row_step * size + column_step
+        start = row * size + column
+        stop = start + (length - 1) * step
+
+        if length == 1:
+            bases = self.grid.bases[start:start + 1]
+        elif step > 0:
+            bases = self.grid.bases[start:stop + 1:step]
+        else:
+            # Read upwards: slice top-down and reverse it
+            bases = self.grid.bases[stop:start + 1:-step][::-1]
+
+        return GridLine(direction, row, column, bases)
+
+
+class GridMatcher:
+    """
+    Finds reference patterns of codon pairs (2 codons of any configured
+    length) in grids of any size. Every line is read once with a sliding
+    window whose packed code is checked against a set, so the cost is linear
+    in the grid size whatever the number of patterns.
+    """
+
+    def __init__(self, patterns: Iterable[str], codon_length: int = 3):
+        """
+        :param patterns: reference sequences of 2 codons each
+        :param codon_length: number of amino acids in a codon
+        """
+        if codon_length < 1:
+            raise GridError('Codon length must be at least 1.')
+
+        self.codon_length = codon_length
+        self.window = 2 * codon_length
+        self.patterns = {}
+
+        for pattern in patterns:
+            if len(pattern) != self.window:
+                raise GridError(
+                    f'Pattern must have {self.window} amino acids: {pattern}.'
+                )
+            code = 0
+            for letter in pattern:
+                if letter not in BASE_CODES:
+                    raise GridError(
+                        f'You must provide correct amino acid values:'
+                        f' {", ".join(BASES)}. Pattern sent: {pattern}.'
+                    )
+                code = (code << BASE_BITS) | BASE_CODES[letter]
+            self.patterns[code] = pattern
+
+    def find(self, grid: Grid) -> Iterator[GridMatch]:
+        """
+        Lazily finds every pattern occurrence in every line of the grid.
+        :param grid: grid of amino acids
+        :return: matches, in line order
+        """
+        window = self.window
+        mask = (1 << (BASE_BITS * window)) - 1
+        patterns = self.patterns
+
+        for line in LineExtractor(grid, min_length=window):
+            row_step, column_step = _STEPS[line.direction]
+            code = 0
+            for index, base in enumerate(line.bases):
+                code = ((code << BASE_BITS) | base) & mask
+                if index + 1 >= window and code in patterns:
+                    offset = index + 1 - window
+                    yield GridMatch(
+                        line.direction,
+                        line.row + offset * row_step,
+                        line.column + offset * column_step,
+                        patterns[code],
+                    )
+
+    def count(self, grid: Grid, limit: Optional[int] = None) -> int:
+        """
+        Counts pattern occurrences, stopping as soon as the limit is reached.
+        :param grid: grid of amino acids
+        :param limit: maximum number of occurrences to look for
+        :return: number of occurrences found
+        """
+        return sum(1 for _ in islice(self.find(grid), limit))
+
+    def is_mutant(self, grid: Grid, threshold: int = 2) -> bool:
+        """
+        Checks whether the grid has at least threshold pattern occurrences.
+        :param grid: grid of amino acids
+        :param threshold: occurrences needed to flag the grid as mutant
+        :return: whether grid is mutant or not
+        """
+        return self.count(grid, limit=threshold) >= threshold
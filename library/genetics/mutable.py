@@ -0,0 +1,165 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .analyser import MUTANT_REFERENCE, MUTANT_THRESHOLD, CompiledReference
+from .codon_pair import AminoAcid, InvalidSequenceError
+from .dna import DNA
+from .packed import (
+    BASE_BITS,
+    BASE_CODES,
+    BASE_MASK,
+    BASES,
+    DNA_PAIRS,
+    PAIR_LENGTH,
+    PackedDNA,
+    pack_pair_codes,
+    pair_code_to_string,
+)
+
+
+class MutableDNA:
+    """
+    A valid DNA whose amino acids can be replaced one at a time. It keeps the
+    packed code of its 14 lines and how many of its rows match the
+    reference, so a point mutation only updates the lines crossing the cell
+    (one row, one column and at most two obliques) and the verdict is
+    re-checked in constant time.
+    """
+
+    def __init__(self,
+                 packed: PackedDNA,
+                 reference: Optional[CompiledReference] = None,
+                 threshold: int = MUTANT_THRESHOLD):
+        """
+        :param packed: packed DNA to start from
+        :param reference: compiled reference DNA, the mutant one by default
+        :param threshold: number of matching rows to flag DNA as mutant
+        """
+        self.reference = reference or MUTANT_REFERENCE
+        self.threshold = threshold
+
+        self._rows = list(packed.rows)
+        self._columns = list(packed.columns)
+        self._top_left_oblique = packed.top_left_oblique
+        self._bottom_left_oblique = packed.bottom_left_oblique
+
+        lines = self.reference.lines
+        self._matches = sum(code in lines for code in self._rows)
+
+    def __repr__(self):
+        return f'MutableDNA({self.to_sequence_list()!r})'
+
+    @classmethod
+    def from_dna(cls, dna: DNA, **kwargs) -> 'MutableDNA':
+        return cls(dna.to_packed(), **kwargs)
+
+    @classmethod
+    def from_strings(cls, rows: Sequence[str], **kwargs) -> 'MutableDNA':
+        return cls(DNA.from_strings(rows).to_packed(), **kwargs)
+
+    @property
+    def rows(self) -> Tuple[int, ...]:
+        return tuple(self._rows)
+
+    @property
+    def columns(self) -> Tuple[int, ...]:
+        return tuple(self._columns)
+
+    @property
+    def top_left_oblique(self) -> int:
+        return self._top_left_oblique
+
+    @property
+    def bottom_left_oblique(self) -> int:
+        return self._bottom_left_oblique
+
+    @property
+    def matches(self) -> int:
+        """ Number of rows found in the reference """
+        return self._matches
+
+    @property
+    def is_mutant(self) -> bool:
+        return self._matches >= self.threshold
+
+    def get_base(self, row: int, column: int) -> str:
+        """
+        :param row: row of the cell, top-down
+        :param column: column of the cell, left to right
+        :return: amino acid letter of the cell
+        """
+        self._check_cell(row, column)
+        shift = (PAIR_LENGTH - 1 - column) * BASE_BITS
+        return BASES[(self._rows[row] >> shift) & BASE_MASK]
+
+    def set_base(self,
+                 row: int,
+                 column: int,
+                 base: Union[str, AminoAcid]) -> bool:
+        """
+        Replaces the amino acid of a cell.
+        :param row: row of the cell, top-down
+        :param column: column of the cell, left to right
+        :param base: amino acid or its letter
+        :return: whether DNA is mutant after the mutation
+        """
+        self._check_cell(row, column)
+        code = self._base_code(base)
+
+        lines = self.reference.lines
+        old_row = self._rows[row]
+        new_row = self._replace(old_row, column, code)
+        if old_row == new_row:
+            return self.is_mutant
+
+        self._rows[row] = new_row
+        self._matches += (new_row in lines) - (old_row in lines)
+        self._columns[column] = self._replace(
+            self._columns[column], row, code
+        )
+
+        if row == column:
+            self._top_left_oblique = self._replace(
+                self._top_left_oblique, row, code
+            )
+        if row + column == DNA_PAIRS - 1:
+            self._bottom_left_oblique = self._replace(
+                self._bottom_left_oblique, column, code
+            )
+
+        return self.is_mutant
+
+    def to_packed(self) -> PackedDNA:
+        return PackedDNA(pack_pair_codes(self._rows))
+
+    def to_dna(self) -> DNA:
+        return DNA.from_packed(self.to_packed())
+
+    def to_sequence_list(self) -> List[str]:
+        return [pair_code_to_string(code) for code in self._rows]
+
+    @staticmethod
+    def _replace(line: int, position: int, code: int) -> int:
+        """ Replaces the amino acid at a position of a line code """
+        shift = (PAIR_LENGTH - 1 - position) * BASE_BITS
+        return line & ~(BASE_MASK << shift) | (code << shift)
+
+    @staticmethod
+    def _base_code(base: Union[str, AminoAcid]) -> int:
+        if isinstance(base, AminoAcid):
+            base = base.name
+
+        code = BASE_CODES.get(base)
+        if code is None:
+            raise InvalidSequenceError(
+                f'Invalid amino acid {base!r}. Supported values:'
+                f' {", ".join(BASES)}.'
+            )
+        return code
+
+    @staticmethod
+    def _check_cell(row: int, column: int) -> None:
+        if not (0 <= row < DNA_PAIRS and 0 <= column < PAIR_LENGTH):
+            raise IndexError(
+                f'Cell ({row}, {column}) is out of the DNA, which has'
+                f' {DNA_PAIRS} rows of {PAIR_LENGTH} amino acids.'
+            )
@@ -0,0 +1,209 @@
+"""
+Hamming neighbourhood of a DNA: the fewest amino acid substitutions that
+flip its verdict.
+
+The verdict only depends on how many rows are reference lines, and rows are
+independent of each other, so there is no need to search the 4^36 DNAs
+around it:
+
+- a human DNA becomes mutant by turning its cheapest non-matching rows into
+  their nearest reference lines, the cost of a row being its distance to
+  the closest of the (at most 14) reference lines;
+- a mutant DNA becomes human by breaking just enough matching rows, each one
+  with a single substitution to a code that is not a reference line.
+"""
+from itertools import combinations, islice, product
+from typing import (
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .analyser import MUTANT_REFERENCE, MUTANT_THRESHOLD, CompiledReference
+from .dna import DNA
+from .packed import (
+    BASE_BITS,
+    BASE_MASK,
+    BASES,
+    DNA_PAIRS,
+    PAIR_LENGTH,
+    PackedDNA,
+)
+
+# Low bit of every amino acid of a codon pair code
+_LOW_BITS = int('01' * PAIR_LENGTH, 2)
+
+
+class Substitution(NamedTuple):
+    """ Amino acid replaced at a cell of the DNA """
+    row: int
+    column: int
+    base: str
+
+
+EditSet = Tuple[Substitution, ...]
+
+
+class NeighbourhoodResult(NamedTuple):
+    """
+    Attributes:
+        is_mutant   Verdict of the DNA as it is.
+        distance    Fewest substitutions flipping the verdict.
+        edit_sets   Minimal edit sets found, each flipping the verdict.
+    """
+    is_mutant: bool
+    distance: int
+    edit_sets: Tuple[EditSet, ...]
+
+
+def base_distance(code1: int, code2: int) -> int:
+    """
+    Number of amino acids that differ between two codon pair codes.
+    :param code1: packed codon pair
+    :param code2: packed codon pair
+    :return: Hamming distance in amino acids
+    """
+    diff = code1 ^ code2
+    return bin((diff | diff >> 1) & _LOW_BITS).count('1')
+
+
+def dna_distance(rows1: Sequence[int], rows2: Sequence[int]) -> int:
+    """
+    Number of amino acids that differ between two DNAs.
+    :param rows1: packed row codes of a DNA
+    :param rows2: packed row codes of the other DNA
+    :return: Hamming distance in amino acids
+    """
+    return sum(base_distance(a, b) for a, b in zip(rows1, rows2))
+
+
+def neighbour_codes(code: int, radius: int) -> Set[int]:
+    """
+    Codon pair codes within a distance of a code, including itself.
+    :param code: packed codon pair
+    :param radius: maximum number of different amino acids
+    :return: codes within the radius
+    """
+    codes = {code}
+    frontier = {code}
+    for _ in range(min(radius, PAIR_LENGTH)):
+        frontier = {
+            c & ~(BASE_MASK << shift) | (base << shift)
+            for c in frontier
+            for shift in range(0, PAIR_LENGTH * BASE_BITS, BASE_BITS)
+            for base in range(len(BASES))
+        } - codes
+        codes |= frontier
+    return codes
+
+
+def _substitutions(row: int, code: int, target: int) -> EditSet:
+    """ Substitutions turning the code of a row into the target code """
+    edits = []
+    for column in range(PAIR_LENGTH):
+        shift = (PAIR_LENGTH - 1 - column) * BASE_BITS
+        base = (target >> shift) & BASE_MASK
+        if (code >> shift) & BASE_MASK != base:
+            edits.append(Substitution(row, column, BASES[base]))
+    return tuple(edits)
+
+
+def _row_escapes(row: int, code: int, lines) -> List[Substitution]:
+    """ Single substitutions taking a row out of the reference lines """
+    escapes = []
+    for column in range(PAIR_LENGTH):
+        shift = (PAIR_LENGTH - 1 - column) * BASE_BITS
+        current = (code >> shift) & BASE_MASK
+        for base in range(len(BASES)):
+            if base == current:
+                continue
+            mutated = code & ~(BASE_MASK << shift) | (base << shift)
+            if mutated not in lines:
+                escapes.append(Substitution(row, column, BASES[base]))
+    return escapes
+
+
+def _to_mutant(rows: Tuple[int, ...], lines,
+               needed: int) -> Tuple[int, Iterator[EditSet]]:
+    """ Cheapest way of making needed non-matching rows match """
+    candidates = []
+    for row, code in enumerate(rows):
+        if code in lines:
+            continue
+        distances = {line: base_distance(code, line) for line in lines}
+        cost = min(distances.values())
+        targets = sorted(line for line, d in distances.items() if d == cost)
+        candidates.append((cost, row, code, targets))
+
+    distance = sum(sorted(c[0] for c in candidates)[:needed])
+
+    def edit_sets():
+        for chosen in combinations(candidates, needed):
+            if sum(c[0] for c in chosen) != distance:
+                continue
+            options = [
+                [_substitutions(row, code, t) for t in targets]
+                for _, row, code, targets in chosen
+            ]
+            for edits in product(*options):
+                yield tuple(s for row_edits in edits for s in row_edits)
+
+    return distance, edit_sets()
+
+
+def _to_human(rows: Tuple[int, ...], lines,
+              needed: int) -> Tuple[int, Iterator[EditSet]]:
+    """ Cheapest way of breaking needed matching rows """
+    matching = [
+        _row_escapes(row, code, lines)
+        for row, code in enumerate(rows) if code in lines
+    ]
+
+    def edit_sets():
+        for chosen in combinations(matching, needed):
+            yield from product(*chosen)
+
+    return needed, edit_sets()
+
+
+def minimal_edits(dna: Union[DNA, PackedDNA],
+                  reference: Optional[CompiledReference] = None,
+                  threshold: int = MUTANT_THRESHOLD,
+                  limit: Optional[int] = 1) -> NeighbourhoodResult:
+    """
+    Finds the fewest substitutions flipping the verdict of a DNA.
+    :param dna: DNA or packed DNA provided
+    :param reference: compiled reference DNA, the mutant one by default
+    :param threshold: number of matching rows to flag DNA as mutant
+    :param limit: maximum number of minimal edit sets returned, None for all
+        of them
+    :return: current verdict, distance and minimal edit sets
+    """
+    if not 1 <= threshold <= DNA_PAIRS:
+        raise ValueError(
+            f'Threshold must be between 1 and {DNA_PAIRS} to be flipped.'
+        )
+
+    if isinstance(dna, DNA):
+        dna = dna.to_packed()
+
+    lines = (reference or MUTANT_REFERENCE).lines
+    rows = dna.rows
+    matches = sum(code in lines for code in rows)
+    is_mutant = matches >= threshold
+
+    if is_mutant:
+        distance, edit_sets = _to_human(rows, lines, matches - threshold + 1)
+    else:
+        distance, edit_sets = _to_mutant(rows, lines, threshold - matches)
+
+    return NeighbourhoodResult(
+        is_mutant=is_mutant,
+        distance=distance,
+        edit_sets=tuple(islice(edit_sets, limit)),
+    )
@@ -0,0 +1,219 @@
+from typing import Iterable, List, Tuple
+
+# Every amino acid fits in 2 bits, in the same order as the AminoAcid enum.
+BASES = 'ACGT'
+BASE_CODES = {base: code for code, base in enumerate(BASES)}
+
+BASE_BITS = 2
+BASE_MASK = 0b11
+
+# A codon pair is 6 amino acids: 12 bits, first amino acid on the most
+# significant bits.
+PAIR_LENGTH = 6
+PAIR_BITS = BASE_BITS * PAIR_LENGTH
+PAIR_MASK = (1 << PAIR_BITS) - 1
+PAIR_VALUES = 1 << PAIR_BITS
+
+# A DNA is 6 codon pairs: 72 bits (9 bytes), first pair on the most
+# significant bits.
+DNA_PAIRS = 6
+DNA_BITS = PAIR_BITS * DNA_PAIRS
+DNA_BYTES = DNA_BITS // 8
+
+
+class PackedSequenceError(Exception):
+    """
+    Raises exception when a packed value does not fit the expected layout.
+    """
+    pass
+
+
+def pair_code_from_string(sequence: str) -> int:
+    """
+    Encodes a 6 letters sequence, e.g. 'ATGCGA', into a 12-bit code.
+    :param sequence: amino acid letters
+    :return: packed codon pair
+    """
+    if len(sequence) != PAIR_LENGTH:
+        raise PackedSequenceError(
+            f'Sequence must have {PAIR_LENGTH} amino acids: {sequence}.'
+        )
+
+    code = 0
+    for letter in sequence:
+        base = BASE_CODES.get(letter)
+        if base is None:
+            raise PackedSequenceError(
+                f'Invalid amino acid {letter!r} in {sequence}. Supported'
+                f' values: {", ".join(BASES)}.'
+            )
+        code = (code << BASE_BITS) | base
+    return code
+
+
+def pair_code_to_string(code: int) -> str:
+    """
+    Decodes a 12-bit codon pair code into its 6 letters sequence.
+    :param code: packed codon pair
+    :return: amino acid letters
+    """
+    return ''.join(
+        BASES[(code >> shift) & BASE_MASK]
+        for shift in range(PAIR_BITS - BASE_BITS, -1, -BASE_BITS)
+    )
+
+
+def pack_pair_codes(codes: Iterable[int]) -> int:
+    """
+    Joins 6 codon pair codes, top to bottom, into a 72-bit DNA value.
+    :param codes: packed codon pairs
+    :return: packed DNA
+    """
+    value = 0
+    count = 0
+    for code in codes:
+        value = (value << PAIR_BITS) | (code & PAIR_MASK)
+        count += 1
+
+    if count != DNA_PAIRS:
+        raise PackedSequenceError(
+            f'DNA must have {DNA_PAIRS} codon pairs. It has {count} only.'
+        )
+    return value
+
+
+def _base_at(value: int, row: int, column: int) -> int:
+    shift = (DNA_PAIRS - 1 - row) * PAIR_BITS
+    shift += (PAIR_LENGTH - 1 - column) * BASE_BITS
+    return (value >> shift) & BASE_MASK
+
+
+def _line_code(value: int, cells: Tuple[Tuple[int, int], ...]) -> int:
+    code = 0
+    for row, column in cells:
+        code = (code << BASE_BITS) | _base_at(value, row, column)
+    return code
+
+
+# Cells read by each line, in reading order.
+_COLUMN_CELLS = tuple(
+    tuple((row, column) for row in range(DNA_PAIRS))
+    for column in range(PAIR_LENGTH)
+)
+_TOP_LEFT_OBLIQUE_CELLS = tuple((i, i) for i in range(DNA_PAIRS))
+_BOTTOM_LEFT_OBLIQUE_CELLS = tuple(
+    (DNA_PAIRS - 1 - i, i) for i in range(DNA_PAIRS)
+)
+
+
+def dna_rows(value: int) -> Tuple[int, ...]:
+    """ Returns the 6 horizontal codon pair codes, top-down """
+    return tuple(
+        (value >> shift) & PAIR_MASK
+        for shift in range(DNA_BITS - PAIR_BITS, -1, -PAIR_BITS)
+    )
+
+
+def dna_columns(value: int) -> Tuple[int, ...]:
+    """ Returns the 6 vertical codon pair codes, left to right """
+    return tuple(_line_code(value, cells) for cells in _COLUMN_CELLS)
+
+
+def dna_top_left_oblique(value: int) -> int:
+    """ Returns the oblique code from top-left to bottom-right """
+    return _line_code(value, _TOP_LEFT_OBLIQUE_CELLS)
+
+
+def dna_bottom_left_oblique(value: int) -> int:
+    """ Returns the oblique code from bottom-left to top-right """
+    return _line_code(value, _BOTTOM_LEFT_OBLIQUE_CELLS)
+
+
+class PackedDNA:
+    """
+    A whole DNA packed in a single 72-bit integer: 2 bits per amino acid,
+    12 bits per codon pair. It is immutable and much lighter than a DNA of
+    CodonPair objects, so it suits batches and lookups.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value: int):
+        """
+        :param value: 72-bit packed DNA
+        """
+        if value < 0 or value >> DNA_BITS:
+            raise PackedSequenceError(
+                f'Packed DNA must fit in {DNA_BITS} bits.'
+            )
+        object.__setattr__(self, 'value', value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('PackedDNA is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, PackedDNA):
+            return NotImplemented
+        return self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f'PackedDNA({self.to_sequence_list()!r})'
+
+    def __reduce__(self):
+        return self.__class__, (self.value,)
+
+    @classmethod
+    def from_pair_codes(cls, codes: Iterable[int]) -> 'PackedDNA':
+        """
+        :param codes: 6 packed codon pairs, top-down
+        :return: packed DNA
+        """
+        return cls(pack_pair_codes(codes))
+
+    @classmethod
+    def from_sequence_list(cls, sequences: Iterable[str]) -> 'PackedDNA':
+        """
+        :param sequences: 6 sequences of 6 letters each, top-down
+        :return: packed DNA
+        """
+        return cls.from_pair_codes(
+            pair_code_from_string(seq) for seq in sequences
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> 'PackedDNA':
+        """
+        :param buffer: 9 bytes, big-endian
+        :return: packed DNA
+        """
+        if len(buffer) != DNA_BYTES:
+            raise PackedSequenceError(
+                f'Packed DNA must have {DNA_BYTES} bytes.'
+            )
+        return cls(int.from_bytes(buffer, 'big'))
+
+    def to_bytes(self) -> bytes:
+        """ Returns the DNA as a 9-byte big-endian buffer """
+        return self.value.to_bytes(DNA_BYTES, 'big')
+
+    def to_sequence_list(self) -> List[str]:
+        """ Returns the 6 horizontal sequences as strings """
+        return [pair_code_to_string(code) for code in self.rows]
+
+    @property
+    def rows(self) -> Tuple[int, ...]:
+        return dna_rows(self.value)
+
+    @property
+    def columns(self) -> Tuple[int, ...]:
+        return dna_columns(self.value)
+
+    @property
+    def top_left_oblique(self) -> int:
+        return dna_top_left_oblique(self.value)
+
+    @property
+    def bottom_left_oblique(self) -> int:
+        return dna_bottom_left_oblique(self.value)
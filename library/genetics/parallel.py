@@ -0,0 +1,154 @@
+"""
+Multi-core batch analysis. DNAs are packed 9 bytes each into shared memory
+chunks, so workers never receive pickled DNA or CodonPair objects, and
+verdicts are written back to the same chunk.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+from typing import FrozenSet, Iterable, Iterator, Optional, Union
+
+from .analyser import Analyser, CompiledReference
+from .dna import DNA
+from .packed import DNA_BITS, DNA_BYTES, PAIR_BITS, PAIR_MASK, PAIR_VALUES, \
+    PackedDNA
+
+# Lookup table of the reference lines, set once per worker process
+_worker_table = None
+
+
+def _init_worker(lines: FrozenSet[int]):
+    global _worker_table
+    table = bytearray(PAIR_VALUES)
+    for code in lines:
+        table[code] = 1
+    _worker_table = bytes(table)
+
+
+def _analyse_chunk(name: str, count: int, threshold: int) -> None:
+    """
+    Reads packed DNAs from shared memory and writes one verdict byte per DNA
+    right after them.
+    """
+    memory = SharedMemory(name=name)
+    try:
+        buffer = memory.buf
+        table = _worker_table
+        shifts = range(DNA_BITS - PAIR_BITS, -1, -PAIR_BITS)
+        offset = count * DNA_BYTES
+
+        for index in range(count):
+            start = index * DNA_BYTES
+            value = int.from_bytes(buffer[start:start + DNA_BYTES], 'big')
+            matches = 0
+            for shift in shifts:
+                matches += table[(value >> shift) & PAIR_MASK]
+            buffer[offset + index] = matches >= threshold
+        del buffer
+    finally:
+        memory.close()
+
+
+def _to_value(dna: Union[PackedDNA, DNA, int]) -> int:
+    if isinstance(dna, PackedDNA):
+        return dna.value
+    if isinstance(dna, DNA):
+        return dna.to_packed().value
+    return dna
+
+
+class ParallelAnalyser:
+    """
+    Splits a stream of DNAs into chunks analysed by a pool of processes.
+    Verdicts are yielded in the same order of the input.
+    """
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 chunk_size: int = 10000,
+                 reference: Optional[CompiledReference] = None,
+                 threshold: int = 2):
+        """
+        :param workers: number of processes, the number of CPUs by default
+        :param chunk_size: number of DNAs sent to a worker at once
+        :param reference: compiled reference, the mutant one by default
+        :param threshold: number of matching rows to flag a DNA as mutant
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1.')
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.reference = reference or Analyser().reference
+        self.threshold = threshold
+
+    def analyse(self,
+                dnas: Iterable[Union[PackedDNA, DNA, int]]) -> Iterator[bool]:
+        """
+        Analyses DNAs, keeping a bounded number of chunks in flight.
+        :param dnas: packed DNAs, DNAs or packed values
+        :return: verdicts in input order
+        """
+        iterator = iter(dnas)
+        pending = deque()
+        max_pending = self.workers * 2
+
+        with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.reference.lines,)) as executor:
+            try:
+                while True:
+                    while len(pending) < max_pending:
+                        chunk = self._submit(executor, iterator)
+                        if chunk is None:
+                            break
+                        pending.append(chunk)
+
+                    if not pending:
+                        break
+
+                    yield from self._collect(*pending.popleft())
+            finally:
+                for future, memory, _ in pending:
+                    future.cancel()
+                    memory.close()
+                    memory.unlink()
+
+    def _submit(self, executor: ProcessPoolExecutor, iterator: Iterator):
+        values = list(islice(iterator, self.chunk_size))
+        if not values:
+            return None
+
+        count = len(values)
+        memory = SharedMemory(create=True, size=count * (DNA_BYTES + 1))
+        try:
+            memory.buf[:count * DNA_BYTES] = b''.join(
+                _to_value(value).to_bytes(DNA_BYTES, 'big')
+                for value in values
+            )
+
+            future = executor.submit(
+                _analyse_chunk, memory.name, count, self.threshold
+            )
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+        return future, memory, count
+
+    @staticmethod
+    def _collect(future, memory: SharedMemory, count: int) -> Iterator[bool]:
+        try:
+            future.result()
+            offset = count * DNA_BYTES
+            verdicts = bytes(memory.buf[offset:offset + count])
+        finally:
+            memory.close()
+            memory.unlink()
+
+        for verdict in verdicts:
+            yield verdict == 1
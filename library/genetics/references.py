@@ -0,0 +1,140 @@
+import json
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+from .analyser import MUTANT_THRESHOLD, CompiledReference
+from .codon_pair import InvalidSequenceError
+from .dna import DNA
+from .packed import PackedDNA
+
+
+class ReferenceProfile(NamedTuple):
+    """ A named reference DNA, e.g. of a known mutant family """
+    name: str
+    packed: PackedDNA
+
+
+class ReferenceSet:
+    """
+    Many reference DNAs compiled into one combined index, mapping every
+    codon pair code to a bitset of the references having it in any of their
+    lines. An input is screened against all references in a single pass,
+    with a handful of big integer operations per row, so the cost stays
+    close to constant in the number of references.
+    """
+
+    def __init__(self, profiles: Iterable[ReferenceProfile]):
+        """
+        :param profiles: reference DNAs, names must be unique
+        """
+        names = []
+        index: Dict[int, int] = {}
+
+        for position, profile in enumerate(profiles):
+            if profile.name in names:
+                raise InvalidSequenceError(
+                    f'Reference {profile.name} is duplicated.'
+                )
+            names.append(profile.name)
+
+            bit = 1 << position
+            for code in CompiledReference(profile.packed).lines:
+                index[code] = index.get(code, 0) | bit
+
+        self.names: Tuple[str, ...] = tuple(names)
+        self.index = index
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_sequence_lists(
+            cls, references: Iterable[Tuple[str, List[str]]]
+    ) -> 'ReferenceSet':
+        """
+        :param references: pairs of name and sequences of a reference DNA
+        :return: compiled reference set
+        """
+        return cls(
+            ReferenceProfile(name, PackedDNA.from_sequence_list(sequences))
+            for name, sequences in references
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> 'ReferenceSet':
+        """
+        Loads references from a file, one per line, either as JSON
+        ({"name": "...", "dna": [...]}) or as text (name followed by the 6
+        sequences, separated by spaces or commas).
+        :param path: file path
+        :return: compiled reference set
+        """
+        from .screener import iter_lines, parse_record, validate_sequences
+
+        def read() -> Iterator[Tuple[str, List[str]]]:
+            for number, raw in enumerate(iter_lines(path), start=1):
+                try:
+                    line = raw.decode('utf-8')
+                    if not line.strip():
+                        continue
+
+                    if line.lstrip().startswith('{'):
+                        data = json.loads(line)
+                        name = data.get('name') or f'reference-{number}'
+                        sequences = parse_record(line, 'json')
+                    else:
+                        tokens = parse_record(line, 'text')
+                        name, sequences = tokens[0], tokens[1:]
+
+                    validate_sequences(sequences)
+                except (ValueError, InvalidSequenceError) as e:
+                    raise InvalidSequenceError(
+                        f'Reference at line {number} is not valid: {e}'
+                    )
+                yield name, sequences
+
+        return cls.from_sequence_lists(read())
+
+    def match(self,
+              dna: Union[PackedDNA, DNA],
+              threshold: int = MUTANT_THRESHOLD) -> int:
+        """
+        Finds the references of which the DNA has at least threshold rows.
+        :param dna: DNA or packed DNA to screen
+        :param threshold: number of matching rows to match a reference
+        :return: bitset of the matching references, by position
+        """
+        if threshold < 1:
+            raise ValueError('Threshold must be at least 1.')
+
+        if isinstance(dna, DNA):
+            dna = dna.to_packed()
+
+        # levels[k] has the bits of references matched by more than k rows
+        index = self.index
+        levels = [0] * threshold
+
+        for code in dna.rows:
+            bits = index.get(code, 0)
+            if not bits:
+                continue
+            for k in range(threshold - 1, 0, -1):
+                levels[k] |= levels[k - 1] & bits
+            levels[0] |= bits
+
+        return levels[-1]
+
+    def match_names(self,
+                    dna: Union[PackedDNA, DNA],
+                    threshold: int = MUTANT_THRESHOLD) -> List[str]:
+        """
+        :param dna: DNA or packed DNA to screen
+        :param threshold: number of matching rows to match a reference
+        :return: names of the matching references
+        """
+        bits = self.match(dna, threshold)
+        names = []
+        while bits:
+            lowest = bits & -bits
+            names.append(self.names[lowest.bit_length() - 1])
+            bits ^= lowest
+        return names
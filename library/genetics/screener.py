@@ -0,0 +1,243 @@
+"""
+Screens files of DNAs without Django, streaming records one by one so memory
+stays constant whatever the file size.
+
+Supported formats, one record per line:
+    json    {"dna": ["ATGCGA", ...]} or ["ATGCGA", ...]
+    text    ATGCGA CAGTGC TTATGT AGAAGG CCCCTA TCACTG (spaces or commas)
+
+Usage:
+    python -m library.genetics.screener input.ndjson output.ndjson
+"""
+import argparse
+import json
+import mmap
+import re
+import sys
+import time
+from typing import IO, Iterable, Iterator, List, NamedTuple, Optional
+
+from .analyser import Analyser
+from .codon_pair import InvalidSequenceError, validate_amino_acids
+from .packed import DNA_PAIRS, PAIR_LENGTH, PackedDNA
+from .references import ReferenceSet
+
+FORMATS = ('auto', 'json', 'text')
+
+_TEXT_SEPARATORS = re.compile(r'[\s,]+')
+
+
+class ScreenResult(NamedTuple):
+    """
+    Verdict of a record, or the reason it could not be analysed. When
+    screened against a reference set, references has the names of the
+    matching references.
+    """
+    line: int
+    mutant: Optional[bool]
+    error: Optional[str] = None
+    references: Optional[List[str]] = None
+
+    def to_dict(self) -> dict:
+        if self.error is not None:
+            return {'line': self.line, 'error': self.error}
+        if self.references is not None:
+            return {'line': self.line, 'references': self.references}
+        return {'line': self.line, 'mutant': self.mutant}
+
+
+class ScreenReport(NamedTuple):
+    """ Summary of a screening run """
+    records: int
+    mutants: int
+    humans: int
+    invalid: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.records / self.seconds
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """
+    Reads lines of a file through a memory map, one at a time.
+    :param path: file path
+    :return: lines without line breaks
+    """
+    with open(path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+
+        with mapped:
+            for line in iter(mapped.readline, b''):
+                yield line.rstrip(b'\r\n')
+
+
+def parse_record(line: str, fmt: str = 'auto') -> List[str]:
+    """
+    Extracts the sequences of a DNA from a record.
+    :param line: record text
+    :param fmt: 'json', 'text' or 'auto' to detect from the record
+    :return: sequences of the DNA
+    """
+    if fmt == 'auto':
+        fmt = 'json' if line.lstrip()[:1] in ('{', '[') else 'text'
+
+    if fmt == 'text':
+        return [seq for seq in _TEXT_SEPARATORS.split(line.strip()) if seq]
+
+    data = json.loads(line)
+    if isinstance(data, dict):
+        data = data.get('dna')
+
+    if not isinstance(data, list) or \
+            not all(isinstance(seq, str) for seq in data):
+        raise ValueError('Record must be a list of sequences.')
+    return data
+
+
+def validate_sequences(sequences: List[str]) -> None:
+    """
+    Applies the same rules of the /mutant endpoint to the DNA sequences.
+    :param sequences: sequences of the DNA
+    """
+    if len(sequences) != DNA_PAIRS:
+        raise InvalidSequenceError('DNA is not valid.')
+
+    for seq in sequences:
+        if len(seq) != PAIR_LENGTH:
+            raise InvalidSequenceError(
+                f'Sequence must have {PAIR_LENGTH} amino acids: {seq}.'
+            )
+        validate_amino_acids(seq)
+
+
+def screen(lines: Iterable[bytes],
+           analyser: Optional[Analyser] = None,
+           fmt: str = 'auto',
+           references: Optional[ReferenceSet] = None
+           ) -> Iterator[ScreenResult]:
+    """
+    Analyses records as they are read. Blank lines are skipped.
+    :param lines: raw records
+    :param analyser: analyser to use, a default one if not provided
+    :param fmt: format of the records
+    :param references: reference set to screen against instead of the
+        analyser reference. A record is mutant if it matches any of them.
+    :return: one result per record
+    """
+    analyser = analyser or Analyser()
+
+    for number, raw in enumerate(lines, start=1):
+        line = raw.decode('utf-8', errors='replace') \
+            if isinstance(raw, bytes) else raw
+        if not line.strip():
+            continue
+
+        try:
+            sequences = parse_record(line, fmt)
+            validate_sequences(sequences)
+        except (ValueError, InvalidSequenceError) as e:
+            yield ScreenResult(number, None, str(e))
+            continue
+
+        packed = PackedDNA.from_sequence_list(sequences)
+
+        if references is None:
+            yield ScreenResult(number, analyser.is_mutant_packed(packed))
+        else:
+            names = references.match_names(packed)
+            yield ScreenResult(number, bool(names), references=names)
+
+
+def write_results(results: Iterable[ScreenResult], output: IO) -> ScreenReport:
+    """
+    Writes results as newline-delimited JSON while counting them.
+    :param results: screening results
+    :param output: text stream to write to
+    :return: summary of the run
+    """
+    started = time.perf_counter()
+    records = mutants = invalid = 0
+
+    for result in results:
+        records += 1
+        if result.error is not None:
+            invalid += 1
+        elif result.mutant:
+            mutants += 1
+        output.write(json.dumps(result.to_dict()))
+        output.write('\n')
+
+    return ScreenReport(
+        records=records,
+        mutants=mutants,
+        humans=records - mutants - invalid,
+        invalid=invalid,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def screen_file(input_path: str,
+                output_path: str,
+                fmt: str = 'auto',
+                analyser: Optional[Analyser] = None,
+                references: Optional[ReferenceSet] = None) -> ScreenReport:
+    """
+    Screens every record of a file and writes the verdicts to another one.
+    :param input_path: file of DNAs, one per line
+    :param output_path: file to write one result per line
+    :param fmt: format of the records
+    :param analyser: analyser to use, a default one if not provided
+    :param references: reference set to screen against, if any
+    :return: summary of the run
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f'Format must be one of: {", ".join(FORMATS)}.')
+
+    with open(output_path, 'w') as output:
+        results = screen(iter_lines(input_path), analyser, fmt, references)
+        return write_results(results, output)
+
+
+def format_report(report: ScreenReport) -> str:
+    return (
+        f'Screened {report.records} records ({report.mutants} mutant,'
+        f' {report.humans} human, {report.invalid} invalid)'
+        f' in {report.seconds:.2f}s:'
+        f' {report.records_per_second:.0f} records/sec'
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Screens a file of DNAs, one per line.'
+    )
+    parser.add_argument('input', help='File of DNAs to screen')
+    parser.add_argument('output', help='File to write verdicts to')
+    parser.add_argument('--format', choices=FORMATS, default='auto')
+    parser.add_argument(
+        '--references',
+        help='File of reference DNAs to screen against, one per line',
+    )
+    args = parser.parse_args(argv)
+
+    references = None
+    if args.references:
+        references = ReferenceSet.from_file(args.references)
+
+    report = screen_file(
+        args.input, args.output, args.format, references=references
+    )
+    print(format_report(report))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,60 +1,20 @@
-from random import choice
 from django.test import TestCase
 
 from library.genetics import (
     Analyser,
-    AminoAcid,
-    CodonPair,
+    CompiledReference,
+    Direction,
     DNA,
     InsufficientCodonPairsError
 )
+from library.genetics.tests.utils import create_codon_pair, create_dna
 
 
 class AnalyserTests(TestCase):
-    def _get_random_amino_acid(self) -> AminoAcid:
-        return choice([v for v in AminoAcid])
-
-    def _create_codon_pair(self) -> CodonPair:
-        codon1 = self._get_random_amino_acid()
-        codon2 = self._get_random_amino_acid()
-        codon3 = self._get_random_amino_acid()
-        codon4 = self._get_random_amino_acid()
-        codon5 = self._get_random_amino_acid()
-        codon6 = self._get_random_amino_acid()
-
-        return CodonPair(
-            (codon1, codon2, codon3),
-            (codon4, codon5, codon6)
-        )
-
-    def _create_dna(self,
-                    c1: CodonPair = None,
-                    c2: CodonPair = None,
-                    c3: CodonPair = None,
-                    c4: CodonPair = None,
-                    c5: CodonPair = None,
-                    c6: CodonPair = None) -> DNA:
-        codon1 = c1 or self._create_codon_pair()
-        codon2 = c2 or self._create_codon_pair()
-        codon3 = c3 or self._create_codon_pair()
-        codon4 = c4 or self._create_codon_pair()
-        codon5 = c5 or self._create_codon_pair()
-        codon6 = c6 or self._create_codon_pair()
-
-        dna = DNA()
-        dna.append(codon1)
-        dna.append(codon2)
-        dna.append(codon3)
-        dna.append(codon4)
-        dna.append(codon5)
-        dna.append(codon6)
-
-        return dna
-
     def test_error_when_dna_is_invalid(self):
         """ Tests exception when an invalid DNA is being analysed """
-        codon1 = self._create_codon_pair()
-        codon2 = self._create_codon_pair()
+        codon1 = create_codon_pair()
+        codon2 = create_codon_pair()
 
         dna = DNA()
         dna.append(codon1)
@@ -85,10 +45,42 @@ class AnalyserTests(TestCase):
         for index, code_pair in enumerate(mutant_dna):
             self.assertEqual(code_pair.sequence, sequences[index])
 
+    def test_compiled_reference_lines(self):
+        """ Tests whether compiled reference has every mutant DNA line """
+        analyser = Analyser()
+        mutant_dna = analyser.mutant_dna
+
+        lines = list(mutant_dna) + list(mutant_dna.vertical_pair_columns)
+        lines.append(mutant_dna.top_left_oblique_pair)
+        lines.append(mutant_dna.bottom_left_oblique_pair)
+
+        self.assertEqual(
+            analyser.reference.lines,
+            frozenset(pair.code for pair in lines)
+        )
+
+        # Reference is compiled once and shared by analysers
+        self.assertIs(Analyser().reference, analyser.reference)
+
+        with self.assertRaises(AttributeError):
+            analyser.reference.lines = frozenset()
+
+    def test_compiled_reference_matches_dna_sequence_check(self):
+        """ Tests compiled lookups against DNA.has_sequence """
+        analyser = Analyser()
+        reference = CompiledReference.from_dna(analyser.mutant_dna)
+
+        for _ in range(200):
+            pair = create_codon_pair()
+            self.assertEqual(
+                reference.has_code(pair.code),
+                analyser.mutant_dna.has_sequence(pair)
+            )
+
     def test_as_not_mutant_with_no_sequence_exist(self):
         """ Tests as not mutant when there no sequence match on codon pairs """
         analyser = Analyser()
-        dna = self._create_dna()
+        dna = create_dna()
 
         self.assertFalse(analyser.is_mutant(dna))
 
@@ -101,7 +93,7 @@ class AnalyserTests(TestCase):
         # Let's create DNA of which one of its codon pairs is the same
         # as mutant DNA
         common_pair = analyser.mutant_dna[1]
-        dna = self._create_dna(
+        dna = create_dna(
             None,
             None,
             common_pair
@@ -121,7 +113,7 @@ class AnalyserTests(TestCase):
         # as mutant DNA
         common_pair = analyser.mutant_dna[1]
         common_pair2 = analyser.mutant_dna[4]
-        dna = self._create_dna(
+        dna = create_dna(
             None,
             None,
             common_pair,
@@ -131,3 +123,65 @@ class AnalyserTests(TestCase):
 
         # However, it is not enough to define the DNA as mutant
         self.assertTrue(analyser.is_mutant(dna))
+
+    def test_analysis_report_details(self):
+        """ Tests matched rows and their directions in the reference """
+        analyser = Analyser()
+        mutant_dna = analyser.mutant_dna
+
+        common_pair = mutant_dna[1]
+        column_pair = mutant_dna.vertical_pair_columns[0]
+        oblique_pair = mutant_dna.top_left_oblique_pair
+        dna = create_dna(common_pair, None, column_pair, oblique_pair)
+
+        report = analyser.analyse(dna, details=True)
+
+        self.assertTrue(report.is_mutant)
+        self.assertTrue(report.complete)
+
+        matches = {m.row: m for m in report.matches}
+        self.assertIn(Direction.HORIZONTAL, matches[0].directions)
+        self.assertEqual(matches[0].sequence, common_pair.sequence)
+        self.assertIn(Direction.VERTICAL, matches[2].directions)
+        self.assertIn(Direction.TOP_LEFT_OBLIQUE, matches[3].directions)
+
+    def test_analysis_stops_at_threshold(self):
+        """ Tests early exit once the threshold is reached """
+        analyser = Analyser()
+
+        # The reference itself matches in every row
+        report = analyser.analyse(analyser.mutant_dna)
+        self.assertTrue(report.is_mutant)
+        self.assertFalse(report.complete)
+        self.assertEqual(len(report.matches), 2)
+
+        # The last row reaching the threshold leaves no row unscanned
+        report = analyser.analyse(analyser.mutant_dna, threshold=6)
+        self.assertTrue(report.is_mutant)
+        self.assertTrue(report.complete)
+
+        report = analyser.analyse(analyser.mutant_dna, threshold=7)
+        self.assertFalse(report.is_mutant)
+        self.assertTrue(report.complete)
+        self.assertEqual(len(report.matches), 6)
+
+    def test_analysis_stops_right_after_threshold(self):
+        """ Tests rows after the threshold-th match are not checked """
+        checked = []
+
+        class CountingDNA(DNA):
+            def __iter__(self):
+                for pair in super().__iter__():
+                    checked.append(pair)
+                    yield pair
+
+        analyser = Analyser()
+        mutant_dna = analyser.mutant_dna
+        dna = CountingDNA(create_dna(mutant_dna[0], mutant_dna[1]))
+
+        report = analyser.analyse(dna)
+
+        self.assertTrue(report.is_mutant)
+        self.assertFalse(report.complete)
+        self.assertEqual([m.row for m in report.matches], [0, 1])
+        self.assertEqual(len(checked), 2)
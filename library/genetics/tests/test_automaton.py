@@ -0,0 +1,86 @@
+from random import choice, randrange
+from django.test import TestCase
+
+from library.genetics import (
+    Analyser,
+    AminoAcid,
+    CodonPair,
+    DNA,
+    InvalidSequenceError,
+)
+from library.genetics.automaton import SequenceHit, SequenceMatcher
+
+
+class SequenceMatcherTests(TestCase):
+    def _random_sequence(self, length: int) -> str:
+        return ''.join(choice('ACGT') for _ in range(length))
+
+    def _brute_force(self, patterns, sequence):
+        return sorted(
+            SequenceHit(offset, pattern)
+            for pattern in set(patterns)
+            for offset in range(len(sequence) - len(pattern) + 1)
+            if sequence.startswith(pattern, offset)
+        )
+
+    def test_overlapping_patterns(self):
+        """ Tests every occurrence, including overlapping and nested ones """
+        matcher = SequenceMatcher(['ACG', 'CG', 'GAC', 'ACGAC'])
+        hits = sorted(matcher.scan('ACGACG'))
+
+        self.assertEqual(hits, [
+            SequenceHit(0, 'ACG'),
+            SequenceHit(0, 'ACGAC'),
+            SequenceHit(1, 'CG'),
+            SequenceHit(2, 'GAC'),
+            SequenceHit(3, 'ACG'),
+            SequenceHit(4, 'CG'),
+        ])
+
+    def test_long_sequence_against_brute_force(self):
+        """ Tests a long sequence against many patterns of mixed sizes """
+        patterns = [self._random_sequence(randrange(3, 9)) for _ in range(300)]
+        sequence = self._random_sequence(5000)
+
+        matcher = SequenceMatcher(patterns)
+        self.assertEqual(
+            sorted(matcher.scan(sequence)),
+            self._brute_force(patterns, sequence)
+        )
+
+    def test_invalid_letters(self):
+        with self.assertRaises(InvalidSequenceError):
+            SequenceMatcher(['ACB'])
+
+        with self.assertRaises(InvalidSequenceError):
+            SequenceMatcher([])
+
+        matcher = SequenceMatcher(['ACG'])
+        with self.assertRaises(InvalidSequenceError):
+            list(matcher.scan('ACGXACG'))
+
+    def test_analyser_engine(self):
+        """ Tests the automaton engine against the default analyser """
+        analyser = Analyser()
+        automaton = Analyser.with_automaton()
+        mutant_pairs = list(analyser.mutant_dna)
+
+        for index in range(300):
+            pairs = [
+                CodonPair(
+                    tuple(choice(list(AminoAcid)) for _ in range(3)),
+                    tuple(choice(list(AminoAcid)) for _ in range(3)),
+                )
+                for _ in range(6)
+            ]
+            for row in range(index % 4):
+                pairs[randrange(6)] = choice(mutant_pairs)
+
+            dna = DNA()
+            [dna.append(p) for p in pairs]
+
+            self.assertEqual(
+                automaton.analyse(dna, details=True),
+                analyser.analyse(dna, details=True)
+            )
+            self.assertEqual(automaton.is_mutant(dna), analyser.is_mutant(dna))
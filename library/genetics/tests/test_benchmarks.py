@@ -0,0 +1,48 @@
+import os
+import tempfile
+from django.test import TestCase
+
+from library.genetics.benchmarks import (
+    CASES,
+    BenchmarkResult,
+    compare,
+    load,
+    run_benchmarks,
+    save,
+)
+
+
+class BenchmarkTests(TestCase):
+    def _result(self, case: str, ops_per_sec: float) -> BenchmarkResult:
+        return BenchmarkResult(case, 10, ops_per_sec, 1.0, 2.0, 3.0)
+
+    def test_every_case_runs(self):
+        results = run_benchmarks(batch_sizes=[1, 20])
+
+        self.assertEqual(len(results), len(CASES) * 2)
+        for result in results:
+            self.assertGreater(result.ops_per_sec, 0)
+            self.assertLessEqual(result.p50_us, result.p99_us)
+
+    def test_results_round_trip(self):
+        results = run_benchmarks(batch_sizes=[5], cases=['dna_append'])
+
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        save(results, path)
+        self.assertEqual(load(path), results)
+
+    def test_regressions_above_threshold(self):
+        baseline = [self._result('a', 1000), self._result('b', 1000)]
+        results = [
+            self._result('a', 950),
+            self._result('b', 800),
+            self._result('c', 1),
+        ]
+
+        regressions = compare(baseline, results, threshold=0.1)
+
+        self.assertEqual([r.case for r in regressions], ['b'])
+        self.assertAlmostEqual(regressions[0].slowdown, 0.2)
@@ -0,0 +1,93 @@
+from random import Random
+from django.test import TestCase
+
+from library.genetics import (
+    Analyser,
+    CodonPair,
+    DNA,
+    InsufficientCodonPairsError,
+    PackedDNA,
+)
+from library.genetics.bitsliced import (
+    analyse_block,
+    analyse_packed,
+    transpose,
+    verdicts_from_mask,
+)
+
+
+class BitSlicedAnalyserTests(TestCase):
+    def _create_dnas(self, analyser: Analyser, size: int = 300):
+        """ Random DNAs plus some with one, two and three mutant rows """
+        random = Random(14)
+        lines = sorted(analyser.reference.lines)
+
+        dnas = []
+        for index in range(size):
+            codes = [random.randrange(4096) for _ in range(6)]
+            for row in random.sample(range(6), index % 4):
+                codes[row] = random.choice(lines)
+            dnas.append(DNA.from_packed(PackedDNA.from_pair_codes(codes)))
+        return dnas
+
+    def test_transpose(self):
+        random = Random(3)
+        values = [random.getrandbits(72) for _ in range(40)]
+        planes = transpose(values)
+
+        self.assertEqual(len(planes), 72)
+        for k, plane in enumerate(planes):
+            for i, value in enumerate(values):
+                self.assertEqual((plane >> i) & 1, (value >> (71 - k)) & 1)
+
+        self.assertEqual(transpose([]), (0,) * 72)
+
+    def test_matches_is_mutant(self):
+        """ Tests bit-sliced verdicts against Analyser.is_mutant as oracle """
+        analyser = Analyser()
+        dnas = self._create_dnas(analyser)
+        expected = [analyser.is_mutant(dna) for dna in dnas]
+
+        self.assertIn(True, expected)
+        self.assertIn(False, expected)
+        self.assertEqual(analyser.is_mutant_bitsliced(dnas), expected)
+
+        packed = [dna.to_packed() for dna in dnas]
+        for block_size in (1, 7, 64, 1000):
+            self.assertEqual(
+                analyser.is_mutant_bitsliced(packed, block_size), expected
+            )
+
+    def test_mutant_reference(self):
+        analyser = Analyser()
+        self.assertEqual(
+            analyser.is_mutant_bitsliced([analyser.mutant_dna]), [True]
+        )
+
+    def test_threshold(self):
+        analyser = Analyser()
+        dnas = self._create_dnas(analyser, 100)
+        lines = analyser.reference.lines
+        values = [dna.to_packed().value for dna in dnas]
+
+        for threshold in (1, 2, 3):
+            expected = [
+                analyser.analyse(dna, threshold).is_mutant for dna in dnas
+            ]
+            mask = analyse_block(values, lines, threshold)
+            self.assertEqual(verdicts_from_mask(mask, len(dnas)), expected)
+
+        with self.assertRaises(ValueError):
+            analyse_block(values, lines, 0)
+
+    def test_empty_and_invalid(self):
+        analyser = Analyser()
+        self.assertEqual(analyser.is_mutant_bitsliced([]), [])
+
+        with self.assertRaises(ValueError):
+            analyse_packed([], analyser.reference.lines, 2, block_size=0)
+
+        dna = DNA()
+        dna.append(CodonPair.from_string('ATGCGA'))
+        with self.assertRaises(InsufficientCodonPairsError):
+            analyser.is_mutant_bitsliced([dna])
@@ -0,0 +1,66 @@
+from threading import Thread
+from django.test import TestCase
+
+from library.genetics import VerdictCache, dna_key
+
+
+class VerdictCacheTests(TestCase):
+    def test_hits_and_misses(self):
+        cache = VerdictCache(max_entries=10)
+        key = dna_key(["ATGCGA", "CAGTGC", "TTATGT"])
+
+        self.assertIsNone(cache.get(key))
+        cache.set(key, True)
+        self.assertTrue(cache.get(key))
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+        self.assertEqual(statistics.size, 1)
+
+    def test_false_verdict_is_cached(self):
+        """ Tests human verdicts are hits as well """
+        cache = VerdictCache(max_entries=10)
+        calls = []
+
+        def analyse():
+            calls.append(1)
+            return False
+
+        self.assertFalse(cache.get_or_analyse('dna', analyse))
+        self.assertFalse(cache.get_or_analyse('dna', analyse))
+        self.assertEqual(len(calls), 1)
+
+    def test_least_recently_used_eviction(self):
+        cache = VerdictCache(max_entries=2)
+        cache.set('a', True)
+        cache.set('b', False)
+
+        # 'a' becomes the most recently used, so 'b' is evicted
+        cache.get('a')
+        cache.set('c', True)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertTrue(cache.get('a'))
+        self.assertTrue(cache.get('c'))
+        self.assertEqual(cache.statistics.evictions, 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_thread_safety(self):
+        cache = VerdictCache(max_entries=50)
+
+        def work(offset):
+            for i in range(1000):
+                cache.get_or_analyse(offset + i % 100, lambda: True)
+
+        threads = [Thread(target=work, args=(n * 10,)) for n in range(8)]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+
+        statistics = cache.statistics
+        self.assertEqual(statistics.hits + statistics.misses, 8000)
+        self.assertEqual(statistics.size, 50)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            VerdictCache(max_entries=0)
@@ -1,6 +1,12 @@
+import pickle
 from django.test import TestCase
 
-from library.genetics.codon_pair import AminoAcid, CodonPair
+from library.genetics import PackedSequenceError
+from library.genetics.codon_pair import (
+    AminoAcid,
+    CodonPair,
+    InvalidSequenceError,
+)
 
 
 class CodonPairTests(TestCase):
@@ -44,3 +50,40 @@ class CodonPairTests(TestCase):
         # Codon pair 1 is equals 2
         self.assertTrue(codon_pair1.is_equal(codon_pair2))
         self.assertTrue(codon_pair2.is_equal(codon_pair1))
+
+    def test_codon_pairs_are_interned(self):
+        """ Tests every way to build a codon pair returns the same instance """
+        codon1 = (AminoAcid.A, AminoAcid.T, AminoAcid.G)
+        codon2 = (AminoAcid.C, AminoAcid.G, AminoAcid.A)
+
+        codon_pair = CodonPair(codon1, codon2)
+
+        self.assertIs(CodonPair(codon1, codon2), codon_pair)
+        self.assertIs(CodonPair.from_string('ATGCGA'), codon_pair)
+        self.assertIs(CodonPair.from_code(codon_pair.code), codon_pair)
+        self.assertIs(pickle.loads(pickle.dumps(codon_pair)), codon_pair)
+
+        self.assertEqual(codon_pair, CodonPair.from_string('ATGCGA'))
+        self.assertNotEqual(codon_pair, CodonPair.from_string('ATGCGT'))
+        self.assertEqual(len({codon_pair, CodonPair(codon1, codon2)}), 1)
+
+    def test_codon_pair_is_immutable(self):
+        codon_pair = CodonPair.from_string('ATGCGA')
+
+        with self.assertRaises(AttributeError):
+            codon_pair.codon1 = (AminoAcid.A, AminoAcid.A, AminoAcid.A)
+
+    def test_codon_pair_from_invalid_string(self):
+        with self.assertRaises(InvalidSequenceError):
+            CodonPair.from_string('ATGCGB')
+
+        with self.assertRaises(PackedSequenceError):
+            CodonPair.from_string('ATGCG')
+
+    def test_codon_pair_from_invalid_codons(self):
+        a = AminoAcid.A
+        with self.assertRaises(InvalidSequenceError):
+            CodonPair((a, a), (a, a, a, a))
+
+        with self.assertRaises(InvalidSequenceError):
+            CodonPair((a, a, a), (a, a))
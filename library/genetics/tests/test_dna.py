@@ -1,54 +1,21 @@
-from random import choice
 from django.test import TestCase
 
 from library.genetics import (
     AminoAcid,
     CodonPair,
     DNACodonPairLimitError,
-    DNACodonPairRemovalError
+    DNACodonPairRemovalError,
+    DNASequenceError,
 )
 from library.genetics import DNA
+from library.genetics.tests.utils import create_codon_pair, create_dna
 
 
 class DNATests(TestCase):
-    def _get_random_amino_acid(self) -> AminoAcid:
-        return choice([v for v in AminoAcid])
-
-    def _create_codon_pair(self) -> CodonPair:
-        codon1 = self._get_random_amino_acid()
-        codon2 = self._get_random_amino_acid()
-        codon3 = self._get_random_amino_acid()
-        codon4 = self._get_random_amino_acid()
-        codon5 = self._get_random_amino_acid()
-        codon6 = self._get_random_amino_acid()
-
-        return CodonPair(
-            (codon1, codon2, codon3),
-            (codon4, codon5, codon6)
-        )
-
-    def _create_dna(self) -> DNA:
-        pair1 = self._create_codon_pair()
-        pair2 = self._create_codon_pair()
-        pair3 = self._create_codon_pair()
-        pair4 = self._create_codon_pair()
-        pair5 = self._create_codon_pair()
-        pair6 = self._create_codon_pair()
-
-        dna = DNA()
-        dna.append(pair1)
-        dna.append(pair2)
-        dna.append(pair3)
-        dna.append(pair4)
-        dna.append(pair5)
-        dna.append(pair6)
-
-        return dna
-
     def test_appending_codon_pairs(self):
-        codon_pair1 = self._create_codon_pair()
-        codon_pair2 = self._create_codon_pair()
-        codon_pair3 = self._create_codon_pair()
+        codon_pair1 = create_codon_pair()
+        codon_pair2 = create_codon_pair()
+        codon_pair3 = create_codon_pair()
 
         dna = DNA()
         dna.append(codon_pair1)
@@ -62,9 +29,9 @@ class DNATests(TestCase):
         self.assertEqual(dna[2], codon_pair3)
 
     def test_valid_dna(self):
-        codon_pair1 = self._create_codon_pair()
-        codon_pair2 = self._create_codon_pair()
-        codon_pair3 = self._create_codon_pair()
+        codon_pair1 = create_codon_pair()
+        codon_pair2 = create_codon_pair()
+        codon_pair3 = create_codon_pair()
 
         dna = DNA()
         dna.append(codon_pair1)
@@ -76,8 +43,8 @@ class DNATests(TestCase):
         # Not valid because the dna is not complete. It must contain 6 pairs
         self.assertFalse(dna.is_valid())
 
-        codon_pair4 = self._create_codon_pair()
-        codon_pair5 = self._create_codon_pair()
+        codon_pair4 = create_codon_pair()
+        codon_pair5 = create_codon_pair()
 
         dna.append(codon_pair4)
         dna.append(codon_pair5)
@@ -85,7 +52,7 @@ class DNATests(TestCase):
         # still invalid
         self.assertFalse(dna.is_valid())
 
-        codon_pair6 = self._create_codon_pair()
+        codon_pair6 = create_codon_pair()
         dna.append(codon_pair6)
 
         # Now valid
@@ -93,9 +60,9 @@ class DNATests(TestCase):
 
     def test_removal_error_after_valid(self):
         """ Tests DNA to not support codon pair removal after it is valid """
-        codon_pair1 = self._create_codon_pair()
-        codon_pair2 = self._create_codon_pair()
-        codon_pair3_1 = self._create_codon_pair()
+        codon_pair1 = create_codon_pair()
+        codon_pair2 = create_codon_pair()
+        codon_pair3_1 = create_codon_pair()
 
         dna = DNA()
         dna.append(codon_pair1)
@@ -112,10 +79,10 @@ class DNATests(TestCase):
 
         self.assertEqual(len(dna), 2)
 
-        codon_pair3_2 = self._create_codon_pair()
-        codon_pair4 = self._create_codon_pair()
-        codon_pair5 = self._create_codon_pair()
-        codon_pair6 = self._create_codon_pair()
+        codon_pair3_2 = create_codon_pair()
+        codon_pair4 = create_codon_pair()
+        codon_pair5 = create_codon_pair()
+        codon_pair6 = create_codon_pair()
 
         dna.append(codon_pair3_2)
         dna.append(codon_pair4)
@@ -135,12 +102,12 @@ class DNATests(TestCase):
         instance.
         """
         pairs = [
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
         ]
 
         dna = DNA()
@@ -153,12 +120,12 @@ class DNATests(TestCase):
     def test_correct_sequence_list(self):
         """ Tests whether the sequence list of codon pairs is correct """
         pairs = [
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
-            self._create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
+            create_codon_pair(),
         ]
 
         sequences = [p.sequence for p in pairs]
@@ -174,7 +141,7 @@ class DNATests(TestCase):
         Tests whether the vertical columns of codon pairs are correctly
         generated
         """
-        dna = self._create_dna()
+        dna = create_dna()
 
         p1 = dna.data[0]
         p2 = dna.data[1]
@@ -212,7 +179,7 @@ class DNATests(TestCase):
         Tests whether the oblique sequences of codon pairs are correctly
         generated
         """
-        dna = self._create_dna()
+        dna = create_dna()
 
         p1 = dna.data[0]
         p2 = dna.data[1]
@@ -237,13 +204,13 @@ class DNATests(TestCase):
         """
         Tests whether a sequence matches an horizontal sequence in DNA
         """
-        dna = self._create_dna()
+        dna = create_dna()
 
         # Existing codon pair
         correct_codon_pair = dna.data[2]
 
         # Another codon pair
-        other_pair = self._create_codon_pair()
+        other_pair = create_codon_pair()
 
         self.assertFalse(dna.has_sequence(other_pair))
         self.assertTrue(dna.has_sequence(correct_codon_pair))
@@ -252,13 +219,13 @@ class DNATests(TestCase):
         """
         Tests whether a sequence matches a vertical sequence in DNA
         """
-        dna = self._create_dna()
+        dna = create_dna()
 
         # Existing codon pair
         correct_codon_pair = dna.vertical_pair_columns[2]
 
         # Another codon pair
-        other_pair = self._create_codon_pair()
+        other_pair = create_codon_pair()
 
         self.assertFalse(dna.has_sequence(other_pair))
         self.assertTrue(dna.has_sequence(correct_codon_pair))
@@ -267,10 +234,10 @@ class DNATests(TestCase):
         """
         Tests whether a sequence matches an oblique sequence in DNA
         """
-        dna = self._create_dna()
+        dna = create_dna()
 
         # Another codon pair
-        other_pair = self._create_codon_pair()
+        other_pair = create_codon_pair()
 
         self.assertFalse(dna.has_sequence(other_pair))
 
@@ -279,12 +246,12 @@ class DNATests(TestCase):
         self.assertTrue(dna.has_sequence(dna.bottom_left_oblique_pair))
 
     def test_whether_dna_has_sequence(self):
-        codon_pair1 = self._create_codon_pair()
-        codon_pair2 = self._create_codon_pair()
-        codon_pair3 = self._create_codon_pair()
-        codon_pair4 = self._create_codon_pair()
-        codon_pair5 = self._create_codon_pair()
-        codon_pair6 = self._create_codon_pair()
+        codon_pair1 = create_codon_pair()
+        codon_pair2 = create_codon_pair()
+        codon_pair3 = create_codon_pair()
+        codon_pair4 = create_codon_pair()
+        codon_pair5 = create_codon_pair()
+        codon_pair6 = create_codon_pair()
 
         dna = DNA()
         dna.append(codon_pair1)
@@ -309,13 +276,13 @@ class DNATests(TestCase):
         self.assertTrue(dna.has_sequence(codon_pair5))
 
     def test_error_if_more_then_6_codon_pairs(self):
-        codon_pair1 = self._create_codon_pair()
-        codon_pair2 = self._create_codon_pair()
-        codon_pair3 = self._create_codon_pair()
-        codon_pair4 = self._create_codon_pair()
-        codon_pair5 = self._create_codon_pair()
-        codon_pair6 = self._create_codon_pair()
-        codon_pair7 = self._create_codon_pair()
+        codon_pair1 = create_codon_pair()
+        codon_pair2 = create_codon_pair()
+        codon_pair3 = create_codon_pair()
+        codon_pair4 = create_codon_pair()
+        codon_pair5 = create_codon_pair()
+        codon_pair6 = create_codon_pair()
+        codon_pair7 = create_codon_pair()
 
         dna = DNA()
         dna.append(codon_pair1)
@@ -327,3 +294,59 @@ class DNATests(TestCase):
 
         with self.assertRaises(DNACodonPairLimitError):
             dna.append(codon_pair7)
+
+    def test_from_strings_matches_appended_dna(self):
+        for _ in range(50):
+            expected = create_dna()
+            dna = DNA.from_strings(expected.to_sequence_list())
+
+            self.assertTrue(dna.is_valid())
+            self.assertEqual(dna.data, expected.data)
+            self.assertEqual(
+                dna.vertical_pair_columns, expected.vertical_pair_columns
+            )
+            self.assertIs(
+                dna.top_left_oblique_pair, expected.top_left_oblique_pair
+            )
+            self.assertIs(
+                dna.bottom_left_oblique_pair,
+                expected.bottom_left_oblique_pair
+            )
+
+    def test_from_bytes(self):
+        expected = create_dna()
+        buffer = ''.join(expected.to_sequence_list()).encode('ascii')
+
+        self.assertEqual(DNA.from_bytes(buffer).data, expected.data)
+        self.assertEqual(DNA.from_bytes(bytearray(buffer)).data, expected.data)
+
+    def test_from_strings_error_positions(self):
+        rows = ['ATGCGA', 'CAGTGC', 'TTATGT', 'AGAAGG', 'CCCCTA', 'TCACTG']
+
+        invalid = list(rows)
+        invalid[3] = 'AGAXGG'
+        with self.assertRaises(DNASequenceError) as context:
+            DNA.from_strings(invalid)
+        self.assertEqual(context.exception.row, 3)
+        self.assertEqual(context.exception.column, 3)
+        self.assertIn("'X'", str(context.exception))
+
+        invalid[3] = 'AGAAGÇ'
+        with self.assertRaises(DNASequenceError) as context:
+            DNA.from_strings(invalid)
+        self.assertEqual(context.exception.row, 3)
+        self.assertEqual(context.exception.column, 5)
+
+        with self.assertRaises(DNASequenceError) as context:
+            DNA.from_strings(rows[:5])
+        self.assertIn('DNA is not valid', str(context.exception))
+
+        invalid = list(rows)
+        invalid[1] = 'CAGTG'
+        with self.assertRaises(DNASequenceError) as context:
+            DNA.from_strings(invalid)
+        self.assertEqual(context.exception.row, 1)
+        self.assertIsNone(context.exception.column)
+
+        with self.assertRaises(DNASequenceError):
+            DNA.from_bytes(b'ACGT')
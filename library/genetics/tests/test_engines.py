@@ -0,0 +1,168 @@
+from random import Random
+from unittest import skipUnless
+from django.test import TestCase
+
+from library.genetics import (
+    Analyser,
+    DNA,
+    InsufficientCodonPairsError,
+)
+from library.genetics.engines import (
+    ENGINES,
+    AnalysisEngine,
+    EngineError,
+    available_engines,
+    calibrate,
+    get_engine,
+    register_engine,
+)
+from library.genetics.tests.utils import create_codon_pair, create_dna
+from library.genetics.vectorized import np
+
+
+class EngineConformanceTests:
+    """
+    Cases of test_analyser and test_dna every engine must pass. Subclasses
+    set the engine name.
+    """
+    engine_name = ''
+
+    def setUp(self):
+        self.engine = get_engine(self.engine_name)
+        self.analyser = Analyser()
+
+    def test_error_when_dna_is_invalid(self):
+        dna = DNA()
+        dna.append(create_codon_pair())
+        dna.append(create_codon_pair())
+
+        with self.assertRaises(InsufficientCodonPairsError):
+            self.engine.is_mutant(dna)
+
+    def test_mutant_reference_is_mutant(self):
+        self.assertTrue(self.engine.is_mutant(self.analyser.mutant_dna))
+        self.assertTrue(self.engine.is_mutant(self.analyser.reference.packed))
+
+    def test_as_not_mutant_with_no_sequence_exist(self):
+        dna = DNA.from_strings(
+            ['AAAAAA', 'CCCCCC', 'GGGGGG', 'TTTTTT', 'ACACAC', 'GTGTGT']
+        )
+        self.assertFalse(self.engine.is_mutant(dna))
+
+    def test_as_not_mutant_with_only_one_sequence(self):
+        common_pair = self.analyser.mutant_dna[1]
+        dna = DNA.from_strings(
+            ['AAAAAA', 'CCCCCC', common_pair.sequence, 'TTTTTT', 'ACACAC',
+             'GTGTGT']
+        )
+        self.assertFalse(self.engine.is_mutant(dna))
+
+    def test_as_mutant_with_more_than_one_sequence(self):
+        common_pair = self.analyser.mutant_dna[1]
+        common_pair2 = self.analyser.mutant_dna[4]
+        dna = create_dna(None, None, common_pair, None, common_pair2)
+
+        self.assertTrue(self.engine.is_mutant(dna))
+
+    def test_vertical_and_oblique_sequences_count(self):
+        """ Rows matching a column or an oblique of the reference count """
+        mutant_dna = self.analyser.mutant_dna
+        dna = create_dna(
+            mutant_dna.vertical_pair_columns[2],
+            mutant_dna.top_left_oblique_pair,
+            mutant_dna.bottom_left_oblique_pair,
+        )
+        self.assertTrue(self.engine.is_mutant(dna))
+
+    def test_batch_matches_analyser(self):
+        """ Tests batch verdicts against Analyser.is_mutant as oracle """
+        random = Random(15)
+        mutant_pairs = list(self.analyser.mutant_dna)
+        mutant_pairs += list(self.analyser.mutant_dna.vertical_pair_columns)
+
+        dnas = []
+        for index in range(120):
+            pairs = [create_codon_pair() for _ in range(6)]
+            for row in random.sample(range(6), index % 4):
+                pairs[row] = random.choice(mutant_pairs)
+            dnas.append(create_dna(*pairs))
+
+        expected = [self.analyser.is_mutant(dna) for dna in dnas]
+        self.assertIn(True, expected)
+        self.assertIn(False, expected)
+
+        self.assertEqual(self.engine.is_mutant_batch(dnas), expected)
+        self.assertEqual(
+            self.engine.is_mutant_batch([dna.to_packed() for dna in dnas]),
+            expected,
+        )
+        self.assertEqual(self.engine.is_mutant_batch([]), [])
+
+
+class ObjectEngineTests(EngineConformanceTests, TestCase):
+    engine_name = 'object'
+
+
+class PackedEngineTests(EngineConformanceTests, TestCase):
+    engine_name = 'packed'
+
+
+@skipUnless(np is not None, 'NumPy is not installed')
+class NumpyEngineTests(EngineConformanceTests, TestCase):
+    engine_name = 'numpy'
+
+
+class BitSlicedEngineTests(EngineConformanceTests, TestCase):
+    engine_name = 'bitsliced'
+
+
+class EngineRegistryTests(TestCase):
+    def test_every_engine_is_tested(self):
+        tested = {
+            cls.engine_name for cls in EngineConformanceTests.__subclasses__()
+        }
+        self.assertEqual(set(ENGINES), tested)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(EngineError):
+            get_engine('quantum')
+
+    def test_invalid_engine_name(self):
+        with self.assertRaises(EngineError):
+            register_engine(type('AutoEngine', (AnalysisEngine,), {
+                'name': 'auto',
+            }))
+
+    def test_unavailable_engine(self):
+        cls = type('MissingEngine', (AnalysisEngine,), {
+            'name': 'missing',
+            'is_available': classmethod(lambda cls: False),
+        })
+        register_engine(cls)
+        try:
+            self.assertNotIn('missing', available_engines())
+            with self.assertRaises(EngineError):
+                get_engine('missing')
+        finally:
+            del ENGINES['missing']
+
+    def test_calibrate_picks_the_fastest_engine(self):
+        # Seconds read before and after timing each engine
+        clock = iter([0.0, 10.0, 10.0, 11.0]).__next__
+
+        result = calibrate(
+            batch_size=3, samples=3, engines=['object', 'packed'],
+            clock=clock,
+        )
+        self.assertEqual(result.engine, 'packed')
+        self.assertEqual(result.batch_size, 3)
+        self.assertEqual(result.timings, {'object': 10 / 3, 'packed': 1 / 3})
+
+    def test_calibrate_available_engines(self):
+        result = calibrate(batch_size=10, samples=10)
+
+        self.assertIn(result.engine, available_engines())
+        self.assertEqual(set(result.timings), set(available_engines()))
+
+        with self.assertRaises(ValueError):
+            calibrate(batch_size=0)
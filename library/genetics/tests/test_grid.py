@@ -0,0 +1,123 @@
+from random import choice, randrange
+from django.test import TestCase
+
+from library.genetics import Analyser, PackedDNA, pair_code_to_string
+from library.genetics.grid import (
+    Direction,
+    Grid,
+    GridError,
+    GridMatcher,
+    LineExtractor,
+)
+
+
+class GridTests(TestCase):
+    def _random_rows(self, size: int):
+        return [
+            ''.join(choice('ACGT') for _ in range(size))
+            for _ in range(size)
+        ]
+
+    def test_lines_of_dna_sized_grid(self):
+        """ Tests lines of a 6x6 grid against the packed DNA lines """
+        rows = self._random_rows(6)
+        packed = PackedDNA.from_sequence_list(rows)
+        grid = Grid.from_strings(rows)
+
+        lines = {}
+        for line in LineExtractor(grid, min_length=6):
+            letters = ''.join('ACGT'[b] for b in line.bases)
+            lines.setdefault(line.direction, []).append(letters)
+
+        self.assertEqual(lines[Direction.HORIZONTAL], rows)
+        self.assertEqual(
+            lines[Direction.VERTICAL],
+            [pair_code_to_string(c) for c in packed.columns]
+        )
+        self.assertEqual(
+            lines[Direction.TOP_LEFT_OBLIQUE],
+            [pair_code_to_string(packed.top_left_oblique)]
+        )
+        self.assertEqual(
+            lines[Direction.BOTTOM_LEFT_OBLIQUE],
+            [pair_code_to_string(packed.bottom_left_oblique)]
+        )
+
+    def test_every_diagonal_is_enumerated(self):
+        """ Tests number and size of lines in each direction """
+        grid = Grid.from_strings(self._random_rows(5))
+        extractor = LineExtractor(grid)
+
+        self.assertEqual(len(list(extractor.rows())), 5)
+        self.assertEqual(len(list(extractor.columns())), 5)
+
+        for lines in (extractor.top_left_obliques(),
+                      extractor.bottom_left_obliques()):
+            lengths = sorted(len(line.bases) for line in lines)
+            self.assertEqual(lengths, [1, 1, 2, 2, 3, 3, 4, 4, 5])
+
+    def test_sliding_window_matches_in_large_grid(self):
+        """ Tests patterns found anywhere and in any direction """
+        size = 100
+        rows = [list('A' * size) for _ in range(size)]
+        rows[10][20:26] = 'ATGCGA'
+        for i, letter in enumerate('CAGTGC'):
+            rows[50 + i][70] = letter
+        for i, letter in enumerate('TTATGT'):
+            rows[90 - i][5 + i] = letter
+        grid = Grid.from_strings([''.join(r) for r in rows])
+
+        matcher = GridMatcher(['ATGCGA', 'CAGTGC', 'TTATGT'])
+        matches = set(matcher.find(grid))
+
+        self.assertEqual(len(matches), 3)
+        self.assertIn((Direction.HORIZONTAL, 10, 20, 'ATGCGA'), matches)
+        self.assertIn((Direction.VERTICAL, 50, 70, 'CAGTGC'), matches)
+        self.assertIn(
+            (Direction.BOTTOM_LEFT_OBLIQUE, 90, 5, 'TTATGT'),
+            matches
+        )
+        self.assertTrue(matcher.is_mutant(grid))
+        self.assertFalse(matcher.is_mutant(grid, threshold=4))
+
+    def test_early_exit_at_threshold(self):
+        """ Tests counting stops once the threshold is reached """
+        grid = Grid.from_strings(['A' * 20] * 20)
+        matcher = GridMatcher(['AAAA'], codon_length=2)
+
+        self.assertEqual(matcher.count(grid, limit=3), 3)
+        self.assertTrue(matcher.is_mutant(grid, threshold=3))
+
+    def test_matches_analyser_lines(self):
+        """ Tests every reference line is found in the reference DNA """
+        analyser = Analyser()
+        rows = analyser.mutant_dna.to_sequence_list()
+        patterns = [pair_code_to_string(c) for c in analyser.reference.lines]
+
+        matcher = GridMatcher(patterns)
+        found = {m.pattern for m in matcher.find(Grid.from_strings(rows))}
+        self.assertEqual(found, set(patterns))
+
+    def test_random_positions_with_codon_length(self):
+        """ Tests codon length other than 3 """
+        size = 30
+        rows = self._random_rows(size)
+        row, column = randrange(size), randrange(size - 8)
+        pattern = rows[row][column:column + 8]
+
+        matcher = GridMatcher([pattern], codon_length=4)
+        matches = list(matcher.find(Grid.from_strings(rows)))
+        self.assertIn(
+            (Direction.HORIZONTAL, row, column, pattern),
+            matches
+        )
+
+    def test_invalid_grids(self):
+        with self.assertRaises(GridError):
+            Grid.from_strings(['ACG', 'ACG'])
+
+        with self.assertRaises(GridError):
+            Grid.from_strings(['AB', 'AC'])
+
+        with self.assertRaises(GridError):
+            GridMatcher(['ACGT'])
@@ -0,0 +1,110 @@
+from random import Random
+from django.test import TestCase
+
+from library.genetics import (
+    Analyser,
+    AminoAcid,
+    DNA,
+    InvalidSequenceError,
+    MutableDNA,
+)
+
+MUTANT_SEQUENCES = [
+    'ATGCGA',
+    'CAGTGC',
+    'TTATGT',
+    'AGAAGG',
+    'CCCCTA',
+    'TCACTG',
+]
+
+
+class MutableDNATests(TestCase):
+    def test_initial_state(self):
+        dna = MutableDNA.from_strings(MUTANT_SEQUENCES)
+
+        self.assertEqual(dna.matches, 6)
+        self.assertTrue(dna.is_mutant)
+        self.assertEqual(dna.to_sequence_list(), MUTANT_SEQUENCES)
+        self.assertEqual(dna.get_base(2, 3), 'T')
+
+    def test_set_base_updates_crossing_lines(self):
+        dna = MutableDNA.from_strings(MUTANT_SEQUENCES)
+        columns = dna.columns
+        bottom_left_oblique = dna.bottom_left_oblique
+
+        # Cell of the top-left oblique only
+        dna.set_base(2, 2, 'C')
+
+        self.assertEqual(dna.to_sequence_list()[2], 'TTCTGT')
+        self.assertEqual(dna.columns[:2], columns[:2])
+        self.assertEqual(dna.columns[3:], columns[3:])
+        self.assertEqual(dna.bottom_left_oblique, bottom_left_oblique)
+        self.assertEqual(dna.to_packed().columns, dna.columns)
+        self.assertEqual(
+            dna.to_packed().top_left_oblique, dna.top_left_oblique
+        )
+
+        # Cell of the bottom-left oblique
+        dna.set_base(3, 2, AminoAcid.T)
+        self.assertEqual(
+            dna.to_packed().bottom_left_oblique, dna.bottom_left_oblique
+        )
+
+    def test_running_match_count(self):
+        dna = MutableDNA.from_strings(MUTANT_SEQUENCES)
+
+        for row in range(4):
+            dna.set_base(row, 0, 'G')
+        self.assertEqual(dna.matches, 2)
+        self.assertTrue(dna.is_mutant)
+
+        self.assertFalse(dna.set_base(4, 0, 'G'))
+        self.assertEqual(dna.matches, 1)
+
+        # Same base does not change anything
+        self.assertFalse(dna.set_base(4, 0, 'G'))
+        self.assertEqual(dna.matches, 1)
+
+        self.assertTrue(dna.set_base(4, 0, 'C'))
+        self.assertEqual(dna.matches, 2)
+
+    def test_random_mutations_match_analyser(self):
+        """ Tests verdicts after each mutation against a rebuilt DNA """
+        random = Random(16)
+        analyser = Analyser()
+        dna = MutableDNA.from_strings(MUTANT_SEQUENCES)
+
+        for _ in range(500):
+            row = random.randrange(6)
+            column = random.randrange(6)
+            verdict = dna.set_base(row, column, random.choice('ACGT'))
+
+            rebuilt = dna.to_dna()
+            self.assertIsInstance(rebuilt, DNA)
+            self.assertEqual(verdict, analyser.is_mutant(rebuilt))
+
+            packed = rebuilt.to_packed()
+            self.assertEqual(dna.columns, packed.columns)
+            self.assertEqual(dna.top_left_oblique, packed.top_left_oblique)
+            self.assertEqual(
+                dna.bottom_left_oblique, packed.bottom_left_oblique
+            )
+
+    def test_threshold(self):
+        dna = MutableDNA.from_strings(MUTANT_SEQUENCES, threshold=7)
+        self.assertFalse(dna.is_mutant)
+
+    def test_invalid_mutations(self):
+        dna = MutableDNA.from_strings(MUTANT_SEQUENCES)
+
+        with self.assertRaises(IndexError):
+            dna.set_base(6, 0, 'A')
+
+        with self.assertRaises(IndexError):
+            dna.get_base(0, -1)
+
+        with self.assertRaises(InvalidSequenceError):
+            dna.set_base(0, 0, 'U')
+
+        self.assertEqual(dna.to_sequence_list(), MUTANT_SEQUENCES)
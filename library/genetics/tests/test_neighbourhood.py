@@ -0,0 +1,117 @@
+from itertools import combinations, product
+from random import Random
+from django.test import TestCase
+
+from library.genetics import Analyser, DNA, PackedDNA
+from library.genetics.neighbourhood import (
+    Substitution,
+    base_distance,
+    minimal_edits,
+)
+
+MUTANT_SEQUENCES = [
+    'ATGCGA',
+    'CAGTGC',
+    'TTATGT',
+    'AGAAGG',
+    'CCCCTA',
+    'TCACTG',
+]
+
+
+class NeighbourhoodTests(TestCase):
+    def setUp(self):
+        self.analyser = Analyser()
+
+    def _apply(self, sequences, edit_set):
+        rows = [list(seq) for seq in sequences]
+        for substitution in edit_set:
+            rows[substitution.row][substitution.column] = substitution.base
+        return DNA.from_strings([''.join(row) for row in rows])
+
+    def _flips_within(self, sequences, distance):
+        """ Brute force over every DNA up to distance substitutions """
+        verdict = self.analyser.is_mutant(DNA.from_strings(sequences))
+        for size in range(1, distance + 1):
+            for cells in combinations(range(36), size):
+                options = [
+                    [b for b in 'ACGT' if b != sequences[c // 6][c % 6]]
+                    for c in cells
+                ]
+                for bases in product(*options):
+                    edit_set = [
+                        Substitution(c // 6, c % 6, b)
+                        for c, b in zip(cells, bases)
+                    ]
+                    dna = self._apply(sequences, edit_set)
+                    if self.analyser.is_mutant(dna) != verdict:
+                        return True
+        return False
+
+    def test_base_distance(self):
+        code = PackedDNA.from_sequence_list(['ACGTAC'] * 6).rows[0]
+        other = PackedDNA.from_sequence_list(['TCGTAA'] * 6).rows[0]
+
+        self.assertEqual(base_distance(code, code), 0)
+        self.assertEqual(base_distance(code, other), 2)
+        self.assertEqual(base_distance(0, 0b111111111111), 6)
+
+    def test_human_dna_one_substitution_away(self):
+        sequences = ['ATGCGA', 'CAGTGA'] + ['AAAAAA'] * 4
+        result = minimal_edits(DNA.from_strings(sequences))
+
+        self.assertFalse(result.is_mutant)
+        self.assertEqual(result.distance, 1)
+        self.assertEqual(result.edit_sets, ((Substitution(1, 5, 'C'),),))
+        self.assertFalse(self._flips_within(sequences, 0))
+
+    def test_mutant_dna(self):
+        result = minimal_edits(DNA.from_strings(MUTANT_SEQUENCES), limit=10)
+
+        # 6 matching rows, 5 of them must be broken
+        self.assertTrue(result.is_mutant)
+        self.assertEqual(result.distance, 5)
+        self.assertEqual(len(result.edit_sets), 10)
+        for edit_set in result.edit_sets:
+            dna = self._apply(MUTANT_SEQUENCES, edit_set)
+            self.assertFalse(self.analyser.is_mutant(dna))
+
+    def test_distances_are_minimal(self):
+        """ Tests against a brute force search of the closer DNAs """
+        random = Random(17)
+        lines = sorted(self.analyser.reference.lines)
+
+        for index in range(12):
+            codes = [random.randrange(4096) for _ in range(6)]
+            for row in random.sample(range(6), index % 3):
+                codes[row] = random.choice(lines)
+            # A row one substitution away from a reference line
+            codes[index % 6] = random.choice(lines) ^ (1 << index)
+
+            sequences = PackedDNA.from_pair_codes(codes).to_sequence_list()
+            result = minimal_edits(
+                PackedDNA.from_pair_codes(codes), limit=None
+            )
+
+            self.assertTrue(result.edit_sets)
+            for edit_set in result.edit_sets:
+                self.assertEqual(len(edit_set), result.distance)
+                dna = self._apply(sequences, edit_set)
+                self.assertNotEqual(
+                    self.analyser.is_mutant(dna), result.is_mutant
+                )
+
+            if result.distance <= 2:
+                self.assertFalse(
+                    self._flips_within(sequences, result.distance - 1)
+                )
+
+    def test_threshold(self):
+        dna = DNA.from_strings(MUTANT_SEQUENCES)
+
+        result = minimal_edits(dna, threshold=6)
+        self.assertTrue(result.is_mutant)
+        self.assertEqual(result.distance, 1)
+
+        with self.assertRaises(ValueError):
+            minimal_edits(dna, threshold=7)
@@ -0,0 +1,79 @@
+from django.test import TestCase
+
+from library.genetics import (
+    AminoAcid,
+    CodonPair,
+    DNA,
+    PackedDNA,
+    PackedSequenceError,
+)
+from library.genetics.packed import pair_code_from_string
+from library.genetics.tests.utils import create_dna
+
+
+class PackedDNATests(TestCase):
+    def test_codon_pair_code(self):
+        """ Tests codon pair packing to 12 bits and back """
+        codon_pair = CodonPair(
+            (AminoAcid.A, AminoAcid.C, AminoAcid.G),
+            (AminoAcid.T, AminoAcid.T, AminoAcid.A),
+        )
+
+        # A=00, C=01, G=10, T=11
+        self.assertEqual(codon_pair.code, 0b000110111100)
+
+        unpacked = CodonPair.from_code(codon_pair.code)
+        self.assertTrue(unpacked.is_equal(codon_pair))
+
+    def test_dna_round_trip(self):
+        """ Tests DNA conversion to packed value, bytes and back """
+        dna = create_dna()
+        packed = dna.to_packed()
+
+        self.assertEqual(packed.to_sequence_list(), dna.to_sequence_list())
+        self.assertEqual(len(packed.to_bytes()), 9)
+        self.assertEqual(PackedDNA.from_bytes(packed.to_bytes()), packed)
+
+        unpacked = DNA.from_packed(packed)
+        self.assertEqual(unpacked.to_sequence_list(), dna.to_sequence_list())
+
+    def test_lines_match_dna_pairs(self):
+        """ Tests rows, columns and obliques extracted with bit operations """
+        dna = create_dna()
+        packed = dna.to_packed()
+
+        self.assertEqual(packed.rows, tuple(pair.code for pair in dna))
+        self.assertEqual(
+            packed.columns,
+            tuple(pair.code for pair in dna.vertical_pair_columns)
+        )
+        self.assertEqual(
+            packed.top_left_oblique,
+            dna.top_left_oblique_pair.code
+        )
+        self.assertEqual(
+            packed.bottom_left_oblique,
+            dna.bottom_left_oblique_pair.code
+        )
+
+    def test_invalid_packed_values(self):
+        """ Tests errors on values that do not fit a DNA """
+        with self.assertRaises(PackedSequenceError):
+            PackedDNA(1 << 72)
+
+        with self.assertRaises(PackedSequenceError):
+            PackedDNA.from_bytes(b'\x00' * 8)
+
+        with self.assertRaises(PackedSequenceError):
+            PackedDNA.from_pair_codes([1, 2, 3])
+
+    def test_invalid_sequence(self):
+        """ Tests errors on sequences that are not codon pairs """
+        with self.assertRaisesRegex(PackedSequenceError, "'X'"):
+            pair_code_from_string('ATXCGA')
+
+        with self.assertRaises(PackedSequenceError):
+            pair_code_from_string('ATGC')
+
+        with self.assertRaises(AttributeError):
+            PackedDNA(0).value = 1
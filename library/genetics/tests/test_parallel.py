@@ -0,0 +1,42 @@
+from random import getrandbits
+from django.test import TestCase
+
+from library.genetics import Analyser, DNA, PackedDNA
+from library.genetics.parallel import ParallelAnalyser
+
+
+class ParallelAnalyserTests(TestCase):
+    def _create_packed_dnas(self, analyser: Analyser, count: int):
+        mutant_rows = analyser.mutant_dna.to_packed().rows
+
+        dnas = []
+        for index in range(count):
+            rows = [getrandbits(12) for _ in range(6)]
+            if index % 2:
+                rows[0] = mutant_rows[index % 6]
+                rows[3] = mutant_rows[(index + 1) % 6]
+            dnas.append(PackedDNA.from_pair_codes(rows))
+        return dnas
+
+    def test_verdicts_in_input_order(self):
+        """ Tests verdicts of the pool against Analyser, in order """
+        analyser = Analyser()
+        dnas = self._create_packed_dnas(analyser, 1000)
+        expected = [analyser.is_mutant_packed(dna) for dna in dnas]
+
+        parallel = ParallelAnalyser(workers=2, chunk_size=64)
+        self.assertEqual(list(parallel.analyse(dnas)), expected)
+
+    def test_accepts_dna_objects_and_values(self):
+        """ Tests DNA objects and packed values as input """
+        analyser = Analyser()
+        mutant = analyser.mutant_dna
+        human = DNA.from_packed(PackedDNA(0))
+
+        parallel = ParallelAnalyser(workers=1, chunk_size=2)
+        verdicts = parallel.analyse([mutant, human, mutant.to_packed().value])
+        self.assertEqual(list(verdicts), [True, False, True])
+
+    def test_empty_input(self):
+        parallel = ParallelAnalyser(workers=1)
+        self.assertEqual(list(parallel.analyse([])), [])
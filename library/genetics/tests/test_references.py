@@ -0,0 +1,120 @@
+import os
+import tempfile
+from random import Random
+from django.test import TestCase
+
+from library.genetics import (
+    Analyser,
+    CompiledReference,
+    InvalidSequenceError,
+    PackedDNA,
+)
+from library.genetics.references import ReferenceProfile, ReferenceSet
+
+
+class ReferenceSetTests(TestCase):
+    def _random_packed(self, random: Random) -> PackedDNA:
+        return PackedDNA(random.getrandbits(72))
+
+    def _profiles(self, count: int, random: Random):
+        return [
+            ReferenceProfile(f'family-{i}', self._random_packed(random))
+            for i in range(count)
+        ]
+
+    def test_single_reference_matches_analyser(self):
+        """ Tests a set of the mutant reference against Analyser """
+        random = Random(1)
+        analyser = Analyser()
+        references = ReferenceSet([
+            ReferenceProfile('mutant', analyser.reference.packed)
+        ])
+        mutant_rows = analyser.reference.packed.rows
+
+        for index in range(500):
+            rows = [random.getrandbits(12) for _ in range(6)]
+            for row in range(index % 4):
+                rows[random.randrange(6)] = random.choice(mutant_rows)
+            packed = PackedDNA.from_pair_codes(rows)
+
+            self.assertEqual(
+                references.match_names(packed) == ['mutant'],
+                analyser.is_mutant_packed(packed)
+            )
+
+    def test_many_references_against_each_one(self):
+        """ Tests combined index against one analyser per reference """
+        random = Random(2)
+        profiles = self._profiles(300, random)
+        references = ReferenceSet(profiles)
+        analysers = {
+            profile.name: CompiledReference(profile.packed)
+            for profile in profiles
+        }
+
+        for _ in range(100):
+            # Two rows taken from references, possibly different ones
+            first = random.choice(profiles).packed.rows
+            second = random.choice(profiles).packed.rows
+            rows = [random.getrandbits(12) for _ in range(6)]
+            rows[0] = random.choice(first)
+            rows[3] = random.choice(second)
+            packed = PackedDNA.from_pair_codes(rows)
+
+            expected = [
+                profile.name for profile in profiles
+                if Analyser(analysers[profile.name]).is_mutant_packed(packed)
+            ]
+            self.assertEqual(references.match_names(packed), expected)
+
+    def test_threshold(self):
+        analyser = Analyser()
+        references = ReferenceSet([
+            ReferenceProfile('mutant', analyser.reference.packed)
+        ])
+        packed = analyser.reference.packed
+
+        self.assertEqual(
+            references.match_names(packed, threshold=6),
+            ['mutant']
+        )
+        self.assertEqual(references.match_names(packed, threshold=7), [])
+
+    def test_from_file(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('{"name": "a", "dna": ["ATGCGA", "CAGTGC", "TTATGT",'
+                    ' "AGAAGG", "CCCCTA", "TCACTG"]}\n')
+            f.write('\n')
+            f.write('b AAAAAA CCCCCC GGGGGG TTTTTT AAAAAA CCCCCC\n')
+        self.addCleanup(os.remove, path)
+
+        references = ReferenceSet.from_file(path)
+        self.assertEqual(references.names, ('a', 'b'))
+
+    def test_invalid_references(self):
+        packed = PackedDNA(0)
+
+        with self.assertRaises(InvalidSequenceError):
+            ReferenceSet([
+                ReferenceProfile('a', packed),
+                ReferenceProfile('a', packed),
+            ])
+
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('b AAAAAA CCCCCC\n')
+        self.addCleanup(os.remove, path)
+
+        with self.assertRaises(InvalidSequenceError):
+            ReferenceSet.from_file(path)
+
+    def test_malformed_reference_lines(self):
+        for line in ('{"name": "a", "dna": [', '{"name": "a", "dna": "A"}'):
+            fd, path = tempfile.mkstemp()
+            with os.fdopen(fd, 'w') as f:
+                f.write('\n' + line + '\n')
+            self.addCleanup(os.remove, path)
+
+            with self.assertRaisesRegex(InvalidSequenceError, 'line 2'):
+                ReferenceSet.from_file(path)
@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+from django.test import TestCase
+
+from library.genetics import InvalidSequenceError
+from library.genetics.screener import (
+    main,
+    parse_record,
+    screen,
+    screen_file,
+    validate_sequences,
+)
+
+MUTANT = ["ATGCGA", "CAGTGC", "TTATGT", "AGAAGG", "CCCCTA", "TCACTG"]
+HUMAN = ["TTATTT", "CAGTGC", "TTATTT", "TTATTT", "GCGTCA", "TTATTT"]
+
+
+class ScreenerTests(TestCase):
+    def _write(self, content: str) -> str:
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def _read_results(self, path: str):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_parse_records(self):
+        """ Tests records in every supported format """
+        self.assertEqual(parse_record(json.dumps({'dna': MUTANT})), MUTANT)
+        self.assertEqual(parse_record(json.dumps(MUTANT)), MUTANT)
+        self.assertEqual(parse_record(' '.join(MUTANT)), MUTANT)
+        self.assertEqual(parse_record(','.join(MUTANT), 'text'), MUTANT)
+
+        with self.assertRaises(ValueError):
+            parse_record('{"dna": 1}')
+
+    def test_validation_rules(self):
+        """ Tests same rules as the mutant endpoint """
+        validate_sequences(MUTANT)
+
+        with self.assertRaises(InvalidSequenceError):
+            validate_sequences(MUTANT[:5])
+
+        with self.assertRaises(InvalidSequenceError):
+            validate_sequences(MUTANT[:5] + ['CABTGC'])
+
+        with self.assertRaises(InvalidSequenceError):
+            validate_sequences(MUTANT[:5] + ['CAGTG'])
+
+    def test_screen_verdicts(self):
+        """ Tests verdicts and errors, skipping blank lines """
+        lines = [
+            json.dumps({'dna': MUTANT}).encode(),
+            b'',
+            ' '.join(HUMAN).encode(),
+            b'not a dna',
+        ]
+        results = list(screen(lines))
+
+        self.assertEqual([r.line for r in results], [1, 3, 4])
+        self.assertTrue(results[0].mutant)
+        self.assertFalse(results[1].mutant)
+        self.assertIsNotNone(results[2].error)
+
+    def test_screen_file(self):
+        """ Tests screening a file into an output file """
+        records = [json.dumps({'dna': MUTANT}), json.dumps({'dna': HUMAN})]
+        input_path = self._write('\n'.join(records * 50) + '\n')
+        output_path = self._write('')
+
+        report = screen_file(input_path, output_path)
+
+        self.assertEqual(report.records, 100)
+        self.assertEqual(report.mutants, 50)
+        self.assertEqual(report.humans, 50)
+        self.assertEqual(report.invalid, 0)
+
+        results = self._read_results(output_path)
+        self.assertEqual(results[0], {'line': 1, 'mutant': True})
+        self.assertEqual(results[1], {'line': 2, 'mutant': False})
+
+    def test_empty_file(self):
+        input_path = self._write('')
+        output_path = self._write('')
+
+        self.assertEqual(screen_file(input_path, output_path).records, 0)
+
+    def test_entry_point(self):
+        """ Tests the command line entry point without Django """
+        input_path = self._write(' '.join(MUTANT) + '\n')
+        output_path = self._write('')
+
+        out = StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main([input_path, output_path]), 0)
+
+        self.assertIn(
+            'Screened 1 records (1 mutant, 0 human, 0 invalid)',
+            out.getvalue()
+        )
+        self.assertEqual(
+            self._read_results(output_path),
+            [{'line': 1, 'mutant': True}]
+        )
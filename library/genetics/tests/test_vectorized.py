@@ -0,0 +1,105 @@
+from random import choice
+from unittest import skipUnless
+from django.test import TestCase
+
+from library.genetics import Analyser, DNA
+from library.genetics.tests.utils import create_codon_pair
+from library.genetics.vectorized import BatchShapeError, encode_sequences, np
+
+
+@skipUnless(np is not None, 'NumPy is not installed')
+class VectorizedAnalyserTests(TestCase):
+    def _create_dnas(self, analyser: Analyser):
+        """ Random DNAs plus some with one and two mutant sequences """
+        mutant_pairs = list(analyser.mutant_dna)
+        mutant_pairs += list(analyser.mutant_dna.vertical_pair_columns)
+
+        dnas = []
+        for index in range(300):
+            pairs = [create_codon_pair() for _ in range(6)]
+            if index % 3 > 0:
+                pairs[index % 6] = choice(mutant_pairs)
+            if index % 3 > 1:
+                pairs[(index + 1) % 6] = choice(mutant_pairs)
+
+            dna = DNA()
+            [dna.append(p) for p in pairs]
+            dnas.append(dna)
+        return dnas
+
+    def test_batch_matches_is_mutant(self):
+        """ Tests batch verdicts against Analyser.is_mutant as oracle """
+        analyser = Analyser()
+        dnas = self._create_dnas(analyser)
+
+        expected = [analyser.is_mutant(dna) for dna in dnas]
+        self.assertIn(True, expected)
+        self.assertIn(False, expected)
+
+        bases = encode_sequences([dna.to_sequence_list() for dna in dnas])
+        result = analyser.is_mutant_batch(bases)
+        self.assertEqual(result.verdicts.tolist(), expected)
+
+        # Same verdicts using codon pair codes
+        codes = np.array([dna.to_packed().rows for dna in dnas])
+        result_codes = analyser.is_mutant_batch(codes)
+        self.assertEqual(result_codes.verdicts.tolist(), expected)
+        self.assertEqual(
+            result_codes.counts.tolist(),
+            result.counts.tolist()
+        )
+
+    def test_batch_row_counts(self):
+        """ Tests number of matching rows of the mutant reference itself """
+        analyser = Analyser()
+        bases = encode_sequences([analyser.mutant_dna.to_sequence_list()])
+
+        result = analyser.is_mutant_batch(bases)
+        self.assertEqual(result.counts.tolist(), [6])
+        self.assertEqual(result.verdicts.tolist(), [True])
+
+    def test_batch_shape_errors(self):
+        """ Tests errors on unsupported batches """
+        analyser = Analyser()
+
+        with self.assertRaises(BatchShapeError):
+            analyser.is_mutant_batch(np.zeros((2, 5, 6), dtype=np.uint8))
+
+        with self.assertRaises(BatchShapeError):
+            analyser.is_mutant_batch(np.full((2, 6, 6), 4, dtype=np.uint8))
+
+        with self.assertRaises(BatchShapeError):
+            encode_sequences([['ATGCGA'] * 5 + ['ATGCGB']])
+
+        # Lengths adding up to 36 letters are not enough
+        with self.assertRaises(BatchShapeError):
+            encode_sequences([['ATGCGAA', 'TGCGA'] + ['ATGCGA'] * 4])
+
+        with self.assertRaises(BatchShapeError):
+            encode_sequences([['ATGCGA'] * 5 + ['ATGCGÁ']])
+
+        with self.assertRaises(BatchShapeError):
+            analyser.is_mutant_batch(np.full((2, 6, 6), -1, dtype=np.int64))
+
+        with self.assertRaises(BatchShapeError):
+            analyser.is_mutant_batch(np.zeros((2, 6, 6), dtype=float))
+
+        with self.assertRaises(BatchShapeError):
+            analyser.is_mutant_batch(np.zeros((2, 6), dtype=float))
+
+    def test_batch_of_any_integer_type(self):
+        """ Tests amino acid codes of wider and signed integer types """
+        analyser = Analyser()
+        bases = encode_sequences([analyser.mutant_dna.to_sequence_list()])
+
+        for dtype in (np.int8, np.int64, np.uint32):
+            result = analyser.is_mutant_batch(bases.astype(dtype))
+            self.assertEqual(result.counts.tolist(), [6])
+
+        result = analyser.is_mutant_batch(np.zeros((3, 6, 6), dtype=np.int64))
+        self.assertEqual(result.verdicts.tolist(), [False] * 3)
+
+        # The batch sent is not modified
+        wide = bases.astype(np.uint16)
+        analyser.is_mutant_batch(wide)
+        self.assertEqual(wide.tolist(), bases.tolist())
@@ -0,0 +1,28 @@
+"""
+Helpers shared by the tests of the genetics library.
+"""
+from random import choice
+from typing import Optional
+
+from library.genetics import AminoAcid, CodonPair, DNA
+
+
+def get_random_amino_acid() -> AminoAcid:
+    return choice([v for v in AminoAcid])
+
+
+def create_codon_pair() -> CodonPair:
+    return CodonPair(
+        tuple(get_random_amino_acid() for _ in range(3)),
+        tuple(get_random_amino_acid() for _ in range(3)),
+    )
+
+
+def create_dna(*pairs: Optional[CodonPair]) -> DNA:
+    """ DNA of the codon pairs provided, random ones for the rows left """
+    pairs = list(pairs) + [None] * (6 - len(pairs))
+
+    dna = DNA()
+    for pair in pairs:
+        dna.append(pair or create_codon_pair())
+    return dna
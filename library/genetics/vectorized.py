@@ -0,0 +1,163 @@
+"""
+Vectorized DNA analysis with NumPy, for batches of many DNAs at once.
+
+NumPy is optional: this module can be imported without it, but analysing
+a batch raises an ImportError.
+"""
+from functools import lru_cache
+from typing import FrozenSet, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .packed import (
+    BASE_BITS,
+    BASES,
+    DNA_PAIRS,
+    PAIR_LENGTH,
+    PAIR_VALUES,
+)
+
+
+class BatchShapeError(Exception):
+    """
+    Raises exception when a batch does not have a supported shape or values.
+    """
+    pass
+
+
+class BatchResult(NamedTuple):
+    """
+    Attributes:
+        verdicts    Boolean vector (N,): whether each DNA is mutant.
+        counts      Vector (N,) of how many rows of each DNA match the
+                    reference.
+    """
+    verdicts: 'np.ndarray'
+    counts: 'np.ndarray'
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError('NumPy is required for vectorized DNA analysis.')
+
+
+@lru_cache(maxsize=None)
+def lookup_table(lines: FrozenSet[int]) -> 'np.ndarray':
+    """
+    Builds a boolean table indexed by every possible codon pair code.
+    :param lines: packed reference lines
+    :return: (4096,) boolean array
+    """
+    _require_numpy()
+    table = np.zeros(PAIR_VALUES, dtype=bool)
+    table[list(lines)] = True
+    table.setflags(write=False)
+    return table
+
+
+def _check_integers(values: 'np.ndarray', limit: int, name: str) -> None:
+    """ Checks the values are integers from 0 to limit - 1 """
+    if values.dtype.kind not in 'iu':
+        raise BatchShapeError(
+            f'{name} must be integers. Type sent: {values.dtype}.'
+        )
+
+    if values.size and (values.min() < 0 or values.max() >= limit):
+        raise BatchShapeError(
+            f'{name} must be between 0 and {limit - 1}.'
+        )
+
+
+def encode_rows(bases: 'np.ndarray') -> 'np.ndarray':
+    """
+    Packs a (N, 6, 6) array of amino acid codes (A=0, C=1, G=2, T=3) into a
+    (N, 6) array of codon pair codes.
+    :param bases: amino acid codes
+    :return: codon pair codes
+    """
+    _require_numpy()
+    bases = np.asarray(bases)
+
+    if bases.ndim != 3 or bases.shape[1:] != (DNA_PAIRS, PAIR_LENGTH):
+        raise BatchShapeError(
+            f'Expected a (N, {DNA_PAIRS}, {PAIR_LENGTH}) array of amino'
+            f' acids. Shape sent: {bases.shape}.'
+        )
+
+    _check_integers(bases, len(BASES), 'Amino acid codes')
+
+    # Codes of any integer type are ORed into the uint16 pair codes
+    bases = bases.astype(np.uint16, copy=False)
+    codes = bases[..., 0].copy()
+    for column in range(1, PAIR_LENGTH):
+        codes <<= BASE_BITS
+        codes |= bases[..., column]
+    return codes
+
+
+def encode_sequences(dnas: Sequence[Sequence[str]]) -> 'np.ndarray':
+    """
+    Converts DNAs given as 6 strings of 6 letters into a (N, 6, 6) array of
+    amino acid codes.
+    :param dnas: DNAs as sequence lists
+    :return: amino acid codes
+    """
+    _require_numpy()
+    translation = np.full(256, 255, dtype=np.uint8)
+    for code, letter in enumerate(BASES):
+        translation[ord(letter)] = code
+
+    invalid_values = (
+        f'You must provide correct amino acid values: {", ".join(BASES)}.'
+    )
+
+    for rows in dnas:
+        if len(rows) != DNA_PAIRS or \
+                any(len(row) != PAIR_LENGTH for row in rows):
+            raise BatchShapeError(
+                f'Every DNA must have {DNA_PAIRS} sequences of {PAIR_LENGTH}'
+                f' amino acids.'
+            )
+
+    try:
+        raw = ''.join(''.join(rows) for rows in dnas).encode('ascii')
+    except UnicodeEncodeError:
+        raise BatchShapeError(invalid_values)
+
+    bases = translation[np.frombuffer(raw, dtype=np.uint8)]
+    if bases.size and bases.max() == 255:
+        raise BatchShapeError(invalid_values)
+
+    return bases.reshape(-1, DNA_PAIRS, PAIR_LENGTH)
+
+
+def analyse_batch(batch: 'np.ndarray',
+                  lines: FrozenSet[int],
+                  threshold: int = 2) -> BatchResult:
+    """
+    Analyses many DNAs at once against the reference lines.
+    :param batch: (N, 6, 6) amino acid codes or (N, 6) codon pair codes
+    :param lines: packed reference lines
+    :param threshold: number of matching rows to flag a DNA as mutant
+    :return: verdicts and number of matching rows per DNA
+    """
+    _require_numpy()
+    batch = np.asarray(batch)
+
+    if batch.ndim == 3:
+        codes = encode_rows(batch)
+    elif batch.ndim == 2 and batch.shape[1] == DNA_PAIRS:
+        codes = batch
+        _check_integers(codes, PAIR_VALUES, 'Codon pair codes')
+    else:
+        raise BatchShapeError(
+            f'Expected a (N, {DNA_PAIRS}, {PAIR_LENGTH}) or (N, {DNA_PAIRS})'
+            f' array. Shape sent: {batch.shape}.'
+        )
+
+    matches = lookup_table(lines)[codes]
+    counts = matches.sum(axis=1, dtype=np.uint8)
+    return BatchResult(verdicts=counts >= threshold, counts=counts)
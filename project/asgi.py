@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
+# /mutant/ and /stats/ are served by native async views
+os.environ.setdefault('ROOT_URLCONF', 'project.asgi_urls')
 
 application = get_asgi_application()
@@ -0,0 +1,13 @@
+"""
+URLs served under ASGI: /mutant/ and /stats/ go to their native async
+views, everything else to the same views as under WSGI.
+"""
+from django.urls import path, include
+
+from app.mutant import async_views
+
+urlpatterns = [
+    path('mutant/', async_views.mutant, name='async-mutant'),
+    path('stats/', async_views.stats, name='async-stats'),
+    path('', include('project.urls')),
+]
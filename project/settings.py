@@ -58,7 +58,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'project.urls'
+ROOT_URLCONF = config('ROOT_URLCONF', default='project.urls')
 
 TEMPLATES = [
     {
@@ -140,3 +140,78 @@ CACHEOPS_DEFAULTS = {
 
 FILE_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'cacheops_file_cache')
 STATS_CACHE_KEY = 'mutant_stats'
+
+# Where the statistics are cached: local (memory of the worker), uwsgi (cache
+# shared by the uWSGI workers) or auto. Outdated statistics are still served
+# for STATS_CACHE_STALENESS milliseconds after being read, and no statistics
+# are served after STATS_CACHE_TIMEOUT seconds. Changes made out of the
+# processes sharing the cache (other workers of the local cache, other uWSGI
+# instances, reconcile_stats) are missed until then, unless
+# STATS_CACHE_REVALIDATE is set: the cached statistics are then checked
+# against the database, with a query, once they are that many seconds old.
+STATS_CACHE_BACKEND = config('STATS_CACHE_BACKEND', default='auto')
+STATS_CACHE_STALENESS = config('STATS_CACHE_STALENESS', default=0, cast=int)
+STATS_CACHE_TIMEOUT = config('STATS_CACHE_TIMEOUT', default=60 * 60, cast=int)
+STATS_CACHE_REVALIDATE = config(
+    'STATS_CACHE_REVALIDATE', default=0, cast=float
+)
+
+# Number of DNA verdicts cached per worker. Set to 0 to disable the cache.
+MUTANT_VERDICT_CACHE_SIZE = config(
+    'MUTANT_VERDICT_CACHE_SIZE',
+    default=0,
+    cast=int
+)
+
+# Engine analysing DNAs: object, packed, numpy, bitsliced, or auto to pick
+# the fastest one on startup for batches of GENETICS_ENGINE_BATCH_SIZE DNAs.
+GENETICS_ENGINE = config('GENETICS_ENGINE', default='auto')
+GENETICS_ENGINE_BATCH_SIZE = config(
+    'GENETICS_ENGINE_BATCH_SIZE',
+    default=1,
+    cast=int
+)
+
+# Engine analysing the DNAs of /mutant/batch, picked as GENETICS_ENGINE
+GENETICS_BATCH_ENGINE = config('GENETICS_BATCH_ENGINE', default='auto')
+
+# Maximum number of DNAs sent at once to /mutant/batch
+MUTANT_BATCH_MAX_SIZE = config(
+    'MUTANT_BATCH_MAX_SIZE',
+    default=10000,
+    cast=int
+)
+
+# Records of /mutant/stream/ analysed and logged at once, and maximum size
+# of a record in bytes
+MUTANT_STREAM_BATCH_SIZE = config(
+    'MUTANT_STREAM_BATCH_SIZE',
+    default=1000,
+    cast=int
+)
+MUTANT_STREAM_MAX_LINE_LENGTH = config(
+    'MUTANT_STREAM_MAX_LINE_LENGTH',
+    default=64 * 1024,
+    cast=int
+)
+
+# Threads per worker running the database calls of the async views, served
+# under ASGI. It bounds the database connections of a worker.
+ASYNC_DB_THREADS = config('ASYNC_DB_THREADS', default=8, cast=int)
+
+# Write-behind of the /mutant logs: when MUTANT_LOG_BUFFER_SIZE is set, logs
+# are queued and written in one transaction once that many are queued or the
+# oldest one has waited MUTANT_LOG_BUFFER_DELAY seconds. Requests wait when
+# MUTANT_LOG_BUFFER_MAX_PENDING logs are unwritten, the most a crashed worker
+# can lose.
+MUTANT_LOG_BUFFER_SIZE = config('MUTANT_LOG_BUFFER_SIZE', default=0, cast=int)
+MUTANT_LOG_BUFFER_DELAY = config(
+    'MUTANT_LOG_BUFFER_DELAY',
+    default=1.0,
+    cast=float
+)
+MUTANT_LOG_BUFFER_MAX_PENDING = config(
+    'MUTANT_LOG_BUFFER_MAX_PENDING',
+    default=10000,
+    cast=int
+)